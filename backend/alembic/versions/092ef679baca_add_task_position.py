@@ -0,0 +1,74 @@
+"""add task position
+
+칸반 컬럼 안의 카드 순서를 위한 사전식 rank 컬럼(tasks.position)을 추가한다.
+기존 행은 (project_id, status)별로 지금 보이는 순서(created_at 최신순)를 유지하도록
+고르게 배치한 rank로 채운다.
+
+Revision ID: 092ef679baca
+Revises: 1c60b89b18af
+Create Date: 2026-10-17 13:05:44.918216
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '092ef679baca'
+down_revision: Union[str, None] = '1c60b89b18af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "position",
+            sa.String(length=255, collation="C"),
+            server_default="V",
+            nullable=False,
+        ),
+    )
+
+    # 자리마다 0~9만 쓰는 고정 폭 rank에 'V'를 붙여 끝자리가 0이 되지 않게 한다
+    op.execute(
+        """
+        UPDATE tasks SET position = ranked.position
+        FROM (
+            SELECT id,
+                   lpad(
+                       (row_number() OVER (
+                           PARTITION BY project_id, status
+                           ORDER BY created_at DESC, id DESC
+                       ))::text,
+                       9,
+                       '0'
+                   ) || 'V' AS position
+            FROM tasks
+        ) AS ranked
+        WHERE tasks.id = ranked.id
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_project_id_status_position",
+            "tasks",
+            ["project_id", "status", "position", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_project_id_status_position",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("tasks", "position")
@@ -0,0 +1,73 @@
+"""add task search vectors
+
+tasks(title, description)와 comments(content)에서 계산되는 tsvector STORED
+generated column과 GIN 인덱스를 추가한다. 컬럼 추가 시 PostgreSQL이 기존 행을
+다시 쓰면서 값을 채운다.
+
+Revision ID: 1c60b89b18af
+Revises: 9c9a67b3888f
+Create Date: 2026-10-17 12:20:05.114382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c60b89b18af'
+down_revision: Union[str, None] = '9c9a67b3888f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TASK_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+COMMENT_SEARCH_VECTOR_SQL = "to_tsvector('simple', coalesce(content, ''))"
+
+# (인덱스 이름, 테이블, generated column 식)
+SEARCH_VECTORS = [
+    ("ix_tasks_search_vector", "tasks", TASK_SEARCH_VECTOR_SQL),
+    ("ix_comments_search_vector", "comments", COMMENT_SEARCH_VECTOR_SQL),
+]
+
+
+def upgrade() -> None:
+    for _, table, expression in SEARCH_VECTORS:
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=False,
+            ),
+        )
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in SEARCH_VECTORS:
+            op.create_index(
+                name,
+                table,
+                ["search_vector"],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in SEARCH_VECTORS:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    for _, table, _ in SEARCH_VECTORS:
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,80 @@
+"""add task changes sync
+
+변경분 동기화(/projects/{id}/tasks/changes)를 위해
+- tasks (project_id, updated_at, id) 인덱스
+- 삭제 기록 task_tombstones 테이블과 tasks DELETE 트리거
+를 추가한다. 트리거는 프로젝트가 남아 있는 삭제만 기록하므로 프로젝트 삭제
+CASCADE에서는 아무것도 쓰지 않는다.
+
+Revision ID: 3a8d5c1f7e62
+Revises: e41c6f0a9b73
+Create Date: 2026-10-17 17:35:52.664019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a8d5c1f7e62'
+down_revision: Union[str, None] = 'e41c6f0a9b73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_tombstones",
+        sa.Column("task_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+    op.create_index(
+        "ix_task_tombstones_project_id_deleted_at",
+        "task_tombstones",
+        ["project_id", "deleted_at", "task_id"],
+    )
+    op.create_index("ix_task_tombstones_deleted_at", "task_tombstones", ["deleted_at"])
+
+    op.execute(
+        "CREATE FUNCTION task_tombstones_record() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+        "BEGIN\n"
+        "    INSERT INTO task_tombstones (task_id, project_id)\n"
+        "    SELECT o.id, o.project_id FROM old_rows o\n"
+        "    WHERE EXISTS (SELECT 1 FROM projects p WHERE p.id = o.project_id);\n"
+        "    RETURN NULL;\n"
+        "END\n$$"
+    )
+    op.execute(
+        "CREATE TRIGGER tasks_record_tombstones AFTER DELETE ON tasks "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION task_tombstones_record()"
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_project_id_updated_at",
+            "tasks",
+            ["project_id", "updated_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_project_id_updated_at",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("DROP TRIGGER IF EXISTS tasks_record_tombstones ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS task_tombstones_record()")
+    op.drop_index("ix_task_tombstones_deleted_at", table_name="task_tombstones")
+    op.drop_index("ix_task_tombstones_project_id_deleted_at", table_name="task_tombstones")
+    op.drop_table("task_tombstones")
@@ -0,0 +1,159 @@
+"""add project task stats
+
+프로젝트별 태스크 수를 상태/우선순위별로 유지하는 project_task_stats 테이블과
+이를 갱신하는 트리거를 추가한다.
+
+- projects INSERT: 집계 행 생성 (문장 단위)
+- tasks INSERT/DELETE: 전이 테이블(new_rows/old_rows)을 프로젝트별로 묶어 한 번에
+  증감하므로 일괄 INSERT나 프로젝트 삭제 CASCADE도 문장당 UPDATE 한 번이다.
+- tasks UPDATE: 전이 테이블은 컬럼 목록(UPDATE OF)과 함께 쓸 수 없어 행 단위
+  트리거에 WHEN 조건을 둔다. 제목 수정, 카드 이동처럼 status/priority/project_id가
+  그대로인 UPDATE에서는 트리거가 실행되지 않는다.
+
+트리거를 만드는 동안 tasks에 SHARE ROW EXCLUSIVE 잠금이 커밋까지 유지되므로
+같은 트랜잭션의 backfill과 동시 쓰기가 어긋나지 않는다.
+
+Revision ID: 5d1f7b2e8c40
+Revises: 092ef679baca
+Create Date: 2026-10-17 15:20:41.302118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f7b2e8c40'
+down_revision: Union[str, None] = '092ef679baca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (집계 컬럼, tasks 컬럼, 값)
+COUNT_COLUMNS = [
+    ("todo_count", "status", "todo"),
+    ("in_progress_count", "status", "in_progress"),
+    ("done_count", "status", "done"),
+    ("low_count", "priority", "low"),
+    ("medium_count", "priority", "medium"),
+    ("high_count", "priority", "high"),
+    ("critical_count", "priority", "critical"),
+]
+
+
+def apply_delta_sql(delta: str) -> str:
+    """delta(project_id, status, priority, n) 행들을 프로젝트별로 합쳐 집계 행에 더하는 UPDATE"""
+    sums = ", ".join(
+        f"sum(CASE WHEN {column} = '{value}' THEN n ELSE 0 END) AS {name}"
+        for name, column, value in COUNT_COLUMNS
+    )
+    assignments = ", ".join(f"{name} = s.{name} + d.{name}" for name, _, _ in COUNT_COLUMNS)
+    return (
+        f"UPDATE project_task_stats AS s SET {assignments}, updated_at = now() "
+        f"FROM (SELECT project_id, {sums} FROM ({delta}) AS delta GROUP BY project_id) AS d "
+        "WHERE s.project_id = d.project_id"
+    )
+
+
+def trigger_function(name: str, body: str) -> str:
+    return (
+        f"CREATE FUNCTION {name}() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+        f"BEGIN\n    {body};\n    RETURN NULL;\nEND\n$$"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_task_stats",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        *[
+            sa.Column(name, sa.Integer(), server_default="0", nullable=False)
+            for name, _, _ in COUNT_COLUMNS
+        ],
+        sa.Column(
+            "total_count",
+            sa.Integer(),
+            sa.Computed("todo_count + in_progress_count + done_count", persisted=True),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+
+    op.execute(
+        trigger_function(
+            "project_task_stats_create",
+            "INSERT INTO project_task_stats (project_id) SELECT id FROM new_rows",
+        )
+    )
+    op.execute(
+        "CREATE TRIGGER projects_task_stats_insert AFTER INSERT ON projects "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION project_task_stats_create()"
+    )
+
+    op.execute(
+        trigger_function(
+            "task_stats_insert",
+            apply_delta_sql("SELECT project_id, status, priority, 1 AS n FROM new_rows"),
+        )
+    )
+    op.execute(
+        "CREATE TRIGGER tasks_stats_insert AFTER INSERT ON tasks "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION task_stats_insert()"
+    )
+    op.execute(
+        trigger_function(
+            "task_stats_delete",
+            apply_delta_sql("SELECT project_id, status, priority, -1 AS n FROM old_rows"),
+        )
+    )
+    op.execute(
+        "CREATE TRIGGER tasks_stats_delete AFTER DELETE ON tasks "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION task_stats_delete()"
+    )
+    op.execute(
+        trigger_function(
+            "task_stats_update",
+            apply_delta_sql(
+                "SELECT NEW.project_id, NEW.status, NEW.priority, 1 AS n "
+                "UNION ALL SELECT OLD.project_id, OLD.status, OLD.priority, -1"
+            ),
+        )
+    )
+    op.execute(
+        "CREATE TRIGGER tasks_stats_update AFTER UPDATE ON tasks FOR EACH ROW "
+        "WHEN ((OLD.project_id, OLD.status, OLD.priority) "
+        "IS DISTINCT FROM (NEW.project_id, NEW.status, NEW.priority)) "
+        "EXECUTE FUNCTION task_stats_update()"
+    )
+
+    counts = ", ".join(
+        f"count(t.id) FILTER (WHERE t.{column} = '{value}')" for _, column, value in COUNT_COLUMNS
+    )
+    names = ", ".join(name for name, _, _ in COUNT_COLUMNS)
+    op.execute(
+        f"INSERT INTO project_task_stats (project_id, {names}) "
+        f"SELECT p.id, {counts} FROM projects p "
+        "LEFT JOIN tasks t ON t.project_id = p.id GROUP BY p.id"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS tasks_stats_update ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS tasks_stats_delete ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS tasks_stats_insert ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS projects_task_stats_insert ON projects")
+    for name in (
+        "task_stats_update",
+        "task_stats_delete",
+        "task_stats_insert",
+        "project_task_stats_create",
+    ):
+        op.execute(f"DROP FUNCTION IF EXISTS {name}()")
+    op.drop_table("project_task_stats")
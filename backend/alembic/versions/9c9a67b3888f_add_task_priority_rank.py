@@ -0,0 +1,62 @@
+"""add task priority rank
+
+priority는 native_enum=False 문자열이라 ORDER BY priority가 알파벳순
+('critical' < 'high' < 'low' < 'medium')이 된다. 정렬용 정수 priority_rank를
+priority에서 계산되는 STORED generated column으로 추가한다. 컬럼 추가 시
+PostgreSQL이 기존 행 전체를 다시 써서 값을 채우므로(backfill) 이후 어떤
+쓰기 경로(ORM, 일괄 UPDATE, COPY)에서도 priority와 어긋나지 않는다.
+
+Revision ID: 9c9a67b3888f
+Revises: aa42dce4055d
+Create Date: 2026-10-17 11:02:17.530921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c9a67b3888f'
+down_revision: Union[str, None] = 'aa42dce4055d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PRIORITY_RANK_SQL = (
+    "CASE priority WHEN 'low' THEN 1 WHEN 'medium' THEN 2 "
+    "WHEN 'high' THEN 3 WHEN 'critical' THEN 4 ELSE 0 END"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "priority_rank",
+            sa.SmallInteger(),
+            sa.Computed(PRIORITY_RANK_SQL, persisted=True),
+            nullable=False,
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_project_id_priority_rank",
+            "tasks",
+            ["project_id", "priority_rank", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_project_id_priority_rank",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("tasks", "priority_rank")
@@ -0,0 +1,58 @@
+"""add hot query indexes
+
+Revision ID: aa42dce4055d
+Revises: 6aafea0ccb93
+Create Date: 2026-10-17 10:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'aa42dce4055d'
+down_revision: Union[str, None] = '6aafea0ccb93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스 이름, 테이블, 컬럼) - 서비스 레이어의 WHERE/ORDER BY 형태에 맞춘 복합 인덱스
+# project_members.user_id 조회는 기존 UNIQUE (user_id, project_id) 인덱스가 처리한다.
+INDEXES = [
+    # get_tasks 기본 정렬 + keyset 페이지네이션: project_id = ? ORDER BY created_at, id
+    ("ix_tasks_project_id_created_at", "tasks", ["project_id", "created_at", "id"]),
+    # get_tasks status 필터 / 보드 컬럼: project_id = ? AND status = ? ORDER BY created_at
+    ("ix_tasks_project_id_status_created_at", "tasks", ["project_id", "status", "created_at"]),
+    # assignee 필터, 사용자 삭제 시 SET NULL
+    ("ix_tasks_assignee_id", "tasks", ["assignee_id"]),
+    # get_task_comments: task_id = ? ORDER BY created_at
+    ("ix_comments_task_id_created_at", "comments", ["task_id", "created_at"]),
+    # 프로젝트별 멤버 조회, 프로젝트 삭제 시 CASCADE
+    ("ix_project_members_project_id", "project_members", ["project_id"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행해야 한다
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,74 @@
+"""rewrite task positions
+
+tasks.position을 정수부 + 소수부 rank(app.core.ranking)로 바꾼다. 기존 rank는 맨 앞
+삽입마다 한 자리씩 길어졌지만 새 rank는 정수부를 1씩 줄이므로 로그로만 길어진다.
+(project_id, status)별로 지금 순서(position, id)를 유지한 채 rank_sequence(n)과 같은
+값("a0", "a1", ..., "az", "b00", ...)으로 다시 쓰고, 변경분 동기화로 새 rank가
+전달되도록 updated_at도 갱신한다. 서버 기본값은 새 중간값 "a0".
+
+Revision ID: b04eb9e56931
+Revises: c5f29d8e1a46
+Create Date: 2026-10-17 21:12:36.104528
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b04eb9e56931'
+down_revision: Union[str, None] = 'c5f29d8e1a46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RANK_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+# 정수부 첫 글자별 자릿수 ('a' 1자리 ~ 'd' 4자리, 컬럼당 1,490만 행까지)
+INTEGER_HEADS = "abcd"
+
+
+def integer_rank_sql(k: str) -> str:
+    """0부터 센 순번 k -> 정수부만 있는 rank (rank_sequence(n)의 k번째 값)"""
+    branches = []
+    offset = 0
+    for width, head in enumerate(INTEGER_HEADS, start=1):
+        value = f"({k} - {offset})"
+        digits = " || ".join(
+            f"substr('{RANK_DIGITS}', (({value} / {62 ** i}) % 62)::int + 1, 1)"
+            for i in reversed(range(width))
+        )
+        offset += 62**width
+        branches.append(f"WHEN {k} < {offset} THEN '{head}' || {digits}")
+    return "CASE " + " ".join(branches) + " END"
+
+
+def rewrite_positions(rank_sql: str) -> None:
+    op.execute(
+        f"""
+        UPDATE tasks SET position = ranked.position, updated_at = now()
+        FROM (
+            SELECT id,
+                   {rank_sql} AS position
+            FROM (
+                SELECT id,
+                       row_number() OVER (
+                           PARTITION BY project_id, status
+                           ORDER BY position, id
+                       ) - 1 AS k
+                FROM tasks
+            ) AS numbered
+        ) AS ranked
+        WHERE tasks.id = ranked.id AND tasks.position IS DISTINCT FROM ranked.position
+        """
+    )
+
+
+def upgrade() -> None:
+    op.alter_column("tasks", "position", server_default="a0")
+    rewrite_positions(integer_rank_sql("k"))
+
+
+def downgrade() -> None:
+    op.alter_column("tasks", "position", server_default="V")
+    # 이전 형식: 자리마다 0~9만 쓰는 고정 폭 rank에 'V'를 붙여 끝자리가 0이 되지 않게 한다
+    rewrite_positions("lpad((k + 1)::text, 9, '0') || 'V'")
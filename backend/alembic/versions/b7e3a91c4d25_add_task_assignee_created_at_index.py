@@ -0,0 +1,57 @@
+"""add task assignee created_at index
+
+/me/tasks (assignee_id = ? ORDER BY created_at, id keyset)용 복합 인덱스를 만들고
+이를 앞부분으로 포함하는 ix_tasks_assignee_id를 제거한다. 새 인덱스를 먼저 만든 뒤
+기존 인덱스를 지우므로 중간에 assignee 조회/사용자 삭제(SET NULL)가 인덱스 없이
+실행되는 구간이 없다.
+
+Revision ID: b7e3a91c4d25
+Revises: 5d1f7b2e8c40
+Create Date: 2026-10-17 16:02:13.845120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3a91c4d25'
+down_revision: Union[str, None] = '5d1f7b2e8c40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_assignee_id_created_at",
+            "tasks",
+            ["assignee_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_assignee_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_assignee_id",
+            "tasks",
+            ["assignee_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_assignee_id_created_at",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,63 @@
+"""add project deletions
+
+프로젝트 삭제를 요청 안의 CASCADE 한 번 대신 백그라운드 배치로 처리하기 위해
+- projects.deleted_at (삭제 요청 표시, NULL 허용이라 테이블을 다시 쓰지 않음)
+- project_deletions (진행 상황, 프로젝트 행이 지워진 뒤에도 남음)
+을 추가한다. 삭제 중인 프로젝트의 태스크 정리는 변경분 동기화 대상이 아니므로
+tombstone 트리거가 deleted_at이 있는 프로젝트를 건너뛰도록 바꾼다.
+
+Revision ID: c5f29d8e1a46
+Revises: 3a8d5c1f7e62
+Create Date: 2026-10-17 18:40:07.559813
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f29d8e1a46'
+down_revision: Union[str, None] = '3a8d5c1f7e62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def tombstone_function(project_condition: str) -> str:
+    return (
+        "CREATE OR REPLACE FUNCTION task_tombstones_record() RETURNS trigger "
+        "LANGUAGE plpgsql AS $$\n"
+        "BEGIN\n"
+        "    INSERT INTO task_tombstones (task_id, project_id)\n"
+        "    SELECT o.id, o.project_id FROM old_rows o\n"
+        f"    WHERE EXISTS (SELECT 1 FROM projects p WHERE {project_condition});\n"
+        "    RETURN NULL;\n"
+        "END\n$$"
+    )
+
+
+def upgrade() -> None:
+    op.add_column("projects", sa.Column("deleted_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "project_deletions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("requested_by", sa.Integer(), nullable=True),
+        sa.Column("requested_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("comments_deleted", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("tasks_deleted", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("members_deleted", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["requested_by"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_project_deletions_project_id", "project_deletions", ["project_id"])
+    op.execute(tombstone_function("p.id = o.project_id AND p.deleted_at IS NULL"))
+
+
+def downgrade() -> None:
+    op.execute(tombstone_function("p.id = o.project_id"))
+    op.drop_index("ix_project_deletions_project_id", table_name="project_deletions")
+    op.drop_table("project_deletions")
+    op.drop_column("projects", "deleted_at")
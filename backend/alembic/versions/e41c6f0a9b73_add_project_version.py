@@ -0,0 +1,76 @@
+"""add project version
+
+프로젝트 범위 GET 응답의 ETag에 쓰는 projects.version을 추가한다.
+tasks, comments, project_members가 바뀌면 트리거가 같은 트랜잭션에서 해당
+프로젝트의 version을 1 올린다 (문장 단위 트리거라 일괄 쓰기도 프로젝트당 한 번).
+프로젝트 자체 수정은 update_project가 version을 함께 올린다.
+
+NOT NULL + 상수 DEFAULT 컬럼 추가는 테이블을 다시 쓰지 않는다.
+
+Revision ID: e41c6f0a9b73
+Revises: b7e3a91c4d25
+Create Date: 2026-10-17 16:48:30.117402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41c6f0a9b73'
+down_revision: Union[str, None] = 'b7e3a91c4d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (테이블, 변경된 행들에서 project_id를 구하는 SELECT; {rows}는 전이 테이블)
+VERSIONED_TABLES = [
+    ("tasks", "SELECT project_id FROM {rows}"),
+    ("project_members", "SELECT project_id FROM {rows}"),
+    (
+        "comments",
+        "SELECT t.project_id FROM tasks t WHERE t.id IN (SELECT task_id FROM {rows})",
+    ),
+]
+
+# (트리거 이벤트, 전이 테이블 선언, 참조할 전이 테이블)
+EVENTS = [
+    ("INSERT", "NEW TABLE AS new_rows", ["new_rows"]),
+    ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows", ["old_rows", "new_rows"]),
+    ("DELETE", "OLD TABLE AS old_rows", ["old_rows"]),
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column("version", sa.BigInteger(), server_default="1", nullable=False),
+    )
+
+    for table, project_ids in VERSIONED_TABLES:
+        for event, referencing, rows in EVENTS:
+            name = f"{table}_bump_project_version_{event.lower()}"
+            changed = " UNION ".join(project_ids.format(rows=r) for r in rows)
+            op.execute(
+                f"CREATE FUNCTION {name}() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+                "BEGIN\n"
+                f"    UPDATE projects SET version = version + 1 WHERE id IN ({changed});\n"
+                "    RETURN NULL;\n"
+                "END\n$$"
+            )
+            op.execute(
+                f"CREATE TRIGGER {name} AFTER {event} ON {table} "
+                f"REFERENCING {referencing} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION {name}()"
+            )
+
+
+def downgrade() -> None:
+    for table, _ in reversed(VERSIONED_TABLES):
+        for event, _, _ in reversed(EVENTS):
+            name = f"{table}_bump_project_version_{event.lower()}"
+            op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS {name}()")
+    op.drop_column("projects", "version")
@@ -1,10 +1,14 @@
 from fastapi import APIRouter
 
 from app.api.v1.auth import router as auth_router
+from app.api.v1.dashboard import router as dashboard_router
 from app.api.v1.health import router as health_router
+from app.api.v1.me import router as me_router
 from app.api.v1.projects import router as projects_router
 
 api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(health_router)
 api_router.include_router(auth_router)
 api_router.include_router(projects_router)
+api_router.include_router(dashboard_router)
+api_router.include_router(me_router)
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_current_principal, get_read_db
+from app.schemas.auth import Principal
+from app.schemas.dashboard import DashboardResponse
+from app.services.dashboard import DEFAULT_ASSIGNED_TASK_LIMIT, get_dashboard
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+MAX_ASSIGNED_TASK_LIMIT = 200
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard_endpoint(
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
+    assigned_limit: int = Query(DEFAULT_ASSIGNED_TASK_LIMIT, ge=1, le=MAX_ASSIGNED_TASK_LIMIT),
+):
+    """대시보드 (프로젝트별 상태 집계, 완료율, 나에게 배정된 미완료 태스크)"""
+    return await get_dashboard(db, current_user.id, assigned_limit)
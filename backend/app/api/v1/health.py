@@ -1,13 +1,36 @@
-from fastapi import APIRouter, Depends
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import coalesced_reads
+from app.core.config import settings
+from app.core.database import get_pool_stats
 from app.core.dependencies import get_db
-from app.schemas.health import HealthResponse
+from app.schemas.health import CoalescingStatsResponse, HealthResponse, PoolStatsResponse
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 
+def verify_metrics_token(x_metrics_token: str | None = Header(default=None)) -> None:
+    """
+    상세 헬스체크 접근 확인
+
+    풀 상태와 조회 통계는 내부 정보이므로 HEALTH_METRICS_TOKEN이 설정된 경우에만
+    같은 값을 X-Metrics-Token 헤더로 보낸 요청에 응답한다.
+    """
+    if not settings.HEALTH_METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_metrics_token is None or not secrets.compare_digest(
+        x_metrics_token.encode(), settings.HEALTH_METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="메트릭 토큰이 올바르지 않습니다.",
+        )
+
+
 @router.get("", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """서버 상태 확인"""
@@ -19,3 +42,28 @@ async def health_check_db(db: AsyncSession = Depends(get_db)) -> HealthResponse:
     """데이터베이스 연결 상태 확인"""
     await db.execute(text("SELECT 1"))
     return HealthResponse(status="ok", message="Database connection is healthy")
+
+
+@router.get(
+    "/db/pool",
+    response_model=PoolStatsResponse,
+    dependencies=[Depends(verify_metrics_token)],
+)
+async def health_check_db_pool() -> PoolStatsResponse:
+    """커넥션 풀 상태 및 커넥션 획득 지연 히스토그램"""
+    return PoolStatsResponse.model_validate(get_pool_stats())
+
+
+@router.get(
+    "/db/coalescing",
+    response_model=CoalescingStatsResponse,
+    dependencies=[Depends(verify_metrics_token)],
+)
+async def health_check_db_coalescing() -> CoalescingStatsResponse:
+    """
+    동시 조회 합치기 통계 (워커 시작 이후 누적)
+
+    hits는 진행 중인 조회의 결과를 받은 요청, misses는 직접 조회한 요청,
+    failures는 합류했던 조회가 실패해 직접 다시 조회한 요청 수다.
+    """
+    return CoalescingStatsResponse.model_validate(coalesced_reads.snapshot())
@@ -0,0 +1,61 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_current_principal, get_read_db
+from app.core.responses import rows_response
+from app.models.task import TaskPriority, TaskStatus
+from app.schemas.auth import Principal
+from app.schemas.task import AssignedTaskPage
+from app.services.task import (
+    DEFAULT_TASK_PAGE_SIZE,
+    get_assigned_task_page,
+    resolve_task_fields,
+)
+
+router = APIRouter(prefix="/me", tags=["me"])
+
+MAX_TASK_PAGE_SIZE = 200
+
+
+@router.get("/tasks", response_model=AssignedTaskPage)
+async def list_my_tasks_endpoint(
+    response: Response,
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
+    task_status: TaskStatus | None = Query(None, alias="status"),
+    priority: TaskPriority | None = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    limit: int = Query(DEFAULT_TASK_PAGE_SIZE, ge=1, le=MAX_TASK_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+    view: Literal["full", "card"] = "full",
+):
+    """내가 멤버인 모든 프로젝트에서 나에게 배정된 태스크 (keyset 페이지네이션)
+
+    다음 페이지는 같은 필터/정렬 조건에 next_cursor를 cursor로 넘겨 조회한다.
+    fields(쉼표 구분) 또는 view=card면 해당 필드만 SELECT해서 반환한다.
+    컬럼 행을 바로 직렬화하므로 response_model은 문서용이다.
+    """
+    tasks, projects, next_cursor = await get_assigned_task_page(
+        db,
+        current_user.id,
+        status=task_status,
+        priority=priority,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        limit=limit,
+        cursor=cursor,
+        fields=resolve_task_fields(fields, view),
+    )
+    # JSON 객체 키는 문자열 (AssignedTaskPage 직렬화와 같은 모양)
+    return rows_response(
+        response,
+        {
+            "tasks": tasks,
+            "projects": {str(project_id): name for project_id, name in projects.items()},
+            "next_cursor": next_cursor,
+        },
+    )
@@ -1,44 +1,130 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from collections.abc import Callable
+from typing import Literal
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user, get_db, get_project_member
+from app.core.dependencies import (
+    get_current_principal,
+    get_db,
+    get_project_member,
+    get_read_db,
+    get_session_factory,
+)
+from app.core.responses import rows_response
 from app.models.project import ProjectMember, ProjectRole
-from app.models.task import TaskPriority, TaskStatus
-from app.models.user import User
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.schemas.auth import Principal
 from app.schemas.comment import CommentCreate, CommentResponse
 from app.schemas.project import (
     ProjectCreate,
+    ProjectDeletionResponse,
     ProjectDetailResponse,
+    ProjectListResponse,
     ProjectMemberAdd,
     ProjectMemberResponse,
     ProjectResponse,
     ProjectUpdate,
 )
 from app.schemas.task import (
+    TaskBatchRequest,
+    TaskBatchResponse,
+    TaskBoardResponse,
+    TaskChangesResponse,
     TaskCreate,
+    TaskImportResponse,
+    TaskItem,
+    TaskMove,
     TaskResponse,
+    TaskSearchResult,
     TaskStatusUpdate,
     TaskUpdate,
 )
 from app.services.comment import create_comment, get_task_comments
+from app.services.export import EXPORT_MEDIA_TYPES, export_project_tasks
 from app.services.project import (
     add_project_member,
     create_project,
     get_project_by_id,
+    get_project_version,
     get_user_projects,
     update_project,
 )
+from app.services.project_deletion import (
+    get_project_deletion_status,
+    request_project_deletion,
+    run_project_deletion,
+)
+from app.services.search import DEFAULT_SEARCH_PAGE_SIZE, search_tasks
 from app.services.task import (
+    DEFAULT_BOARD_COLUMN_SIZE,
+    DEFAULT_TASK_CHANGES_SIZE,
+    DEFAULT_TASK_PAGE_SIZE,
+    apply_task_batch,
     create_task,
     delete_task,
+    get_task_board,
     get_task_by_id,
+    get_task_changes,
+    get_task_page,
     get_tasks,
+    move_task,
+    needs_rebalance,
+    rebalance_task_column_in_background,
+    resolve_task_fields,
     update_task,
     update_task_status,
 )
+from app.services.task_import import import_tasks, resolve_import_format
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+MAX_TASK_PAGE_SIZE = 200
+MAX_TASK_CHANGES_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 약한 비교 (W/ 접두사 무시, 여러 값과 * 지원)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _check_project_etag(
+    request: Request,
+    response: Response,
+    project_id: int,
+    version: int | None,
+) -> Response | None:
+    """
+    프로젝트 version 기반 약한 ETag 처리 (멤버십 확인 후, 데이터 조회 전에 호출)
+
+    version은 데이터보다 먼저 get_project_version으로 읽은 값이다. 클라이언트의
+    If-None-Match와 같으면 조회 없이 반환할 304 응답을, 아니면 None을 돌려주고 응답에
+    ETag를 붙인다. 표현은 URL(필터/정렬/커서)별로 구분되므로 version만으로 충분하다.
+    """
+    if version is None:
+        return None
+    etag = f'W/"{project_id}-{version}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
 
 # ─── 프로젝트 엔드포인트 ─────────────────────────────────────
 
@@ -46,7 +132,7 @@ router = APIRouter(prefix="/projects", tags=["projects"])
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project_endpoint(
     data: ProjectCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """프로젝트 생성"""
@@ -54,10 +140,10 @@ async def create_project_endpoint(
     return project
 
 
-@router.get("/", response_model=list[ProjectResponse])
+@router.get("/", response_model=list[ProjectListResponse])
 async def list_projects_endpoint(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """내 프로젝트 목록"""
     return await get_user_projects(db, current_user.id)
@@ -66,10 +152,16 @@ async def list_projects_endpoint(
 @router.get("/{project_id}", response_model=ProjectDetailResponse)
 async def get_project_endpoint(
     project_id: int,
+    request: Request,
+    response: Response,
     member: ProjectMember = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    """프로젝트 상세 (멤버 목록 포함)"""
+    """프로젝트 상세 (멤버 목록 포함, If-None-Match가 현재 version이면 304)"""
+    version = await get_project_version(db, project_id)
+    not_modified = _check_project_etag(request, response, project_id, version)
+    if not_modified is not None:
+        return not_modified
     project = await get_project_by_id(db, project_id)
     return project
 
@@ -87,29 +179,47 @@ async def update_project_endpoint(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="프로젝트 수정 권한이 없습니다.",
         )
-    project = await get_project_by_id(db, project_id)
-    return await update_project(db, project, data)
+    return await update_project(db, project_id, data)
 
 
-@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{project_id}",
+    response_model=ProjectDeletionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def delete_project_endpoint(
     project_id: int,
+    response: Response,
+    background_tasks: BackgroundTasks,
     member: ProjectMember = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    """프로젝트 삭제 (owner만)"""
+    """
+    프로젝트 삭제 (owner만)
+
+    삭제 중으로 표시하고 바로 202를 반환한다. 하위 데이터는 응답 후 배치로 지우며
+    진행 상황은 Location의 삭제 상태 API로 확인한다.
+    """
     if member.role != ProjectRole.owner:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="프로젝트 삭제 권한이 없습니다.",
         )
-    # members를 eager load하지 않고 단순 조회 (CASCADE 충돌 방지)
-    from sqlalchemy import delete as sql_delete
+    deletion = await request_project_deletion(db, project_id, member.user_id)
+    # 표시가 커밋된 뒤(get_db 종료 후) 실행되므로 워커가 작업 행을 볼 수 있다
+    background_tasks.add_task(run_project_deletion, deletion.id)
+    response.headers["Location"] = f"/api/v1/projects/{project_id}/deletion"
+    return await get_project_deletion_status(db, project_id, member.user_id)
 
-    from app.models.project import Project
 
-    await db.execute(sql_delete(Project).where(Project.id == project_id))
-    await db.flush()
+@router.get("/{project_id}/deletion", response_model=ProjectDeletionResponse)
+async def get_project_deletion_endpoint(
+    project_id: int,
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+):
+    """프로젝트 삭제 진행 상황 (삭제를 요청한 사용자만, 완료 후에도 조회 가능)"""
+    return await get_project_deletion_status(db, project_id, current_user.id)
 
 
 @router.post(
@@ -132,9 +242,47 @@ async def add_member_endpoint(
     return await add_project_member(db, project_id, data.user_id, data.role)
 
 
+@router.get("/{project_id}/export", response_class=StreamingResponse)
+async def export_project_endpoint(
+    project_id: int,
+    request: Request,
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    include_comments: bool = False,
+    member: ProjectMember = Depends(get_project_member),
+    session_factory: Callable[[], AsyncSession] = Depends(get_session_factory),
+):
+    """프로젝트 태스크 내보내기 (ndjson/csv 스트리밍, include_comments면 댓글 포함)
+
+    서버 측 커서로 배치씩 읽어 바로 보내므로 프로젝트 크기와 관계없이 메모리가 일정하다.
+    클라이언트 연결이 끊기면 읽기를 멈춘다.
+    """
+    return StreamingResponse(
+        export_project_tasks(
+            session_factory,
+            project_id,
+            export_format,
+            include_comments=include_comments,
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="project-{project_id}-tasks.{export_format}"'
+            )
+        },
+    )
+
+
 # ─── 태스크 엔드포인트 ─────────────────────────────────────
 
 
+def _schedule_rebalance(background_tasks: BackgroundTasks, task: Task) -> Task:
+    """rank가 너무 길어졌으면 응답 후 해당 컬럼을 재배치"""
+    if needs_rebalance(task):
+        background_tasks.add_task(rebalance_task_column_in_background, task.project_id, task.status)
+    return task
+
+
 @router.post(
     "/{project_id}/tasks",
     response_model=TaskResponse,
@@ -143,26 +291,103 @@ async def add_member_endpoint(
 async def create_task_endpoint(
     project_id: int,
     data: TaskCreate,
+    background_tasks: BackgroundTasks,
     member: ProjectMember = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    """태스크 생성"""
-    return await create_task(db, project_id, data)
+    """태스크 생성 (todo 컬럼 맨 앞)"""
+    task = await create_task(db, project_id, data)
+    return _schedule_rebalance(background_tasks, task)
 
 
-@router.get("/{project_id}/tasks", response_model=list[TaskResponse])
-async def list_tasks_endpoint(
+@router.post("/{project_id}/tasks:import", response_model=TaskImportResponse)
+async def import_tasks_endpoint(
     project_id: int,
+    request: Request,
+    import_format: Literal["csv", "ndjson"] | None = Query(None, alias="format"),
+    dry_run: bool = False,
     member: ProjectMember = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
+):
+    """태스크 일괄 가져오기 (CSV 헤더 행 또는 NDJSON, todo 컬럼 맨 뒤에 파일 순서대로)
+
+    format이 없으면 Content-Type(text/csv, application/x-ndjson)으로 판단한다.
+    문제가 있는 행은 건너뛰고 errors에 행 번호와 함께 담는다. dry_run이면 검증만 한다.
+    """
+    import_format = resolve_import_format(import_format, request.headers.get("content-type"))
+    return await import_tasks(db, project_id, request.stream(), import_format, dry_run=dry_run)
+
+
+@router.post("/{project_id}/tasks:batch", response_model=TaskBatchResponse)
+async def batch_tasks_endpoint(
+    project_id: int,
+    data: TaskBatchRequest,
+    background_tasks: BackgroundTasks,
+    member: ProjectMember = Depends(get_project_member),
+    db: AsyncSession = Depends(get_db),
+):
+    """여러 태스크 수정/삭제를 한 트랜잭션으로 (보드 다중 선택 이동, 담당자 일괄 변경 등)
+
+    status를 바꾼 태스크는 요청 순서대로 새 컬럼 맨 앞에 놓인다.
+    결과는 작업마다 updated / deleted / not_found로 요청 순서대로 돌려준다.
+    """
+    result = await apply_task_batch(db, project_id, data)
+    # rank가 길어진 컬럼마다 한 번만 재배치
+    columns = {
+        item.task.status
+        for item in result.results
+        if item.task is not None and needs_rebalance(item.task)
+    }
+    for task_status in columns:
+        background_tasks.add_task(rebalance_task_column_in_background, project_id, task_status)
+    return result
+
+
+@router.get("/{project_id}/tasks", response_model=list[TaskItem])
+async def list_tasks_endpoint(
+    project_id: int,
+    request: Request,
+    response: Response,
+    member: ProjectMember = Depends(get_project_member),
+    db: AsyncSession = Depends(get_read_db),
     task_status: TaskStatus | None = Query(None, alias="status"),
     priority: TaskPriority | None = None,
     assignee_id: int | None = None,
     sort_by: str = "created_at",
     sort_order: str = "desc",
+    limit: int | None = Query(None, ge=1, le=MAX_TASK_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+    view: Literal["full", "card"] = "full",
 ):
-    """태스크 목록 (필터/정렬)"""
-    return await get_tasks(
+    """태스크 목록 (필터/정렬, limit/cursor 지정 시 keyset 페이지네이션)
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환한다.
+    If-None-Match가 현재 프로젝트 version이면 tasks를 조회하지 않고 304를 반환한다.
+    fields(쉼표 구분) 또는 view=card면 해당 필드만 SELECT해서 반환한다.
+    ORM 객체 없이 컬럼 행을 바로 직렬화하므로 response_model은 문서용이다.
+    같은 version을 본 동시 요청의 같은 조회는 쿼리 한 번으로 합쳐진다.
+    """
+    task_fields = resolve_task_fields(fields, view)
+    version = await get_project_version(db, project_id)
+    not_modified = _check_project_etag(request, response, project_id, version)
+    if not_modified is not None:
+        return not_modified
+    if limit is None and cursor is None:
+        tasks = await get_tasks(
+            db,
+            project_id,
+            status=task_status,
+            priority=priority,
+            assignee_id=assignee_id,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            fields=task_fields,
+            version=version,
+        )
+        return rows_response(response, tasks)
+
+    tasks, next_cursor = await get_task_page(
         db,
         project_id,
         status=task_status,
@@ -170,7 +395,101 @@ async def list_tasks_endpoint(
         assignee_id=assignee_id,
         sort_by=sort_by,
         sort_order=sort_order,
+        limit=limit or DEFAULT_TASK_PAGE_SIZE,
+        cursor=cursor,
+        fields=task_fields,
+        version=version,
     )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows_response(response, tasks)
+
+
+@router.get("/{project_id}/tasks/search", response_model=list[TaskSearchResult])
+async def search_tasks_endpoint(
+    project_id: int,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    include_comments: bool = False,
+    member: ProjectMember = Depends(get_project_member),
+    db: AsyncSession = Depends(get_read_db),
+    limit: int = Query(DEFAULT_SEARCH_PAGE_SIZE, ge=1, le=MAX_TASK_PAGE_SIZE),
+    cursor: str | None = None,
+):
+    """태스크 전문 검색 (제목/설명, include_comments면 댓글 포함, 관련도 순)
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환한다.
+    """
+    results, next_cursor = await search_tasks(
+        db,
+        project_id,
+        q,
+        include_comments=include_comments,
+        limit=limit,
+        cursor=cursor,
+    )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return results
+
+
+@router.get("/{project_id}/tasks/changes", response_model=TaskChangesResponse)
+async def task_changes_endpoint(
+    project_id: int,
+    response: Response,
+    member: ProjectMember = Depends(get_project_member),
+    db: AsyncSession = Depends(get_db),
+    since: str | None = None,
+    limit: int = Query(DEFAULT_TASK_CHANGES_SIZE, ge=1, le=MAX_TASK_CHANGES_SIZE),
+):
+    """since 커서 이후 생성/수정/삭제된 태스크 (변경분 동기화)
+
+    응답의 cursor를 다음 요청의 since로 넘긴다. replica 지연이 커서 시각을 앞지를 수
+    있으므로 primary에서 읽는다. 컬럼 행을 바로 직렬화하므로 response_model은 문서용이다.
+    """
+    return rows_response(response, await get_task_changes(db, project_id, since=since, limit=limit))
+
+
+@router.get("/{project_id}/board", response_model=TaskBoardResponse)
+async def get_board_endpoint(
+    project_id: int,
+    request: Request,
+    response: Response,
+    member: ProjectMember = Depends(get_project_member),
+    db: AsyncSession = Depends(get_read_db),
+    priority: TaskPriority | None = None,
+    assignee_id: int | None = None,
+    sort_by: str = "position",
+    sort_order: str = "asc",
+    limit: int = Query(DEFAULT_BOARD_COLUMN_SIZE, ge=1, le=MAX_TASK_PAGE_SIZE),
+    fields: str | None = None,
+    view: Literal["full", "card"] = "full",
+):
+    """칸반 보드 (상태별 컬럼마다 전체 개수 + 앞쪽 limit개, 기본은 카드 위치 순)
+
+    컬럼의 next_cursor가 있으면 태스크 목록 API에 같은 정렬 조건과
+    status, cursor를 넘겨 해당 컬럼을 이어서 조회한다.
+    fields(쉼표 구분) 또는 view=card면 카드에 해당 필드만 담는다.
+    컬럼 행을 바로 직렬화하므로 response_model은 문서용이다.
+    If-None-Match가 현재 프로젝트 version이면 tasks를 조회하지 않고 304를 반환하고,
+    같은 version을 본 동시 요청의 같은 조회는 쿼리 한 번으로 합쳐진다.
+    """
+    version = await get_project_version(db, project_id)
+    not_modified = _check_project_etag(request, response, project_id, version)
+    if not_modified is not None:
+        return not_modified
+    columns = await get_task_board(
+        db,
+        project_id,
+        priority=priority,
+        assignee_id=assignee_id,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        limit=limit,
+        fields=resolve_task_fields(fields, view),
+        version=version,
+    )
+    return rows_response(response, {"columns": columns})
 
 
 @router.get("/{project_id}/tasks/{task_id}", response_model=TaskResponse)
@@ -195,17 +514,13 @@ async def update_task_endpoint(
     project_id: int,
     task_id: int,
     data: TaskUpdate,
+    background_tasks: BackgroundTasks,
     member: ProjectMember = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
     """태스크 수정"""
-    task = await get_task_by_id(db, task_id, project_id)
-    if task is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="태스크를 찾을 수 없습니다.",
-        )
-    return await update_task(db, task, data)
+    task = await update_task(db, project_id, task_id, data)
+    return _schedule_rebalance(background_tasks, task)
 
 
 @router.patch("/{project_id}/tasks/{task_id}/status", response_model=TaskResponse)
@@ -213,17 +528,27 @@ async def update_task_status_endpoint(
     project_id: int,
     task_id: int,
     data: TaskStatusUpdate,
+    background_tasks: BackgroundTasks,
     member: ProjectMember = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    """태스크 상태 변경"""
-    task = await get_task_by_id(db, task_id, project_id)
-    if task is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="태스크를 찾을 수 없습니다.",
-        )
-    return await update_task_status(db, task, data)
+    """태스크 상태 변경 (새 컬럼 맨 앞으로)"""
+    task = await update_task_status(db, project_id, task_id, data)
+    return _schedule_rebalance(background_tasks, task)
+
+
+@router.post("/{project_id}/tasks/{task_id}/move", response_model=TaskResponse)
+async def move_task_endpoint(
+    project_id: int,
+    task_id: int,
+    data: TaskMove,
+    background_tasks: BackgroundTasks,
+    member: ProjectMember = Depends(get_project_member),
+    db: AsyncSession = Depends(get_db),
+):
+    """카드 이동 (after_id와 before_id 사이, status를 주면 해당 컬럼으로)"""
+    task = await move_task(db, project_id, task_id, data)
+    return _schedule_rebalance(background_tasks, task)
 
 
 @router.delete("/{project_id}/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -234,13 +559,7 @@ async def delete_task_endpoint(
     db: AsyncSession = Depends(get_db),
 ):
     """태스크 삭제"""
-    task = await get_task_by_id(db, task_id, project_id)
-    if task is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="태스크를 찾을 수 없습니다.",
-        )
-    await delete_task(db, task)
+    await delete_task(db, project_id, task_id)
 
 
 # ─── 댓글 엔드포인트 ─────────────────────────────────────
@@ -259,13 +578,7 @@ async def create_comment_endpoint(
     db: AsyncSession = Depends(get_db),
 ):
     """댓글 생성"""
-    task = await get_task_by_id(db, task_id, project_id)
-    if task is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="태스크를 찾을 수 없습니다.",
-        )
-    return await create_comment(db, task_id, member.user_id, data)
+    return await create_comment(db, project_id, task_id, member.user_id, data)
 
 
 @router.get(
@@ -275,14 +588,20 @@ async def create_comment_endpoint(
 async def list_comments_endpoint(
     project_id: int,
     task_id: int,
+    request: Request,
+    response: Response,
     member: ProjectMember = Depends(get_project_member),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """댓글 목록"""
+    """댓글 목록 (If-None-Match가 현재 프로젝트 version이면 304, 컬럼 행을 바로 직렬화)"""
+    version = await get_project_version(db, project_id)
+    not_modified = _check_project_etag(request, response, project_id, version)
+    if not_modified is not None:
+        return not_modified
     task = await get_task_by_id(db, task_id, project_id)
     if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="태스크를 찾을 수 없습니다.",
         )
-    return await get_task_comments(db, task_id)
+    return rows_response(response, await get_task_comments(db, task_id))
@@ -0,0 +1,541 @@
+"""
+캐시
+
+- TTLCache: 프로세스 로컬 LRU + TTL (토큰 디코딩, principal, 멤버십처럼 요청마다 읽는 값)
+- SharedCache: 프로젝트/멤버/사용자 조회 결과 캐시. 백엔드는 CACHE_BACKEND로 고른다.
+  memory는 워커별 LRU, redis는 Redis 프로토콜 서버(Redis, Valkey 등)를 워커끼리 공유한다.
+- SingleFlight: 같은 키로 동시에 들어온 조회를 진행 중인 조회 하나로 합친다 (저장하지 않음).
+
+SharedCache 키는 "{CACHE_KEY_PREFIX}:v{CACHE_KEY_VERSION}:{namespace}:{id}" 형식이다.
+값 형식을 바꾸면 CACHE_KEY_VERSION을 올려 이전 배포가 쓴 값을 읽지 않게 한다.
+
+쓰기 경로는 invalidate(db, key)로 지울 키를 세션에 등록하고, 키는 트랜잭션이 커밋된 뒤
+지워진다 (롤백되면 그대로 둔다). 커밋 전까지 그 세션은 해당 키를 캐시에서 읽거나 채우지
+않는다. 지운 키에는 잠시 무효화 표시가 남아, 커밋 전에 시작된 조회가 예전 값을 다시
+채우지 못한다.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any, Generic, TypeVar
+from urllib.parse import unquote, urlsplit
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.schemas.auth import Principal
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """프로세스 로컬 LRU + TTL 캐시 (ttl이 0 이하이면 비활성화)"""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: K) -> V | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """값 저장 (ttl을 주면 기본 TTL보다 짧은 경우에만 적용)"""
+        if not self.enabled:
+            return
+        effective_ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if effective_ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + effective_ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[K], bool]) -> None:
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# (project_id, user_id) -> (member_id, role)
+membership_cache: TTLCache[tuple[int, int], tuple[int, str]] = TTLCache(
+    maxsize=settings.MEMBERSHIP_CACHE_MAX_ENTRIES,
+    ttl=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_project_membership(project_id: int) -> None:
+    """프로젝트 멤버 변경/삭제 시 해당 프로젝트의 멤버십 캐시 제거"""
+    membership_cache.delete_where(lambda key: key[0] == project_id)
+
+
+# access token -> user_id (토큰 만료 시각을 넘지 않도록 TTL 제한)
+token_cache: TTLCache[str, int] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+# user_id -> Principal
+principal_cache: TTLCache[int, Principal] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """사용자 정보 변경/삭제 시 캐시된 principal 제거"""
+    principal_cache.delete(user_id)
+
+
+# ─── 동시 조회 합치기 ─────────────────────────────────────
+
+# 다른 요청의 조회가 실패했음을 기다리던 요청에 알리는 값 (각자 다시 조회)
+_FAILED = object()
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 조회를 하나로 합친다 (single-flight)
+
+    키마다 먼저 온 요청만 loader를 실행하고, 그 조회가 끝나기 전에 같은 키로 온 요청은
+    결과를 함께 받는다. 끝난 결과는 저장하지 않는다. 결과 객체를 여러 요청이 공유하므로
+    호출자는 수정하지 않는다. 먼저 온 요청이 실패하거나 취소되면 기다리던 요청은 오류를
+    넘겨받지 않고 각자 자기 loader로 다시 읽는다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        # hits: 진행 중인 조회의 결과를 받음, misses: 직접 조회,
+        # failures: 합류했던 조회가 실패해 직접 다시 조회
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[V]]) -> V:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            value = await asyncio.shield(inflight)
+            if value is not _FAILED:
+                self.hits += 1
+                return value
+            self.failures += 1
+            return await loader()
+
+        self.misses += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException:
+            future.set_result(_FAILED)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "failures": self.failures,
+            "inflight": len(self._inflight),
+        }
+
+
+# 서비스 계층의 읽기 전용 조회용 (키의 첫 요소는 조회 이름)
+coalesced_reads = SingleFlight()
+
+
+# ─── 공유 캐시 ─────────────────────────────────────
+
+CACHE_KEY_VERSION = 1
+# 무효화 표시 값과 유지 시간. 표시가 있는 동안은 키를 다시 채우지 않는다
+INVALIDATED = b""
+INVALIDATION_HOLD_SECONDS = 2.0
+# 다른 워커가 같은 키를 채우는 동안 기다리는 최대 시간과 확인 간격
+FILL_LOCK_SECONDS = 1.0
+FILL_WAIT_INTERVAL = 0.02
+
+_PENDING_KEYS = "cache_pending_keys"
+_INVALIDATION_TASKS = "cache_invalidation_tasks"
+_PENDING_EVICTIONS = "cache_pending_evictions"
+
+
+class CacheError(Exception):
+    """캐시 서버 오류 (요청은 캐시 없이 계속 처리한다)"""
+
+
+class CacheBackend(ABC):
+    """키/값(bytes) 저장소. 모든 값은 TTL(초)을 가진다"""
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[bytes | None]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """키가 없을 때만 저장 (저장했으면 True)"""
+
+    @abstractmethod
+    async def delete(self, keys: list[str]) -> None: ...
+
+    async def close(self) -> None:
+        return None
+
+
+class MemoryBackend(CacheBackend):
+    """프로세스 로컬 LRU (워커마다 따로 채워진다)"""
+
+    def __init__(self, maxsize: int) -> None:
+        self._data: TTLCache[str, bytes] = TTLCache(maxsize=maxsize, ttl=math.inf)
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return [self._data.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._data.set(key, value, ttl)
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        if self._data.get(key) is not None:
+            return False
+        self._data.set(key, value, ttl)
+        return True
+
+    async def delete(self, keys: list[str]) -> None:
+        for key in keys:
+            self._data.delete(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _RespConnection:
+    """Redis 프로토콜(RESP2) 연결 하나 (요청 하나씩 보내고 응답을 읽는다)"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *args: str | bytes) -> Any:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg.encode() if isinstance(arg, str) else arg
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self.writer.write(b"".join(parts))
+        await self.writer.drain()
+        return await self._read_reply()
+
+    async def _read_reply(self) -> Any:
+        line = await self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("cache server closed the connection")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode()
+        if kind == b"-":
+            raise CacheError(body.decode())
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            return (await self.reader.readexactly(length + 2))[:-2]
+        if kind == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise CacheError(f"unexpected reply: {line[:32]!r}")
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class RedisBackend(CacheBackend):
+    """
+    Redis 프로토콜 서버 백엔드 (redis://[:password@]host:port/db)
+
+    연결은 필요할 때 열고 pool_size개까지 재사용한다. 명령이 timeout 안에 끝나지 않거나
+    연결이 끊기면 그 연결은 버린다.
+    """
+
+    def __init__(self, url: str, pool_size: int = 10, timeout: float = 0.5) -> None:
+        parts = urlsplit(url)
+        if parts.scheme != "redis":
+            raise ValueError(f"unsupported cache url: {url!r}")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.password = unquote(parts.password) if parts.password else None
+        self.username = unquote(parts.username) if parts.username else None
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(pool_size)
+        self._idle: list[_RespConnection] = []
+
+    async def _connect(self) -> _RespConnection:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        connection = _RespConnection(reader, writer)
+        try:
+            if self.password is not None:
+                credentials = [self.username, self.password] if self.username else [self.password]
+                await connection.execute("AUTH", *credentials)
+            if self.db:
+                await connection.execute("SELECT", str(self.db))
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    async def execute(self, *args: str | bytes) -> Any:
+        async with self._slots, asyncio.timeout(self.timeout):
+            connection = self._idle.pop() if self._idle else await self._connect()
+            try:
+                reply = await connection.execute(*args)
+            except CacheError:
+                # 명령 오류 응답은 연결 상태와 무관하다
+                self._idle.append(connection)
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            self._idle.append(connection)
+            return reply
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return await self.execute("MGET", *keys)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.execute("SET", key, value, "PX", str(max(1, int(ttl * 1000))))
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        reply = await self.execute("SET", key, value, "PX", str(max(1, int(ttl * 1000))), "NX")
+        return reply is not None
+
+    async def delete(self, keys: list[str]) -> None:
+        await self.execute("DEL", *keys)
+
+    async def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+
+class SharedCache:
+    """
+    조회 결과 캐시 (값은 JSON으로 저장, 읽은 값은 수정하지 않고 쓴다)
+
+    get_or_load는 같은 키를 동시에 놓친 요청을 한 번의 조회로 모은다. 같은 워커에서는
+    먼저 시작한 조회의 결과를 기다리고, 워커 사이에서는 짧은 채우기 잠금(SET NX)을 잡은
+    워커만 DB를 읽고 나머지는 값이 채워질 때까지 잠시 기다린다. 만료 시각이 겹쳐 한꺼번에
+    놓치지 않도록 TTL은 10% 범위에서 흩어 둔다. 캐시 서버 오류는 캐시 없음과 같이 처리한다.
+    """
+
+    def __init__(self, backend: CacheBackend | None, prefix: str, ttl: float) -> None:
+        self.backend = backend
+        self.prefix = prefix
+        self.ttl = ttl
+        self._flights = SingleFlight()
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None and self.ttl > 0
+
+    def key(self, namespace: str, ident: Any) -> str:
+        return f"{self.prefix}:v{CACHE_KEY_VERSION}:{namespace}:{ident}"
+
+    async def _call(self, operation: Awaitable[V], default: V) -> V:
+        try:
+            return await operation
+        except (CacheError, OSError, TimeoutError) as exc:
+            logger.warning("Cache operation failed: %r", exc)
+            return default
+
+    async def _get_raw(self, keys: list[str]) -> list[bytes | None]:
+        assert self.backend is not None
+        return await self._call(self.backend.get_many(keys), [None] * len(keys))
+
+    def _bypass(self, db: AsyncSession | Session, key: str) -> bool:
+        return not self.enabled or key in db.info.get(_PENDING_KEYS, ())
+
+    async def get_many(self, db: AsyncSession | Session, keys: list[str]) -> list[Any | None]:
+        """캐시된 값 (없거나 무효화 중이면 None)"""
+        if not keys or not self.enabled:
+            return [None] * len(keys)
+        raws = await self._get_raw(keys)
+        return [
+            orjson.loads(raw) if raw and not self._bypass(db, key) else None
+            for key, raw in zip(keys, raws, strict=True)
+        ]
+
+    async def fill(self, db: AsyncSession | Session, key: str, value: Any) -> bool:
+        """
+        키가 비어 있을 때만 저장 (무효화 중이거나 다른 값이 있으면 False)
+
+        replica 세션에서 읽은 값은 복제 지연으로 오래된 값일 수 있으므로 채우지 않는다.
+        """
+        if value is None or self._bypass(db, key) or "replica" in db.info:
+            return False
+        assert self.backend is not None
+        ttl = self.ttl * random.uniform(0.9, 1.0)
+        return await self._call(self.backend.add(key, orjson.dumps(value), ttl), False)
+
+    async def get_or_load(
+        self,
+        db: AsyncSession | Session,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """캐시된 값, 없으면 loader()로 읽어 채운다 (None은 캐시하지 않음)"""
+        if self._bypass(db, key):
+            return await loader()
+        [raw] = await self._get_raw([key])
+        if raw:
+            return orjson.loads(raw)
+        if raw == INVALIDATED:
+            return await loader()
+        return await self._flights.do(key, lambda: self._load(db, key, loader))
+
+    async def _load(
+        self,
+        db: AsyncSession | Session,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        assert self.backend is not None
+        lock = f"{key}:lock"
+        if not await self._call(self.backend.add(lock, b"1", FILL_LOCK_SECONDS), True):
+            # 다른 워커가 채우는 중: 값이 생기거나 잠금이 풀릴 때까지만 기다린다
+            deadline = time.monotonic() + FILL_LOCK_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(FILL_WAIT_INTERVAL)
+                raw, locked = await self._get_raw([key, lock])
+                if raw:
+                    return orjson.loads(raw)
+                if raw == INVALIDATED or locked is None:
+                    break
+            return await loader()
+        try:
+            value = await loader()
+            await self.fill(db, key, value)
+            return value
+        finally:
+            await self._call(self.backend.delete([lock]), None)
+
+    def invalidate(self, db: AsyncSession | Session, *keys: str) -> None:
+        """커밋된 뒤 지울 키 등록 (그때까지 이 세션은 해당 키를 캐시 없이 읽는다)"""
+        if self.enabled and keys:
+            db.info.setdefault(_PENDING_KEYS, set()).update(keys)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        """키를 지우고 INVALIDATION_HOLD_SECONDS 동안 다시 채우지 못하게 표시"""
+        if not self.enabled:
+            return
+        assert self.backend is not None
+        for key in keys:
+            await self._call(self.backend.set(key, INVALIDATED, INVALIDATION_HOLD_SECONDS), None)
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+
+
+def _create_backend() -> CacheBackend | None:
+    if settings.CACHE_BACKEND == "redis":
+        return RedisBackend(
+            settings.CACHE_REDIS_URL,
+            pool_size=settings.CACHE_REDIS_POOL_SIZE,
+            timeout=settings.CACHE_REDIS_TIMEOUT_SECONDS,
+        )
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryBackend(maxsize=settings.CACHE_MAX_ENTRIES)
+    return None
+
+
+shared_cache = SharedCache(
+    _create_backend(),
+    prefix=settings.CACHE_KEY_PREFIX,
+    ttl=settings.CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _delete_after_commit(session: Session) -> None:
+    keys = session.info.pop(_PENDING_KEYS, None)
+    if not keys:
+        return
+    task = asyncio.get_running_loop().create_task(shared_cache.delete(sorted(keys)))
+    session.info.setdefault(_INVALIDATION_TASKS, []).append(task)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    # 커밋되지 않은 변경이므로 캐시된 값은 그대로 유효하다
+    session.info.pop(_PENDING_KEYS, None)
+
+
+def evict_after_commit(session: AsyncSession | Session, evict: Callable[[], None]) -> None:
+    """
+    프로세스 로컬 캐시 항목을 지금 지우고, 트랜잭션이 끝난 뒤 한 번 더 지운다
+
+    쓰기(flush)와 커밋 사이에 다른 요청이 커밋 전 값을 다시 채울 수 있으므로 커밋 뒤에도
+    지운다. 롤백될 때도 지운다 (이 세션이 커밋되지 않은 값을 채웠을 수 있음, 지우는 것은
+    항상 안전하다).
+    """
+    evict()
+    session.info.setdefault(_PENDING_EVICTIONS, []).append(evict)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _evict_after_transaction(session: Session) -> None:
+    for evict in session.info.pop(_PENDING_EVICTIONS, ()):
+        evict()
+
+
+async def wait_for_invalidations(db: AsyncSession) -> None:
+    """커밋 후 예약된 캐시 삭제가 끝날 때까지 대기 (응답 전에 다른 워커도 새 값을 읽도록)"""
+    tasks = db.info.pop(_INVALIDATION_TASKS, None)
+    if tasks:
+        await asyncio.gather(*tasks)
@@ -1,11 +1,229 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import bisect
+import logging
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import Settings, settings
+
+# 커넥션 획득 지연 히스토그램 버킷 상한 (ms)
+ACQUIRE_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class AcquireLatencyHistogram:
+    """커넥션 획득 지연 히스토그램 (버킷별 누적 아님, 마지막 버킷은 +Inf)"""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = ACQUIRE_BUCKETS_MS) -> None:
+        self.buckets_ms = buckets_ms
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        labels = [f"{bound:g}" for bound in self.buckets_ms] + ["+Inf"]
+        return {
+            "count": self.count,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
 
-from app.core.config import settings
+acquire_latency = AcquireLatencyHistogram()
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """checkout 대기 시간을 히스토그램에 기록하는 커넥션 풀"""
+
+    def connect(self):  # type: ignore[override]
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            acquire_latency.observe((time.perf_counter() - start) * 1000)
+
+
+def build_engine_options(config: Settings) -> dict[str, Any]:
+    """Settings로부터 create_async_engine 옵션 구성"""
+    connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+    }
+    if config.DB_PGBOUNCER_MODE:
+        # transaction pooling에서는 서버 커넥션이 바뀌므로 statement 캐시를 쓰지 않고,
+        # 이름 충돌을 피하기 위해 prepared statement 이름을 매번 새로 만든다
+        connect_args.update(
+            {
+                "prepared_statement_cache_size": 0,
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        )
+
+    return {
+        "echo": False,
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+engine = create_async_engine(settings.DATABASE_URL, **build_engine_options(settings))
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def get_pool_stats() -> dict[str, Any]:
+    """커넥션 풀 상태 + 획득 지연 통계"""
+    pool = engine.pool
+    assert isinstance(pool, AsyncAdaptedQueuePool)
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # 아직 pool_size만큼 커넥션을 만들지 않았으면 음수이므로 0으로 보정
+        "overflow": max(0, pool.overflow()),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "acquire": acquire_latency.snapshot(),
+    }
+
+
+# ─── Read replica 라우팅 ─────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.session_factory = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        self.healthy = True
+
+
+class ReplicaRouter:
+    """replica 간 라운드로빈 + 쓰기 직후 primary 고정(read-your-writes)"""
+
+    # 최근 쓰기 기록이 이 개수를 넘으면 만료된 항목을 정리한다
+    MAX_TRACKED_WRITERS = 10_000
+
+    def __init__(self, replicas: list[Replica], read_after_write_seconds: float) -> None:
+        self.replicas = replicas
+        self.read_after_write_seconds = read_after_write_seconds
+        self._sticky_until: dict[int, float] = {}
+        self._cursor = 0
+
+    @classmethod
+    def from_settings(cls, config: Settings) -> "ReplicaRouter":
+        options = build_engine_options(config)
+        replicas = [Replica(create_async_engine(url, **options)) for url in config.replica_urls]
+        return cls(replicas, config.REPLICA_READ_AFTER_WRITE_SECONDS)
+
+    def record_write(self, user_id: int) -> None:
+        now = time.monotonic()
+        self._sticky_until[user_id] = now + self.read_after_write_seconds
+        if len(self._sticky_until) > self.MAX_TRACKED_WRITERS:
+            self._sticky_until = {
+                uid: until for uid, until in self._sticky_until.items() if until > now
+            }
+
+    def is_sticky(self, user_id: int, last_write_at: float | None = None) -> bool:
+        """
+        최근에 쓰기를 한 사용자인지
+
+        이 워커의 기록, 또는 클라이언트가 보낸 마지막 쓰기 시각(epoch 초, 다른 워커가
+        기록했을 수 있음)이 read_after_write_seconds 안이면 True. 워커 사이 시계 차이를
+        감안해 조금 미래의 시각도 받되, 창보다 먼 시각은 무시한다.
+        """
+        if last_write_at is not None and abs(time.time() - last_write_at) < (
+            self.read_after_write_seconds
+        ):
+            return True
+        until = self._sticky_until.get(user_id)
+        return until is not None and until > time.monotonic()
+
+    def choose(
+        self, user_id: int | None = None, last_write_at: float | None = None
+    ) -> Replica | None:
+        """읽기를 보낼 replica (primary를 써야 하면 None)"""
+        if user_id is not None and self.is_sticky(user_id, last_write_at):
+            return None
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        replica = healthy[self._cursor % len(healthy)]
+        self._cursor += 1
+        return replica
+
+    def mark_down(self, replica: Replica) -> None:
+        if replica.healthy:
+            logger.warning("Read replica marked down: %s", replica.engine.url)
+        replica.healthy = False
+
+    async def open_session(
+        self, user_id: int | None = None, last_write_at: float | None = None
+    ) -> AsyncSession | None:
+        """읽기 전용 replica 세션 (연결 실패 시 다음 replica, 모두 실패하면 None)"""
+        while (replica := self.choose(user_id, last_write_at)) is not None:
+            session = replica.session_factory()
+            try:
+                await session.connection(execution_options={"postgresql_readonly": True})
+            except Exception:
+                await session.close()
+                self.mark_down(replica)
+                continue
+            session.info["replica"] = replica
+            return session
+        return None
+
+    async def check_health(self, timeout: float) -> None:
+        for replica in self.replicas:
+            try:
+                async with asyncio.timeout(timeout), replica.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            except Exception:
+                self.mark_down(replica)
+            else:
+                if not replica.healthy:
+                    logger.info("Read replica back up: %s", replica.engine.url)
+                replica.healthy = True
+
+    async def run_health_checks(self, interval: float, timeout: float) -> None:
+        while True:
+            await self.check_health(timeout)
+            await asyncio.sleep(interval)
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+replica_router = ReplicaRouter.from_settings(settings)
+
+
 class Base(DeclarativeBase):
     pass
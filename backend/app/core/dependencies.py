@@ -1,96 +1,243 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import math
+import time
+from collections.abc import AsyncGenerator, Callable
 from typing import TYPE_CHECKING
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
+from sqlalchemy import and_, select
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 if TYPE_CHECKING:
     from app.models.project import ProjectMember
-    from app.models.user import User
 
-from app.core.database import async_session
+from app.core.cache import (
+    membership_cache,
+    principal_cache,
+    shared_cache,
+    token_cache,
+    wait_for_invalidations,
+)
+from app.core.database import async_session, replica_router
 from app.core.security import decode_access_token
+from app.schemas.auth import Principal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+# 마지막 쓰기 시각(epoch 초) 쿠키. 다음 요청이 다른 워커로 가도 primary에서 읽게 한다
+LAST_WRITE_COOKIE = "taskflow_last_write"
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         try:
             yield session
             await session.commit()
+            await wait_for_invalidations(session)
         except Exception:
             await session.rollback()
             raise
 
+    # 쓰기 요청을 커밋한 사용자는 잠시 동안 replica 대신 primary에서 읽는다
+    user_id: int | None = getattr(request.state, "user_id", None)
+    if user_id is not None and request.method not in SAFE_METHODS:
+        replica_router.record_write(user_id)
+        if replica_router.replicas:
+            request.state.last_write_at = time.time()
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-):
-    """JWT 토큰에서 현재 사용자 정보 가져오기"""
-    from app.services.user import get_user_by_id
+
+class LastWriteCookieMiddleware:
+    """
+    쓰기를 커밋한 응답에 마지막 쓰기 시각 쿠키(LAST_WRITE_COOKIE)를 붙인다
+
+    get_db는 응답을 보내기 전에 커밋하고 request.state.last_write_at을 남긴다.
+    get_read_db는 이 쿠키로 워커와 상관없이 REPLICA_READ_AFTER_WRITE_SECONDS 동안
+    primary에서 읽는다. 쿠키를 보내지 않는 클라이언트는 같은 워커 안에서만 보장된다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            last_write_at = scope.get("state", {}).get("last_write_at")
+            if message["type"] == "http.response.start" and last_write_at is not None:
+                max_age = math.ceil(replica_router.read_after_write_seconds)
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{LAST_WRITE_COOKIE}={last_write_at:.3f}; Max-Age={max_age}; "
+                    "Path=/api; HttpOnly; SameSite=lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def _last_write_at(request: Request) -> float | None:
+    try:
+        return float(request.cookies[LAST_WRITE_COOKIE])
+    except (KeyError, ValueError):
+        return None
+
+
+def get_session_factory() -> Callable[[], AsyncSession]:
+    """응답 본문을 스트리밍하는 동안처럼 요청 의존성이 끝난 뒤 DB를 읽을 때 쓰는 세션 팩토리"""
+    return async_session
+
+
+def _credentials_exception(detail: str = "유효하지 않은 인증 정보입니다.") -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _get_token_user_id(token: str) -> int:
+    """JWT 토큰에서 user_id 추출 (디코딩 결과는 토큰 만료 전까지 캐시)"""
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
 
     payload = decode_access_token(token)
     if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 인증 정보입니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception()
     sub: str | None = payload.get("sub")
     if sub is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 인증 정보입니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception()
 
     user_id = int(sub)
-    user = await get_user_by_id(db, user_id)
+    exp = payload.get("exp")
+    token_cache.set(token, user_id, ttl=exp - time.time() if exp is not None else None)
+    return user_id
+
+
+async def get_current_principal(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
+    """현재 사용자 principal (id/email/name만, 캐시 적중 시 DB 조회 없음)"""
+    from app.services.user import get_principal_by_id
+
+    principal = await get_principal_by_id(db, _get_token_user_id(token))
+    if principal is None:
+        raise _credentials_exception("사용자를 찾을 수 없습니다.")
+
+    request.state.user_id = principal.id
+    return principal
+
+
+async def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+):
+    """JWT 토큰에서 현재 사용자 정보 가져오기 (users 행 전체가 필요한 경우)"""
+    from app.services.user import get_user_by_id
+
+    user = await get_user_by_id(db, _get_token_user_id(token))
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="사용자를 찾을 수 없습니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception("사용자를 찾을 수 없습니다.")
 
+    principal_cache.set(user.id, Principal.model_validate(user))
+    request.state.user_id = user.id
     return user
 
 
+async def get_read_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 전용 세션 (replica 라운드로빈, 없거나 최근 쓰기 사용자면 primary 세션)
+
+    최근 쓰기는 이 워커의 기록과 LAST_WRITE_COOKIE(다른 워커가 남겼을 수 있음)로 판단한다.
+    """
+    session = await replica_router.open_session(current_user.id, _last_write_at(request))
+    if session is None:
+        yield db
+        return
+
+    try:
+        yield session
+    except DBAPIError as exc:
+        if exc.connection_invalidated:
+            replica_router.mark_down(session.info["replica"])
+        raise
+    finally:
+        await session.close()
+
+
 async def get_project_member(
     project_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ) -> ProjectMember:
-    """프로젝트 멤버십 검증 의존성"""
-    from app.models.project import Project, ProjectMember
+    """프로젝트 멤버십 검증 의존성
+
+    프로젝트 존재 여부와 멤버십을 한 번의 쿼리로 확인한다. 함께 로드된 Project는
+    세션 identity map에 남으므로 같은 요청의 서비스 호출(db.get)이 재사용한다.
+    삭제 중인 프로젝트(deleted_at)는 없는 프로젝트와 같이 404.
+    멤버십 캐시는 프로젝트가 살아 있음을 확인할 수 있을 때만 쓴다 (project_is_live).
+    """
+    from app.models.project import Project, ProjectMember, ProjectRole
+    from app.services.project import project_cache_key, project_is_live, project_values
+
+    cached = membership_cache.get((project_id, current_user.id))
+    if cached is not None and await project_is_live(db, project_id):
+        member_id, role = cached
+        return ProjectMember(
+            id=member_id,
+            project_id=project_id,
+            user_id=current_user.id,
+            role=ProjectRole(role),
+        )
 
-    # 프로젝트 존재 여부 확인
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-    if project is None:
+    result = await db.execute(
+        select(Project, ProjectMember)
+        .outerjoin(
+            ProjectMember,
+            and_(
+                ProjectMember.project_id == Project.id,
+                ProjectMember.user_id == current_user.id,
+            ),
+        )
+        .where(Project.id == project_id, Project.deleted_at.is_(None))
+        # version은 트리거가 ORM 밖에서 올리므로 세션에 남은 Project도 이 행 값으로 갱신
+        .execution_options(populate_existing=True)
+    )
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="프로젝트를 찾을 수 없습니다.",
         )
 
-    # 멤버십 확인
-    result = await db.execute(
-        select(ProjectMember).where(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == current_user.id,
-        )
-    )
-    member = result.scalar_one_or_none()
+    member = row.ProjectMember
     if member is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="프로젝트에 대한 접근 권한이 없습니다.",
         )
 
+    # identity map은 약한 참조이므로 요청 동안 살아 있는 member에 Project를 붙여 둔다
+    set_committed_value(member, "project", row.Project)
+    if membership_cache.enabled:
+        membership_cache.set((project_id, current_user.id), (member.id, member.role.value))
+        # 캐시 적중 시 삭제 여부는 공유 캐시의 프로젝트 항목으로 확인한다
+        await shared_cache.fill(db, project_cache_key(project_id), project_values(row.Project))
     return member
@@ -0,0 +1,207 @@
+"""
+태스크 위치용 사전식(lexicographic) 분수 rank
+
+rank는 정수부 + 소수부로 된 base62 문자열이며 문자열 비교(COLLATE "C") 순서가 곧
+카드 순서다 (fractional-indexing 방식). 정수부의 첫 글자가 정수부 길이를 나타낸다:
+'a'~'z'는 뒤에 1~26자리, 'A'~'Z'는 26~1자리가 오고 대문자 쪽이 더 작다
+("A00..." < ... < "Zz" < "a0" < "az" < "b00" < ...). 두 rank 사이에는 항상 새 rank를
+만들 수 있으므로 카드 이동 시 해당 행 하나만 수정하면 된다.
+
+맨 앞/맨 뒤 삽입은 정수부를 1씩 줄이거나 늘리므로 rank 길이가 삽입 횟수의 로그에
+비례해 늘어난다 (62번에 한 자리가 아니라 62배마다 한 자리). 소수부는 '0'으로 끝나지
+않는다 (그 앞에 끼울 값이 없어지므로).
+"""
+
+from sqlalchemy import ColumnElement, String, and_, case, func, literal, null
+
+RANK_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+RANK_BASE = len(RANK_DIGITS)
+# 빈 컬럼의 첫 rank (rank_between(None, None))
+RANK_MIDPOINT = "a0"
+# 가장 작은 정수부 (소수부 없이는 rank가 될 수 없고, 앞에는 소수부로만 끼울 수 있다)
+SMALLEST_INTEGER = "A" + "0" * 26
+
+# 이 길이를 넘는 rank가 생기면 해당 컬럼을 재배치한다
+MAX_RANK_LENGTH = 24
+
+
+def _digit(char: str) -> int:
+    return RANK_DIGITS.index(char)
+
+
+def _integer_length(head: str) -> int:
+    """정수부 첫 글자 -> 정수부 전체 길이"""
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    if "A" <= head <= "Z":
+        return ord("Z") - ord(head) + 2
+    raise ValueError(f"rank: invalid head {head!r}")
+
+
+def _split(rank: str) -> tuple[str, str]:
+    """rank -> (정수부, 소수부)"""
+    length = _integer_length(rank[0])
+    if len(rank) < length or rank == SMALLEST_INTEGER:
+        raise ValueError(f"rank: invalid integer part {rank!r}")
+    return rank[:length], rank[length:]
+
+
+def _increment_integer(integer: str) -> str | None:
+    """정수부 + 1 (가장 큰 정수부면 None)"""
+    head, digits = integer[0], list(integer[1:])
+    for i in reversed(range(len(digits))):
+        value = _digit(digits[i]) + 1
+        if value < RANK_BASE:
+            digits[i] = RANK_DIGITS[value]
+            return head + "".join(digits)
+        digits[i] = "0"
+    # 자리올림이 정수부 첫 글자까지 왔으면 길이가 한 자리 다른 정수부로
+    if head == "Z":
+        return "a0"
+    if head == "z":
+        return None
+    head = chr(ord(head) + 1)
+    if head > "a":
+        digits.append("0")
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def _decrement_integer(integer: str) -> str | None:
+    """정수부 - 1 (가장 작은 정수부면 None)"""
+    head, digits = integer[0], list(integer[1:])
+    for i in reversed(range(len(digits))):
+        value = _digit(digits[i]) - 1
+        if value >= 0:
+            digits[i] = RANK_DIGITS[value]
+            return head + "".join(digits)
+        digits[i] = RANK_DIGITS[-1]
+    if head == "a":
+        return "Z" + RANK_DIGITS[-1]
+    if head == "A":
+        return None
+    head = chr(ord(head) - 1)
+    if head < "Z":
+        digits.append(RANK_DIGITS[-1])
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def _midpoint(lower: str, upper: str | None) -> str:
+    """소수부: lower < 결과 < upper 인 가장 짧은 문자열 (upper가 None이면 상한 없음)"""
+    if upper is not None:
+        # 공통 접두사는 그대로 두고 나머지 자리에서 중간값을 찾는다
+        n = 0
+        while n < len(upper) and (lower[n] if n < len(lower) else "0") == upper[n]:
+            n += 1
+        if n > 0:
+            return upper[:n] + _midpoint(lower[n:], upper[n:])
+
+    lower_digit = _digit(lower[0]) if lower else 0
+    upper_digit = _digit(upper[0]) if upper is not None else RANK_BASE
+    if upper_digit - lower_digit > 1:
+        return RANK_DIGITS[(lower_digit + upper_digit) // 2]
+    if upper is not None and len(upper) > 1:
+        return upper[0]
+    return RANK_DIGITS[lower_digit] + _midpoint(lower[1:], None)
+
+
+def rank_between(lower: str | None, upper: str | None) -> str:
+    """두 rank 사이의 rank (None은 각각 맨 앞/맨 뒤)"""
+    if lower is not None and upper is not None and lower >= upper:
+        raise ValueError(f"rank_between: {lower!r} >= {upper!r}")
+    if lower is None and upper is None:
+        return RANK_MIDPOINT
+
+    if lower is None:
+        integer, fraction = _split(upper)
+        if integer == SMALLEST_INTEGER:
+            return integer + _midpoint("", fraction)
+        if fraction:
+            return integer
+        return _decrement_integer(integer)
+
+    integer, fraction = _split(lower)
+    if upper is None:
+        next_integer = _increment_integer(integer)
+        return integer + _midpoint(fraction, None) if next_integer is None else next_integer
+
+    upper_integer, upper_fraction = _split(upper)
+    if integer == upper_integer:
+        return integer + _midpoint(fraction, upper_fraction)
+    next_integer = _increment_integer(integer)
+    if next_integer is not None and next_integer < upper:
+        return next_integer
+    return integer + _midpoint(fraction, None)
+
+
+def rank_sequence(count: int, after: str | None = None, before: str | None = None) -> list[str]:
+    """count개의 rank를 after와 before 사이(None이면 각각 맨 앞/맨 뒤)에 순서대로
+
+    재배치, 일괄 추가, 여러 카드를 한 번에 컬럼 맨 앞으로 옮길 때 사용한다. 한쪽이 열려
+    있으면 정수부를 1씩 늘리거나 줄이고, 양쪽이 막혀 있으면 가운데부터 반씩 나눠 채우므로
+    어느 쪽이든 rank 길이는 개수의 로그에 비례한다.
+    """
+    if count <= 0:
+        return []
+    if count == 1:
+        return [rank_between(after, before)]
+    if before is None:
+        ranks = [rank_between(after, None)]
+        for _ in range(count - 1):
+            ranks.append(rank_between(ranks[-1], None))
+        return ranks
+    if after is None:
+        ranks = [rank_between(None, before)]
+        for _ in range(count - 1):
+            ranks.append(rank_between(None, ranks[-1]))
+        return ranks[::-1]
+    middle = count // 2
+    rank = rank_between(after, before)
+    return (
+        rank_sequence(middle, after, rank)
+        + [rank]
+        + rank_sequence(count - middle - 1, rank, before)
+    )
+
+
+def rank_before_sql(first: ColumnElement[str]) -> ColumnElement[str]:
+    """rank_between(None, first)와 같은 값을 SQL로 계산 (first가 NULL이면 중간값)
+
+    INSERT/UPDATE 한 문장 안에서 컬럼 맨 앞 위치를 정할 때 사용한다. 소수부가 있으면
+    정수부만 남기고, 없으면 정수부를 1 줄인다. 가장 작은 정수부("A" + 0 26자리)까지
+    내려가려면 맨 앞 삽입이 62^26번 필요하므로 그 경우는 다루지 않는다 (NULL이므로
+    NOT NULL 제약에 걸려 잘못된 rank가 저장되지 않는다).
+    """
+    head = func.substr(first, 1, 1, type_=String).collate("C")
+    length = case(
+        (head >= "a", func.ascii(head) - ord("a") + 2),
+        else_=ord("Z") - func.ascii(head) + 2,
+    )
+    integer = func.substr(first, 1, length, type_=String)
+    digits = func.substr(first, 2, length - 1, type_=String)
+    # 끝의 0은 빌림으로 z가 되고 그 앞 자리가 1 줄어든다
+    kept = func.rtrim(digits, "0", type_=String)
+    borrowed = func.length(digits) - func.length(kept)
+    rank_digits = literal(RANK_DIGITS, String)
+    previous_digit = func.substr(
+        rank_digits, func.strpos(rank_digits, func.right(kept, 1)) - 1, 1, type_=String
+    )
+    top = RANK_DIGITS[-1]
+    lower_head = func.chr(func.ascii(head) - 1, type_=String)
+    return case(
+        (first.is_(None), RANK_MIDPOINT),
+        (and_(func.length(first) > length, integer != SMALLEST_INTEGER), integer),
+        (
+            kept != "",
+            func.substr(first, 1, func.length(kept), type_=String)
+            + previous_digit
+            + func.repeat(top, borrowed, type_=String),
+        ),
+        (head == "a", "Z" + top),
+        (head > "a", lower_head + func.repeat(top, func.length(digits) - 1, type_=String)),
+        (head > "A", lower_head + func.repeat(top, func.length(digits) + 1, type_=String)),
+        else_=null(),
+    )
@@ -0,0 +1,22 @@
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+# sub-response에서 옮기지 않는 헤더 (본문에 맞게 새로 계산된다)
+_BODY_HEADERS = frozenset({b"content-length", b"content-type"})
+
+
+def rows_response(response: Response, content: Any) -> ORJSONResponse:
+    """
+    이미 응답 모양인 dict/list를 response_model 검증 없이 바로 JSON 바이트로 직렬화
+
+    Response를 직접 반환하면 FastAPI가 의존성/엔드포인트에서 response에 설정한
+    헤더(ETag, 커서 등)를 붙이지 않으므로 옮겨 담는다. Set-Cookie처럼 같은 이름이
+    여러 번 오는 헤더도 유지하도록 raw 헤더 목록을 그대로 복사한다.
+    """
+    json_response = ORJSONResponse(content)
+    json_response.raw_headers.extend(
+        (key, value) for key, value in response.headers.raw if key not in _BODY_HEADERS
+    )
+    return json_response
@@ -1,11 +1,21 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 import bcrypt
 from jose import JWTError, jwt
 
 from app.core.config import settings
 
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """비밀번호 해싱 풀의 대기열이 가득 찬 경우"""
+
 
 def hash_password(password: str) -> str:
     """비밀번호 해싱 (bcrypt 사용)"""
@@ -22,6 +32,59 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
+# ─── bcrypt 전용 스레드 풀 ─────────────────────────────────────
+# bcrypt는 연산 중 GIL을 해제하므로 스레드 풀만으로 이벤트 루프 블로킹을 피할 수 있다.
+# 실행 중 + 대기 중인 작업 수를 세마포어로 제한하고, 초과 시 즉시 거절한다.
+
+_password_executor: ThreadPoolExecutor | None = None
+_password_slots: threading.BoundedSemaphore | None = None
+
+
+def _get_password_pool() -> tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+    global _password_executor, _password_slots
+    if _password_executor is None or _password_slots is None:
+        workers = max(1, settings.PASSWORD_HASH_WORKERS)
+        _password_executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hash",
+        )
+        _password_slots = threading.BoundedSemaphore(
+            workers + max(0, settings.PASSWORD_HASH_MAX_PENDING)
+        )
+    return _password_executor, _password_slots
+
+
+async def _run_password_job(func: Callable[..., T], *args: Any) -> T:
+    """해싱 작업을 풀에 제출 (슬롯이 없으면 PasswordHasherBusyError)"""
+    executor, slots = _get_password_pool()
+    if not slots.acquire(blocking=False):
+        raise PasswordHasherBusyError
+
+    future: Future[T] = executor.submit(func, *args)
+    # 요청이 취소되어도 스레드 작업이 끝날 때까지 슬롯을 유지한다
+    future.add_done_callback(lambda _: slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (이벤트 루프 밖에서 실행)"""
+    return await _run_password_job(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (이벤트 루프 밖에서 실행)"""
+    return await _run_password_job(verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_executor() -> None:
+    """애플리케이션 종료 시 해싱 풀 정리"""
+    global _password_executor, _password_slots
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+    _password_executor = None
+    _password_slots = None
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + (
@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -5,13 +7,41 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import api_router
+from app.core.cache import shared_cache
 from app.core.config import settings
+from app.core.database import replica_router
+from app.core.dependencies import LastWriteCookieMiddleware
+from app.core.security import shutdown_password_executor
+from app.services.project_deletion import resume_project_deletions
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    health_task: asyncio.Task[None] | None = None
+    if replica_router.replicas:
+        health_task = asyncio.create_task(
+            replica_router.run_health_checks(
+                settings.REPLICA_HEALTH_CHECK_INTERVAL,
+                settings.REPLICA_HEALTH_CHECK_TIMEOUT,
+            )
+        )
+
+    # 이전 프로세스가 끝내지 못한 프로젝트 삭제를 이어서 진행
+    deletion_task = asyncio.create_task(resume_project_deletions())
+
     yield
 
+    deletion_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await deletion_task
+    if health_task is not None:
+        health_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await health_task
+    await replica_router.dispose()
+    await shared_cache.close()
+    shutdown_password_executor()
+
 
 app = FastAPI(
     title="TaskFlow API",
@@ -20,12 +50,14 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(LastWriteCookieMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 app.include_router(api_router)
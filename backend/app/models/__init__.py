@@ -1,17 +1,26 @@
 from app.core.database import Base
 from app.models.comment import Comment
-from app.models.project import Project, ProjectMember, ProjectRole
-from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.project import (
+    Project,
+    ProjectDeletion,
+    ProjectMember,
+    ProjectRole,
+    ProjectTaskStats,
+)
+from app.models.task import Task, TaskPriority, TaskStatus, TaskTombstone
 from app.models.user import User
 
 __all__ = [
     "Base",
     "Comment",
     "Project",
+    "ProjectDeletion",
     "ProjectMember",
     "ProjectRole",
+    "ProjectTaskStats",
     "Task",
     "TaskPriority",
     "TaskStatus",
+    "TaskTombstone",
     "User",
 ]
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Enum, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import BigInteger, Computed, Enum, ForeignKey, Index, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -21,15 +21,52 @@ class Project(Base):
     description: Mapped[str] = mapped_column(String(2000), default="")
     owner_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    # 프로젝트 범위 GET 응답의 ETag용. tasks/comments/project_members가 바뀌면
+    # 트리거가 같은 트랜잭션에서 1 올린다 (프로젝트 수정은 update_project가 올림)
+    version: Mapped[int] = mapped_column(BigInteger, server_default="1")
+    # 삭제 요청 시각. 값이 있으면 목록/멤버십 조회에서 숨기고 백그라운드에서 정리한다
+    deleted_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
     owner = relationship("User", back_populates="projects_owned")
     members = relationship("ProjectMember", back_populates="project", passive_deletes=True)
     tasks = relationship("Task", back_populates="project", passive_deletes=True)
+    # 프로젝트 INSERT 트리거가 함께 만드는 집계 행 (목록 조회 시 contains_eager로 로드)
+    task_stats = relationship("ProjectTaskStats", uselist=False, lazy="raise", viewonly=True)
+
+
+class ProjectTaskStats(Base):
+    """
+    프로젝트별 태스크 수 (상태별/우선순위별)
+
+    tasks 테이블의 트리거가 같은 트랜잭션 안에서 증감하므로 ORM, Core 일괄 쓰기,
+    프로젝트 삭제(CASCADE) 어느 경로로 바뀌어도 어긋나지 않는다.
+    어긋남 점검/복구는 ``python -m scripts.task_stats``.
+    """
+
+    __tablename__ = "project_task_stats"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    todo_count: Mapped[int] = mapped_column(server_default="0")
+    in_progress_count: Mapped[int] = mapped_column(server_default="0")
+    done_count: Mapped[int] = mapped_column(server_default="0")
+    low_count: Mapped[int] = mapped_column(server_default="0")
+    medium_count: Mapped[int] = mapped_column(server_default="0")
+    high_count: Mapped[int] = mapped_column(server_default="0")
+    critical_count: Mapped[int] = mapped_column(server_default="0")
+    total_count: Mapped[int] = mapped_column(
+        Computed("todo_count + in_progress_count + done_count", persisted=True)
+    )
+    updated_at: Mapped[datetime] = mapped_column(server_default=func.now())
 
 
 class ProjectMember(Base):
     __tablename__ = "project_members"
-    __table_args__ = (UniqueConstraint("user_id", "project_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "project_id"),
+        Index("ix_project_members_project_id", "project_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -41,3 +78,25 @@ class ProjectMember(Base):
 
     user = relationship("User", back_populates="project_memberships")
     project = relationship("Project", back_populates="members")
+
+
+class ProjectDeletion(Base):
+    """
+    프로젝트 삭제 작업 (진행 상황 조회용)
+
+    프로젝트 행이 지워진 뒤에도 상태를 보여줄 수 있도록 projects를 참조하지 않는다.
+    """
+
+    __tablename__ = "project_deletions"
+    __table_args__ = (Index("ix_project_deletions_project_id", "project_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_id: Mapped[int]
+    requested_by: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+    requested_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    comments_deleted: Mapped[int] = mapped_column(server_default="0")
+    tasks_deleted: Mapped[int] = mapped_column(server_default="0")
+    members_deleted: Mapped[int] = mapped_column(server_default="0")
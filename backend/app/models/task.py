@@ -1,10 +1,12 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Enum, ForeignKey, String, func
+from sqlalchemy import Computed, Enum, ForeignKey, Index, SmallInteger, String, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ranking import RANK_MIDPOINT
 
 
 class TaskStatus(str, enum.Enum):
@@ -19,9 +21,40 @@ class TaskPriority(str, enum.Enum):
     high = "high"
     critical = "critical"
 
+    @property
+    def rank(self) -> int:
+        """정렬용 우선순위 값 (low=1 ... critical=4)"""
+        return list(TaskPriority).index(self) + 1
+
+
+# priority 문자열에서 계산되는 정렬용 정수 (DB generated column)
+PRIORITY_RANK_SQL = (
+    "CASE priority "
+    + " ".join(f"WHEN '{p.value}' THEN {p.rank}" for p in TaskPriority)
+    + " ELSE 0 END"
+)
+
+# 검색용 tsvector (한국어 형태소 분석기가 없으므로 공백/구두점 기준 'simple' 설정,
+# 검색어는 접두사 일치로 조사가 붙은 단어도 찾는다)
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_project_id_created_at", "project_id", "created_at", "id"),
+        Index("ix_tasks_project_id_status_created_at", "project_id", "status", "created_at"),
+        # 담당자 단독 조회와 내 태스크(/me/tasks) 최신순 keyset을 함께 처리
+        Index("ix_tasks_assignee_id_created_at", "assignee_id", "created_at", "id"),
+        Index("ix_tasks_project_id_priority_rank", "project_id", "priority_rank", "id"),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_tasks_project_id_status_position", "project_id", "status", "position", "id"),
+        # 변경분 동기화: project_id = ? AND (updated_at, id) > cursor
+        Index("ix_tasks_project_id_updated_at", "project_id", "updated_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(300))
@@ -34,6 +67,24 @@ class Task(Base):
         Enum(TaskPriority, native_enum=False),
         default=TaskPriority.medium,
     )
+    # priority 정렬은 알파벳순이 아니라 이 값으로 한다 (API 표현은 priority 문자열 그대로)
+    priority_rank: Mapped[int] = mapped_column(
+        SmallInteger,
+        Computed(PRIORITY_RANK_SQL, persisted=True),
+        nullable=False,
+    )
+    # 컬럼 안에서의 카드 순서 (app.core.ranking의 사전식 rank, 바이트 순서로 비교).
+    # 서비스를 거치지 않고 INSERT한 행은 중간값을 받고 같은 값끼리는 id 순
+    position: Mapped[str] = mapped_column(
+        String(255, collation="C"),
+        server_default=RANK_MIDPOINT,
+    )
+    # 검색 전용 (일반 조회에서는 로드하지 않음)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
     assignee_id: Mapped[int | None] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"),
@@ -48,3 +99,22 @@ class Task(Base):
     project = relationship("Project", back_populates="tasks")
     assignee = relationship("User", back_populates="assigned_tasks")
     comments = relationship("Comment", back_populates="task", passive_deletes=True)
+
+
+class TaskTombstone(Base):
+    """
+    삭제된 태스크 기록 (변경분 동기화용)
+
+    tasks DELETE 트리거가 같은 트랜잭션에서 남긴다. 프로젝트 삭제 CASCADE로 지워진
+    태스크는 남기지 않는다 (프로젝트 자체가 404가 되므로 클라이언트가 통째로 버린다).
+    """
+
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_project_id_deleted_at", "project_id", "deleted_at", "task_id"),
+        Index("ix_task_tombstones_deleted_at", "deleted_at"),
+    )
+
+    task_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
+    deleted_at: Mapped[datetime] = mapped_column(server_default=func.now())
@@ -1,8 +1,9 @@
-from app.schemas.auth import LoginResponse, Token, TokenData
+from app.schemas.auth import LoginResponse, Principal, Token, TokenData
 from app.schemas.user import UserLogin, UserRegister, UserResponse
 
 __all__ = [
     "LoginResponse",
+    "Principal",
     "Token",
     "TokenData",
     "UserLogin",
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.schemas.user import UserResponse
 
@@ -12,6 +12,16 @@ class TokenData(BaseModel):
     user_id: int | None = None
 
 
+class Principal(BaseModel):
+    """인증된 사용자의 최소 정보 (users 테이블 전체를 읽지 않는 경로용)"""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    email: str
+    name: str
+
+
 class LoginResponse(BaseModel):
     user: UserResponse
     token: Token
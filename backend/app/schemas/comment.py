@@ -15,3 +15,7 @@ class CommentResponse(BaseModel):
     task_id: int
     author_id: int
     created_at: datetime
+
+
+# 목록 조회에서 SELECT하는 컬럼 (응답 필드와 같은 순서)
+COMMENT_FIELDS = tuple(CommentResponse.model_fields)
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+from app.schemas.project import ProjectResponse
+from app.schemas.task import TaskResponse
+
+
+class DashboardProjectStats(ProjectResponse):
+    todo_count: int
+    in_progress_count: int
+    done_count: int
+    total_count: int
+    completion_ratio: float
+    assigned_open_count: int
+
+
+class DashboardAssignedTask(TaskResponse):
+    project_name: str
+
+
+class DashboardTotals(BaseModel):
+    project_count: int
+    todo_count: int
+    in_progress_count: int
+    done_count: int
+    total_count: int
+    assigned_open_count: int
+
+
+class DashboardResponse(BaseModel):
+    totals: DashboardTotals
+    projects: list[DashboardProjectStats]
+    assigned_tasks: list[DashboardAssignedTask]
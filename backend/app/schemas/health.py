@@ -4,3 +4,26 @@ from pydantic import BaseModel
 class HealthResponse(BaseModel):
     status: str
     message: str
+
+
+class AcquireLatencyStats(BaseModel):
+    count: int
+    avg_ms: float
+    max_ms: float
+    buckets: dict[str, int]
+
+
+class PoolStatsResponse(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    acquire: AcquireLatencyStats
+
+
+class CoalescingStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    failures: int
+    inflight: int
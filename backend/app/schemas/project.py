@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict
 
@@ -25,6 +26,23 @@ class ProjectResponse(BaseModel):
     created_at: datetime
 
 
+class ProjectTaskCounts(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    todo_count: int
+    in_progress_count: int
+    done_count: int
+    low_count: int
+    medium_count: int
+    high_count: int
+    critical_count: int
+    total_count: int
+
+
+class ProjectListResponse(ProjectResponse):
+    task_stats: ProjectTaskCounts | None = None
+
+
 class ProjectMemberResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -41,3 +59,16 @@ class ProjectDetailResponse(ProjectResponse):
 class ProjectMemberAdd(BaseModel):
     user_id: int
     role: ProjectRole = ProjectRole.member
+
+
+class ProjectDeletionResponse(BaseModel):
+    id: int
+    project_id: int
+    status: Literal["in_progress", "completed"]
+    requested_at: datetime
+    finished_at: datetime | None
+    comments_deleted: int
+    tasks_deleted: int
+    members_deleted: int
+    # 아직 지워지지 않은 태스크 수 (project_task_stats 기준)
+    tasks_remaining: int
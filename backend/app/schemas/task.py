@@ -1,13 +1,15 @@
 from datetime import datetime
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.models.task import TaskPriority, TaskStatus
 
 
 class TaskCreate(BaseModel):
-    title: str
-    description: str = ""
+    # 길이 제한은 tasks 컬럼 크기와 같다
+    title: str = Field(max_length=300)
+    description: str = Field("", max_length=5000)
     priority: TaskPriority = TaskPriority.medium
     assignee_id: int | None = None
 
@@ -24,6 +26,14 @@ class TaskStatusUpdate(BaseModel):
     status: TaskStatus
 
 
+class TaskMove(BaseModel):
+    # 옮길 컬럼 (생략하면 현재 컬럼 안에서 이동)
+    status: TaskStatus | None = None
+    # 이동 후 바로 위/아래에 올 카드 (둘 다 생략하면 컬럼 맨 앞)
+    after_id: int | None = None
+    before_id: int | None = None
+
+
 class TaskResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -34,5 +44,125 @@ class TaskResponse(BaseModel):
     priority: TaskPriority
     project_id: int
     assignee_id: int | None
+    position: str
     created_at: datetime
     updated_at: datetime
+
+
+# fields= 로 고를 수 있는 필드
+TASK_FIELDS = tuple(TaskResponse.model_fields)
+# view=card: 보드 카드에 표시하는 필드만 (description 등 제외)
+TASK_CARD_FIELDS = ("id", "title", "status", "priority", "assignee_id", "position")
+
+# 목록 응답의 태스크 항목. fields=/view=card로 일부 필드만 요청하면 그 필드만 담은 dict
+TaskItem = TaskResponse | dict[str, Any]
+
+
+class TaskSearchResult(TaskResponse):
+    rank: float
+    # HTML 이스케이프한 텍스트에서 일치한 단어만 <mark>...</mark>로 감싼 값
+    title_highlight: str
+    description_highlight: str
+
+
+class TaskBoardColumn(BaseModel):
+    status: TaskStatus
+    count: int
+    tasks: list[TaskItem]
+    # 같은 정렬 조건과 status로 태스크 목록 API를 호출할 때 쓰는 커서
+    next_cursor: str | None = None
+
+
+class TaskBoardResponse(BaseModel):
+    columns: list[TaskBoardColumn]
+
+
+class TaskTombstoneResponse(BaseModel):
+    id: int
+    deleted_at: datetime
+
+
+class TaskChangesResponse(BaseModel):
+    # 커서 이후 생성/수정된 태스크 (updated_at, id 순)
+    tasks: list[TaskResponse]
+    # 커서 이후 삭제된 태스크
+    deleted: list[TaskTombstoneResponse]
+    # 다음 요청의 since
+    cursor: str
+    # true면 바로 이어서 다시 요청 (limit에 걸림)
+    has_more: bool
+
+
+class AssignedTaskPage(BaseModel):
+    tasks: list[TaskItem]
+    # 페이지에 나온 태스크들의 {project_id: 프로젝트 이름}
+    projects: dict[int, str]
+    next_cursor: str | None
+
+
+class TaskImportError(BaseModel):
+    # 데이터 행 번호 (1부터, CSV 헤더 행과 빈 줄 제외)
+    row: int
+    # 문제가 된 필드 (행 형식 오류면 None)
+    field: str | None
+    message: str
+
+
+class TaskImportResponse(BaseModel):
+    imported: int
+    failed: int
+    # 앞쪽 행부터 최대 MAX_IMPORT_ERRORS개
+    errors: list[TaskImportError]
+    dry_run: bool
+
+
+class TaskBatchUpdate(TaskUpdate):
+    op: Literal["update"]
+    id: int
+
+    # 빈 값으로 둘 수 없는 컬럼 (명시적 null은 422, 생략하면 그대로 유지)
+    @field_validator("title", "description", "status", "priority")
+    @classmethod
+    def check_not_null(cls, value: Any) -> Any:
+        if value is None:
+            raise ValueError("null로 바꿀 수 없습니다.")
+        return value
+
+    @model_validator(mode="after")
+    def check_fields(self) -> "TaskBatchUpdate":
+        if not self.model_fields_set - {"op", "id"}:
+            raise ValueError("바꿀 필드가 없습니다.")
+        return self
+
+
+class TaskBatchDelete(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+TaskBatchOperation = Annotated[TaskBatchUpdate | TaskBatchDelete, Field(discriminator="op")]
+
+
+class TaskBatchRequest(BaseModel):
+    # 요청 순서대로 적용 (최대 TASK_BATCH_MAX_OPERATIONS개, 한 태스크는 한 번만)
+    operations: list[TaskBatchOperation] = Field(min_length=1)
+
+    @model_validator(mode="after")
+    def check_unique_ids(self) -> "TaskBatchRequest":
+        ids = [operation.id for operation in self.operations]
+        if len(set(ids)) != len(ids):
+            raise ValueError("같은 태스크에 대한 작업이 여러 번 있습니다.")
+        return self
+
+
+class TaskBatchResult(BaseModel):
+    id: int
+    op: Literal["update", "delete"]
+    outcome: Literal["updated", "deleted", "not_found"]
+    # outcome이 updated일 때 수정된 태스크
+    task: TaskResponse | None = None
+
+
+class TaskBatchResponse(BaseModel):
+    # 요청의 operations와 같은 순서
+    results: list[TaskBatchResult]
@@ -1,34 +1,49 @@
-from sqlalchemy import select
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.comment import Comment
-from app.schemas.comment import CommentCreate
+from app.models.task import Task
+from app.schemas.comment import COMMENT_FIELDS, CommentCreate
 
 
 async def create_comment(
     db: AsyncSession,
+    project_id: int,
     task_id: int,
     author_id: int,
     data: CommentCreate,
 ) -> Comment:
-    """댓글 생성"""
-    comment = Comment(
-        content=data.content,
-        task_id=task_id,
-        author_id=author_id,
+    """댓글 생성 (태스크가 프로젝트에 속할 때만 INSERT ... SELECT ... RETURNING)"""
+    task_in_project = select(
+        literal(data.content),
+        Task.id,
+        literal(author_id),
+    ).where(Task.id == task_id, Task.project_id == project_id)
+    result = await db.scalars(
+        insert(Comment)
+        .from_select(["content", "task_id", "author_id"], task_in_project)
+        .returning(Comment)
     )
-    db.add(comment)
-    await db.flush()
-    await db.refresh(comment)
+    comment = result.one_or_none()
+    if comment is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="태스크를 찾을 수 없습니다.",
+        )
     return comment
 
 
 async def get_task_comments(
     db: AsyncSession,
     task_id: int,
-) -> list[Comment]:
-    """댓글 목록 (created_at ASC)"""
+) -> list[dict[str, Any]]:
+    """댓글 목록 (created_at ASC, ORM 객체 없이 응답 컬럼만 dict로)"""
     result = await db.execute(
-        select(Comment).where(Comment.task_id == task_id).order_by(Comment.created_at.asc())
+        select(*[getattr(Comment, name) for name in COMMENT_FIELDS])
+        .where(Comment.task_id == task_id)
+        .order_by(Comment.created_at.asc())
     )
-    return list(result.scalars().all())
+    return [dict(zip(COMMENT_FIELDS, row, strict=True)) for row in result]
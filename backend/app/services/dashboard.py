@@ -0,0 +1,114 @@
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project, ProjectMember, ProjectTaskStats
+from app.models.task import Task, TaskStatus
+from app.schemas.dashboard import (
+    DashboardAssignedTask,
+    DashboardProjectStats,
+    DashboardResponse,
+    DashboardTotals,
+)
+from app.schemas.project import ProjectResponse
+from app.schemas.task import TaskResponse
+
+DEFAULT_ASSIGNED_TASK_LIMIT = 50
+
+
+async def get_project_stats(
+    db: AsyncSession,
+    user_id: int,
+) -> list[DashboardProjectStats]:
+    """
+    내 프로젝트별 상태 집계 (쿼리 한 번)
+
+    상태별 수는 트리거가 유지하는 project_task_stats 한 행을 읽으므로 프로젝트의
+    태스크 수와 무관하다. 내 미완료 수만 assignee 인덱스로 내 태스크를 센다.
+    """
+    assigned_open = (
+        select(Task.project_id, func.count().label("assigned_open_count"))
+        .where(Task.assignee_id == user_id, Task.status != TaskStatus.done)
+        .group_by(Task.project_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            Project,
+            func.coalesce(ProjectTaskStats.todo_count, 0),
+            func.coalesce(ProjectTaskStats.in_progress_count, 0),
+            func.coalesce(ProjectTaskStats.done_count, 0),
+            func.coalesce(ProjectTaskStats.total_count, 0),
+            func.coalesce(assigned_open.c.assigned_open_count, 0),
+        )
+        .join(
+            ProjectMember,
+            and_(ProjectMember.project_id == Project.id, ProjectMember.user_id == user_id),
+        )
+        .outerjoin(ProjectTaskStats, ProjectTaskStats.project_id == Project.id)
+        .outerjoin(assigned_open, assigned_open.c.project_id == Project.id)
+        .where(Project.deleted_at.is_(None))
+        .order_by(Project.created_at.desc(), Project.id.desc())
+    )
+
+    stats = []
+    for project, todo, in_progress, done, total, assigned_open_count in result.all():
+        stats.append(
+            DashboardProjectStats(
+                **ProjectResponse.model_validate(project).model_dump(),
+                todo_count=todo,
+                in_progress_count=in_progress,
+                done_count=done,
+                total_count=total,
+                completion_ratio=done / total if total else 0.0,
+                assigned_open_count=assigned_open_count,
+            )
+        )
+    return stats
+
+
+async def get_assigned_open_tasks(
+    db: AsyncSession,
+    user_id: int,
+    limit: int = DEFAULT_ASSIGNED_TASK_LIMIT,
+) -> list[DashboardAssignedTask]:
+    """내가 멤버인 프로젝트에서 나에게 배정된 미완료 태스크 (우선순위 높은 순)"""
+    result = await db.execute(
+        select(Task, Project.name)
+        .join(Project, Project.id == Task.project_id)
+        .join(
+            ProjectMember,
+            and_(ProjectMember.project_id == Task.project_id, ProjectMember.user_id == user_id),
+        )
+        .where(
+            Task.assignee_id == user_id,
+            Task.status != TaskStatus.done,
+            Project.deleted_at.is_(None),
+        )
+        .order_by(Task.priority_rank.desc(), Task.created_at.desc(), Task.id.desc())
+        .limit(limit)
+    )
+    return [
+        DashboardAssignedTask(
+            **TaskResponse.model_validate(task).model_dump(), project_name=project_name
+        )
+        for task, project_name in result.all()
+    ]
+
+
+async def get_dashboard(
+    db: AsyncSession,
+    user_id: int,
+    assigned_limit: int = DEFAULT_ASSIGNED_TASK_LIMIT,
+) -> DashboardResponse:
+    """대시보드 (프로젝트별 집계 + 내 미완료 태스크, 쿼리 2개)"""
+    projects = await get_project_stats(db, user_id)
+    assigned_tasks = await get_assigned_open_tasks(db, user_id, assigned_limit)
+    totals = DashboardTotals(
+        project_count=len(projects),
+        todo_count=sum(p.todo_count for p in projects),
+        in_progress_count=sum(p.in_progress_count for p in projects),
+        done_count=sum(p.done_count for p in projects),
+        total_count=sum(p.total_count for p in projects),
+        assigned_open_count=sum(p.assigned_open_count for p in projects),
+    )
+    return DashboardResponse(totals=totals, projects=projects, assigned_tasks=assigned_tasks)
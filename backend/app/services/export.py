@@ -0,0 +1,136 @@
+"""
+프로젝트 태스크 내보내기 (NDJSON / CSV 스트리밍)
+
+서버 측 커서(AsyncSession.stream)로 batch_size행씩 읽어 바로 응답 바이트로 내보내므로
+프로젝트 크기와 관계없이 메모리 사용량이 일정하다. 응답 본문을 보내는 동안 실행되므로
+요청 의존성(get_db)의 세션이 아닌 별도 세션을 열고, 배치마다 클라이언트 연결을 확인해
+끊겼으면 커서를 닫고 멈춘다.
+"""
+
+import csv
+import enum
+import io
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any
+
+import orjson
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.comment import Comment
+from app.models.task import Task
+from app.schemas.comment import COMMENT_FIELDS
+from app.schemas.task import TASK_FIELDS
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+EXPORT_BATCH_SIZE = 500
+
+# 스프레드시트가 수식으로 해석하는 첫 글자 (CSV 셀 앞에 '를 붙여 텍스트로 둔다)
+_CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _export_query(project_id: int, include_comments: bool) -> Select[Any]:
+    """태스크 id 순 (include_comments면 댓글을 LEFT JOIN해 태스크별로 이어지게 정렬)"""
+    query = select(*[getattr(Task, name) for name in TASK_FIELDS]).where(
+        Task.project_id == project_id
+    )
+    if not include_comments:
+        return query.order_by(Task.id)
+    return (
+        query.add_columns(
+            *[getattr(Comment, name).label(f"comment_{name}") for name in COMMENT_FIELDS]
+        )
+        .outerjoin(Comment, Comment.task_id == Task.id)
+        .order_by(Task.id, Comment.created_at, Comment.id)
+    )
+
+
+async def _task_batches(
+    session: AsyncSession,
+    project_id: int,
+    include_comments: bool,
+    batch_size: int,
+    is_disconnected: Callable[[], Awaitable[bool]] | None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """태스크 dict 배치 (include_comments면 각 태스크에 comments 목록)"""
+    result = await session.stream(
+        _export_query(project_id, include_comments).execution_options(yield_per=batch_size)
+    )
+    width = len(TASK_FIELDS)
+    # 댓글이 다음 배치로 이어질 수 있으므로 마지막 태스크는 다음 태스크가 나올 때 내보낸다
+    pending: dict[str, Any] | None = None
+    try:
+        async for partition in result.partitions():
+            if is_disconnected is not None and await is_disconnected():
+                return
+            if not include_comments:
+                yield [dict(zip(TASK_FIELDS, row, strict=True)) for row in partition]
+                continue
+
+            batch = []
+            for row in partition:
+                if pending is None or pending["id"] != row.id:
+                    if pending is not None:
+                        batch.append(pending)
+                    pending = {**dict(zip(TASK_FIELDS, row[:width], strict=True)), "comments": []}
+                if row.comment_id is not None:
+                    pending["comments"].append(dict(zip(COMMENT_FIELDS, row[width:], strict=True)))
+            yield batch
+        if pending is not None:
+            yield [pending]
+    finally:
+        await result.close()
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return orjson.dumps(value).decode()
+    if isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_bytes(rows: list[list[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([[_csv_value(value) for value in row] for row in rows])
+    return buffer.getvalue().encode("utf-8")
+
+
+async def export_project_tasks(
+    session_factory: Callable[[], AsyncSession],
+    project_id: int,
+    export_format: str,
+    include_comments: bool = False,
+    is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    프로젝트 태스크를 배치마다 응답 바이트로 (StreamingResponse 본문)
+
+    ndjson은 태스크 한 줄에 JSON 객체 하나(comments는 중첩 목록), csv는 헤더 행 +
+    태스크 한 행(comments는 JSON 배열 문자열 컬럼)이다.
+    """
+    columns = [*TASK_FIELDS, "comments"] if include_comments else list(TASK_FIELDS)
+    if export_format == "csv":
+        yield _csv_bytes([columns])
+    async with (
+        session_factory() as session,
+        # 중간에 멈춰도 커서를 세션보다 먼저 닫는다
+        aclosing(
+            _task_batches(session, project_id, include_comments, batch_size, is_disconnected)
+        ) as batches,
+    ):
+        async for batch in batches:
+            if export_format == "csv":
+                yield _csv_bytes([[task[name] for name in columns] for task in batch])
+            else:
+                yield b"".join(orjson.dumps(task) + b"\n" for task in batch)
@@ -1,11 +1,62 @@
+from functools import partial
+from typing import Any
+
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import literal, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
-from app.models.project import Project, ProjectMember, ProjectRole
+from app.core.cache import evict_after_commit, invalidate_project_membership, shared_cache
+from app.models.project import Project, ProjectMember, ProjectRole, ProjectTaskStats
 from app.models.user import User
-from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.project import (
+    ProjectCreate,
+    ProjectMemberResponse,
+    ProjectResponse,
+    ProjectUpdate,
+)
+
+
+# 공유 캐시 키: 프로젝트 정보, 프로젝트 멤버 목록, 사용자의 프로젝트 id 목록(최근 생성 순)
+def project_cache_key(project_id: int) -> str:
+    return shared_cache.key("project", project_id)
+
+
+def project_members_cache_key(project_id: int, version: int) -> str:
+    """멤버 목록 키는 project version 포함 (멤버가 바뀌면 트리거가 version을 올려 새 키)"""
+    return shared_cache.key("project_members", f"{project_id}:{version}")
+
+
+def user_projects_cache_key(user_id: int) -> str:
+    return shared_cache.key("user_projects", user_id)
+
+
+def project_values(project: Project) -> dict[str, Any]:
+    """공유 캐시에 저장하는 프로젝트 정보 (project_cache_key)"""
+    return ProjectResponse.model_validate(project).model_dump(mode="json")
+
+
+async def project_is_live(db: AsyncSession, project_id: int) -> bool:
+    """
+    삭제 중이 아닌 프로젝트임을 DB 조회 없이 확인할 수 있으면 True
+
+    이 세션에서 로드한 Project가 있으면 그 deleted_at을, 없으면 공유 캐시의 프로젝트
+    항목을 본다. 삭제 요청은 커밋 후 항목을 지우고 삭제 중인 프로젝트는 다시 채워지지
+    않으므로 항목이 있으면 살아 있는 프로젝트다. 확인할 수 없으면 False.
+    """
+    loaded = db.identity_map.get(identity_key(Project, project_id))
+    if loaded is not None:
+        return loaded.deleted_at is None
+    [values] = await shared_cache.get_many(db, [project_cache_key(project_id)])
+    return values is not None
+
+
+def _cached_project(values: dict[str, Any]) -> Project:
+    """캐시된 값으로 만든 Project (세션에 속하지 않음)"""
+    return Project(**ProjectResponse.model_validate(values).model_dump())
 
 
 async def create_project(
@@ -13,7 +64,7 @@ async def create_project(
     owner_id: int,
     data: ProjectCreate,
 ) -> Project:
-    """프로젝트 생성 + owner 멤버십 자동 추가"""
+    """프로젝트 생성 + owner 멤버십 자동 추가 (created_at은 INSERT의 RETURNING으로 채워짐)"""
     project = Project(
         name=data.name,
         description=data.description,
@@ -30,95 +81,194 @@ async def create_project(
     )
     db.add(member)
     await db.flush()
-    await db.refresh(project)
 
+    shared_cache.invalidate(db, user_projects_cache_key(owner_id))
     return project
 
 
-async def get_user_projects(
-    db: AsyncSession,
-    user_id: int,
-) -> list[Project]:
-    """사용자가 멤버인 프로젝트 목록"""
+async def _query_user_projects(db: AsyncSession, user_id: int) -> list[Project]:
     result = await db.execute(
         select(Project)
         .join(ProjectMember, ProjectMember.project_id == Project.id)
-        .where(ProjectMember.user_id == user_id)
+        .outerjoin(ProjectTaskStats, ProjectTaskStats.project_id == Project.id)
+        .options(contains_eager(Project.task_stats))
+        .where(ProjectMember.user_id == user_id, Project.deleted_at.is_(None))
         .order_by(Project.created_at.desc())
     )
-    return list(result.scalars().all())
+    projects = list(result.scalars().all())
+    for project in projects:
+        await shared_cache.fill(db, project_cache_key(project.id), project_values(project))
+    return projects
+
+
+async def get_user_projects(
+    db: AsyncSession,
+    user_id: int,
+) -> list[Project]:
+    """
+    사용자가 멤버인 프로젝트 목록 (삭제 중 제외, 태스크 수는 project_task_stats에서 함께 로드)
+
+    프로젝트 id 목록과 프로젝트 정보는 공유 캐시에서 읽고, 태스크마다 바뀌는 태스크 수만
+    DB에서 읽는다. 캐시에 없으면 조인 쿼리 한 번으로 읽고 캐시를 채운다.
+    """
+    loaded: list[Project] = []
+
+    async def load_ids() -> list[int]:
+        loaded.extend(await _query_user_projects(db, user_id))
+        return [project.id for project in loaded]
+
+    project_ids = await shared_cache.get_or_load(db, user_projects_cache_key(user_id), load_ids)
+    if loaded or not project_ids:
+        return loaded
+
+    cached = await shared_cache.get_many(db, [project_cache_key(pid) for pid in project_ids])
+    if any(values is None for values in cached):
+        # 수정/삭제로 무효화된 프로젝트가 있으면 목록 전체를 다시 읽는다
+        return await _query_user_projects(db, user_id)
+
+    result = await db.scalars(
+        select(ProjectTaskStats).where(ProjectTaskStats.project_id.in_(project_ids))
+    )
+    stats = {row.project_id: row for row in result}
+    projects = [_cached_project(values) for values in cached]
+    for project in projects:
+        set_committed_value(project, "task_stats", stats.get(project.id))
+    return projects
+
+
+async def get_project(
+    db: AsyncSession,
+    project_id: int,
+) -> Project | None:
+    """ID로 프로젝트 조회 (같은 요청에서 이미 로드했으면 쿼리 없이 identity map 사용)"""
+    return await db.get(Project, project_id)
+
+
+async def get_project_version(
+    db: AsyncSession,
+    project_id: int,
+) -> int | None:
+    """
+    프로젝트 version (ETag용)
+
+    멤버십 확인에서 Project를 이미 로드했으면 쿼리 없이 identity map 값을 쓴다.
+    응답 데이터보다 먼저 읽어야 ETag가 실제 내용보다 새 버전을 가리키지 않는다.
+    """
+    project = await get_project(db, project_id)
+    return None if project is None else project.version
 
 
 async def get_project_by_id(
     db: AsyncSession,
     project_id: int,
 ) -> Project | None:
-    """ID로 프로젝트 조회 (members eager load)"""
-    result = await db.execute(
-        select(Project).options(selectinload(Project.members)).where(Project.id == project_id)
+    """
+    ID로 프로젝트 조회 (members 포함, 삭제 중이면 None)
+
+    멤버십 확인에서 이미 로드한 Project가 있으면 그 값을, 없으면 공유 캐시의 프로젝트
+    정보를 쓴다. 멤버 목록은 로드한 Project의 version으로 공유 캐시를 찾으므로 같은 version의
+    ETag와 함께 나가는 멤버 목록은 항상 그 version의 내용이다 (version을 모르면 DB에서 읽는다).
+    돌려주는 Project는 세션에 속하지 않는다.
+    """
+    loaded = db.identity_map.get(identity_key(Project, project_id))
+    if loaded is not None:
+        values = None if loaded.deleted_at is not None else project_values(loaded)
+    else:
+
+        async def load_project() -> dict[str, Any] | None:
+            project = await db.scalar(
+                select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))
+            )
+            return None if project is None else project_values(project)
+
+        values = await shared_cache.get_or_load(db, project_cache_key(project_id), load_project)
+    if values is None:
+        return None
+
+    async def load_members() -> list[dict[str, Any]]:
+        result = await db.scalars(
+            select(ProjectMember).where(ProjectMember.project_id == project_id)
+        )
+        return [
+            ProjectMemberResponse.model_validate(member).model_dump(mode="json")
+            for member in result
+        ]
+
+    if loaded is None:
+        members = await load_members()
+    else:
+        members = await shared_cache.get_or_load(
+            db, project_members_cache_key(project_id, loaded.version), load_members
+        )
+    project = _cached_project(values)
+    set_committed_value(
+        project,
+        "members",
+        [ProjectMember(**ProjectMemberResponse.model_validate(m).model_dump()) for m in members],
     )
-    return result.scalar_one_or_none()
+    return project
 
 
 async def update_project(
     db: AsyncSession,
-    project: Project,
+    project_id: int,
     data: ProjectUpdate,
 ) -> Project:
-    """프로젝트 수정 (partial update)"""
+    """프로젝트 수정 (partial update, UPDATE ... RETURNING 한 번)"""
     update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(project, field, value)
-    await db.flush()
-    await db.refresh(project)
+    if not update_data:
+        project = await get_project(db, project_id)
+    else:
+        result = await db.scalars(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(**update_data, version=Project.version + 1)
+            .returning(Project),
+            execution_options={"synchronize_session": False, "populate_existing": True},
+        )
+        project = result.one_or_none()
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다.",
+        )
+    if update_data:
+        shared_cache.invalidate(db, project_cache_key(project_id))
     return project
 
 
-async def delete_project(
-    db: AsyncSession,
-    project: Project,
-) -> None:
-    """프로젝트 삭제"""
-    await db.delete(project)
-    await db.flush()
-
-
 async def add_project_member(
     db: AsyncSession,
     project_id: int,
     user_id: int,
     role: ProjectRole,
 ) -> ProjectMember:
-    """멤버 추가 (중복/존재여부 체크)"""
-    # 사용자 존재 확인
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
-
-    # 중복 멤버십 확인
-    result = await db.execute(
-        select(ProjectMember).where(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == user_id,
+    """멤버 추가 (사용자 존재/중복 확인을 INSERT ... SELECT ... ON CONFLICT 한 번으로 처리)"""
+    result = await db.scalars(
+        insert(ProjectMember)
+        .from_select(
+            ["user_id", "project_id", "role"],
+            select(User.id, literal(project_id), literal(role, ProjectMember.role.type)).where(
+                User.id == user_id
+            ),
         )
+        .on_conflict_do_nothing(index_elements=["user_id", "project_id"])
+        .returning(ProjectMember)
     )
-    existing = result.scalar_one_or_none()
-    if existing is not None:
+    member = result.one_or_none()
+    if member is None:
+        # 실패한 경우에만 원인을 구분하기 위해 한 번 더 조회
+        user_exists = await db.scalar(select(User.id).where(User.id == user_id))
+        if user_exists is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다.",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 프로젝트 멤버입니다.",
         )
-
-    member = ProjectMember(
-        user_id=user_id,
-        project_id=project_id,
-        role=role,
-    )
-    db.add(member)
-    await db.flush()
-    await db.refresh(member)
+    evict_after_commit(db, partial(invalidate_project_membership, project_id))
+    # 멤버 목록 캐시는 트리거가 올린 project version으로 새 키를 쓴다
+    shared_cache.invalidate(db, user_projects_cache_key(user_id))
     return member
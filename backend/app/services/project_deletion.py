@@ -0,0 +1,203 @@
+"""
+프로젝트 삭제 (백그라운드 배치)
+
+삭제 요청은 projects.deleted_at만 표시하고 바로 응답한다. 표시된 프로젝트는 목록과
+멤버십 확인에서 보이지 않으며, 하위 데이터는 별도 트랜잭션의 배치로 나눠 지운다.
+한 번의 CASCADE DELETE는 큰 프로젝트에서 요청을 오래 붙잡고 수많은 행을 한 트랜잭션에서
+잠그기 때문이다.
+
+배치 순서: 댓글 -> 태스크 -> 태스크 삭제 기록 -> 멤버 -> 프로젝트 행.
+각 단계는 트리거(태스크 수 집계, version)를 배치 단위로 실행하므로 project_task_stats의
+total_count가 남은 태스크 수가 된다.
+"""
+
+import asyncio
+import logging
+from functools import partial
+
+from fastapi import HTTPException, status
+from sqlalchemy import Delete, Select, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import evict_after_commit, invalidate_project_membership, shared_cache
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.comment import Comment
+from app.models.project import Project, ProjectDeletion, ProjectMember, ProjectTaskStats
+from app.models.task import Task, TaskTombstone
+from app.schemas.project import ProjectDeletionResponse
+from app.services.project import project_cache_key, user_projects_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+def _deletion_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="프로젝트 삭제 요청을 찾을 수 없습니다.",
+    )
+
+
+async def request_project_deletion(
+    db: AsyncSession,
+    project_id: int,
+    user_id: int,
+) -> ProjectDeletion:
+    """프로젝트를 삭제 중으로 표시하고 삭제 작업 행 생성 (실제 삭제는 run_project_deletion)"""
+    result = await db.execute(
+        update(Project)
+        .where(Project.id == project_id, Project.deleted_at.is_(None))
+        .values(deleted_at=func.now())
+        .returning(Project.id),
+        execution_options={"synchronize_session": False},
+    )
+    if result.scalar_one_or_none() is None:
+        # 동시에 들어온 다른 삭제 요청이 먼저 표시한 경우
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다.",
+        )
+
+    deletion = await db.scalar(
+        insert(ProjectDeletion)
+        .values(project_id=project_id, requested_by=user_id)
+        .returning(ProjectDeletion)
+    )
+    evict_after_commit(db, partial(invalidate_project_membership, project_id))
+    if shared_cache.enabled:
+        # 멤버들의 프로젝트 목록에서도 빠지도록 목록 캐시까지 지운다
+        member_ids = await db.scalars(
+            select(ProjectMember.user_id).where(ProjectMember.project_id == project_id)
+        )
+        shared_cache.invalidate(
+            db,
+            project_cache_key(project_id),
+            *(user_projects_cache_key(user_id) for user_id in member_ids),
+        )
+    return deletion
+
+
+def _batch(ids: Select[tuple[int]], batch_size: int) -> Delete:
+    """ids가 고르는 행 중 batch_size개만 지우는 DELETE (ids의 첫 컬럼이 기본 키)"""
+    column = ids.selected_columns[0]
+    return delete(column.table).where(column.in_(ids.limit(batch_size).scalar_subquery()))
+
+
+async def purge_project_deletion_step(
+    db: AsyncSession,
+    deletion_id: int,
+    batch_size: int | None = None,
+) -> bool:
+    """
+    삭제 작업을 한 배치 진행 (커밋은 호출자). 남은 작업이 있으면 True
+
+    작업 행을 FOR UPDATE SKIP LOCKED로 잡으므로 여러 워커가 같은 작업을 동시에
+    진행하지 않는다. 다른 워커가 잡고 있거나 이미 끝난 작업이면 False.
+    """
+    batch_size = batch_size or settings.PROJECT_DELETE_BATCH_SIZE
+    deletion = await db.scalar(
+        select(ProjectDeletion)
+        .where(ProjectDeletion.id == deletion_id, ProjectDeletion.finished_at.is_(None))
+        .with_for_update(skip_locked=True)
+    )
+    if deletion is None:
+        return False
+    project_id = deletion.project_id
+    options = {"synchronize_session": False}
+
+    steps = [
+        (
+            "comments_deleted",
+            select(Comment.id)
+            .join(Task, Task.id == Comment.task_id)
+            .where(Task.project_id == project_id),
+        ),
+        ("tasks_deleted", select(Task.id).where(Task.project_id == project_id)),
+        (None, select(TaskTombstone.task_id).where(TaskTombstone.project_id == project_id)),
+        ("members_deleted", select(ProjectMember.id).where(ProjectMember.project_id == project_id)),
+    ]
+    for counter, ids in steps:
+        result = await db.execute(_batch(ids, batch_size), execution_options=options)
+        deleted = result.rowcount
+        if deleted:
+            if counter is not None:
+                setattr(deletion, counter, getattr(deletion, counter) + deleted)
+            await db.flush()
+            return True
+
+    # 남은 하위 행이 없으므로 CASCADE는 집계 행만 지운다
+    await db.execute(delete(Project).where(Project.id == project_id), execution_options=options)
+    deletion.finished_at = func.now()
+    await db.flush()
+    return False
+
+
+async def run_project_deletion(deletion_id: int) -> None:
+    """삭제 작업을 끝까지 진행 (배치마다 별도 세션/트랜잭션, BackgroundTasks용)"""
+    try:
+        while True:
+            async with async_session() as db, db.begin():
+                more = await purge_project_deletion_step(db, deletion_id)
+            if not more:
+                break
+            await asyncio.sleep(settings.PROJECT_DELETE_BATCH_PAUSE_SECONDS)
+        logger.info("Project deletion finished or handed off: deletion=%s", deletion_id)
+    except Exception:
+        # 끝나지 않은 작업은 다음 시작 때 resume_project_deletions가 이어서 진행한다
+        logger.exception("Project deletion failed: deletion=%s", deletion_id)
+
+
+async def resume_project_deletions() -> None:
+    """끝나지 않은 삭제 작업을 이어서 진행 (프로세스 시작 시 lifespan에서 실행)"""
+    try:
+        async with async_session() as db:
+            deletion_ids = (
+                await db.scalars(
+                    select(ProjectDeletion.id)
+                    .where(ProjectDeletion.finished_at.is_(None))
+                    .order_by(ProjectDeletion.id)
+                )
+            ).all()
+    except Exception:
+        logger.exception("Could not load unfinished project deletions")
+        return
+    for deletion_id in deletion_ids:
+        await run_project_deletion(deletion_id)
+
+
+async def get_project_deletion_status(
+    db: AsyncSession,
+    project_id: int,
+    user_id: int,
+) -> ProjectDeletionResponse:
+    """요청한 사용자의 가장 최근 삭제 작업 진행 상황 (남은 태스크 수는 집계 행에서)"""
+    row = (
+        await db.execute(
+            select(ProjectDeletion, ProjectTaskStats.total_count)
+            .outerjoin(
+                ProjectTaskStats,
+                ProjectTaskStats.project_id == ProjectDeletion.project_id,
+            )
+            .where(
+                ProjectDeletion.project_id == project_id,
+                ProjectDeletion.requested_by == user_id,
+            )
+            .order_by(ProjectDeletion.id.desc())
+            .limit(1)
+        )
+    ).one_or_none()
+    if row is None:
+        raise _deletion_not_found()
+
+    deletion, tasks_remaining = row
+    return ProjectDeletionResponse(
+        id=deletion.id,
+        project_id=deletion.project_id,
+        status="completed" if deletion.finished_at is not None else "in_progress",
+        requested_at=deletion.requested_at,
+        finished_at=deletion.finished_at,
+        comments_deleted=deletion.comments_deleted,
+        tasks_deleted=deletion.tasks_deleted,
+        members_deleted=deletion.members_deleted,
+        tasks_remaining=tasks_remaining or 0,
+    )
@@ -0,0 +1,122 @@
+import html
+import re
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import Float, and_, exists, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.comment import Comment
+from app.models.task import Task
+from app.schemas.task import TaskResponse, TaskSearchResult
+from app.services.task import decode_cursor, encode_cursor, invalid_cursor
+
+SEARCH_CONFIG = "simple"
+DEFAULT_SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_TERMS = 8
+
+# 댓글에서만 일치한 경우의 rank 가중치 (제목/설명 일치보다 낮게)
+COMMENT_RANK_WEIGHT = 0.5
+
+# ts_headline은 원문을 이스케이프하지 않으므로 일치 구간을 사용자 입력에 쓰이지 않는
+# 사유 영역 문자로 표시하고, HTML 이스케이프한 뒤에 <mark>로 바꾼다
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+_HIGHLIGHT_SELECTORS = f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}"'
+HIGHLIGHT_TITLE_OPTIONS = f"{_HIGHLIGHT_SELECTORS}, HighlightAll=TRUE"
+HIGHLIGHT_DESCRIPTION_OPTIONS = f"{_HIGHLIGHT_SELECTORS}, MaxFragments=2, MaxWords=20, MinWords=5"
+
+
+def render_highlight(headline: str) -> str:
+    """ts_headline 결과 -> 이스케이프된 HTML (일치 구간만 <mark>...</mark>)"""
+    return (
+        html.escape(headline).replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>")
+    )
+
+
+def build_search_query(q: str) -> str:
+    """사용자 검색어 -> to_tsquery 문자열
+
+    'simple' 설정은 어간 추출을 하지 않으므로 단어마다 접두사 일치(:*)를 써서
+    "로그인"으로 "로그인을", "로그인한" 같이 조사/어미가 붙은 단어도 찾는다.
+    tsquery 연산자 문자는 제거하고 모든 단어가 있어야 일치(AND)한다.
+    """
+    terms = re.findall(r"\w+", q.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="검색어가 올바르지 않습니다.",
+        )
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def _decode_search_cursor(cursor: str, q: str) -> tuple[float, int]:
+    try:
+        payload = decode_cursor(cursor)
+        if payload["q"] != q or not isinstance(payload["r"], int | float):
+            raise ValueError("query mismatch")
+        return float(payload["r"]), int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise invalid_cursor() from None
+
+
+async def search_tasks(
+    db: AsyncSession,
+    project_id: int,
+    q: str,
+    include_comments: bool = False,
+    limit: int = DEFAULT_SEARCH_PAGE_SIZE,
+    cursor: str | None = None,
+) -> tuple[list[TaskSearchResult], str | None]:
+    """프로젝트 내 태스크 전문 검색 (rank 높은 순, (rank, id) keyset 페이지네이션)"""
+    query = func.to_tsquery(SEARCH_CONFIG, build_search_query(q))
+    rank: Any = func.ts_rank_cd(Task.search_vector, query)
+    matched: Any = Task.search_vector.op("@@")(query)
+
+    if include_comments:
+        comment_match = and_(
+            Comment.task_id == Task.id,
+            Comment.search_vector.op("@@")(query),
+        )
+        comment_rank = (
+            select(func.max(func.ts_rank_cd(Comment.search_vector, query)))
+            .where(comment_match)
+            .scalar_subquery()
+        )
+        rank = rank + func.coalesce(comment_rank, 0) * COMMENT_RANK_WEIGHT
+        matched = matched | exists().where(comment_match)
+
+    rank = rank.cast(Float).label("rank")
+    page = select(Task.id, rank).where(Task.project_id == project_id, matched)
+    if cursor is not None:
+        last_rank, last_id = _decode_search_cursor(cursor, q)
+        page = page.where(
+            tuple_(rank, Task.id) < tuple_(literal(last_rank, Float), literal(last_id))
+        )
+    page = page.order_by(rank.desc(), Task.id.desc()).limit(limit + 1).subquery()
+
+    # 하이라이트는 비용이 크므로 잘린 페이지의 행에만 계산한다
+    result = await db.execute(
+        select(
+            Task,
+            page.c.rank,
+            func.ts_headline(SEARCH_CONFIG, Task.title, query, HIGHLIGHT_TITLE_OPTIONS),
+            func.ts_headline(SEARCH_CONFIG, Task.description, query, HIGHLIGHT_DESCRIPTION_OPTIONS),
+        )
+        .join(page, page.c.id == Task.id)
+        .order_by(page.c.rank.desc(), Task.id.desc())
+    )
+    results = [
+        TaskSearchResult(
+            **TaskResponse.model_validate(task).model_dump(),
+            rank=task_rank,
+            title_highlight=render_highlight(title_highlight),
+            description_highlight=render_highlight(description_highlight),
+        )
+        for task, task_rank, title_highlight, description_highlight in result.all()
+    ]
+    if len(results) <= limit:
+        return results, None
+    results = results[:limit]
+    last = results[-1]
+    return results, encode_cursor({"q": q, "r": last.rank, "id": last.id})
@@ -1,8 +1,68 @@
-from sqlalchemy import select
+import base64
+import enum
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    String,
+    and_,
+    any_,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.cache import coalesced_reads
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.ranking import MAX_RANK_LENGTH, rank_before_sql, rank_between, rank_sequence
+from app.models.project import Project, ProjectMember
+from app.models.task import Task, TaskPriority, TaskStatus, TaskTombstone
+from app.schemas.task import (
+    TASK_CARD_FIELDS,
+    TASK_FIELDS,
+    TaskBatchDelete,
+    TaskBatchRequest,
+    TaskBatchResponse,
+    TaskBatchResult,
+    TaskCreate,
+    TaskMove,
+    TaskResponse,
+    TaskStatusUpdate,
+    TaskUpdate,
+)
+
+logger = logging.getLogger(__name__)
 
-from app.models.task import Task, TaskPriority, TaskStatus
-from app.schemas.task import TaskCreate, TaskStatusUpdate, TaskUpdate
+T = TypeVar("T")
+
+
+def _column_head_position(project_id: int, task_status: TaskStatus) -> ColumnElement[str]:
+    """컬럼 맨 앞에 올 rank (INSERT/UPDATE 문 안에서 계산)"""
+    column_task = aliased(Task)
+    first = (
+        select(func.min(column_task.position))
+        .where(column_task.project_id == project_id, column_task.status == task_status)
+        .scalar_subquery()
+    )
+    return rank_before_sql(first)
 
 
 async def create_task(
@@ -10,18 +70,187 @@ async def create_task(
     project_id: int,
     data: TaskCreate,
 ) -> Task:
-    """태스크 생성"""
-    task = Task(
-        title=data.title,
-        description=data.description,
-        priority=data.priority,
-        assignee_id=data.assignee_id,
-        project_id=project_id,
-    )
-    db.add(task)
-    await db.flush()
-    await db.refresh(task)
-    return task
+    """태스크 생성 (todo 컬럼 맨 앞, INSERT ... RETURNING 한 번)"""
+    result = await db.scalars(
+        insert(Task)
+        .values(
+            title=data.title,
+            description=data.description,
+            priority=data.priority,
+            assignee_id=data.assignee_id,
+            project_id=project_id,
+            position=_column_head_position(project_id, TaskStatus.todo),
+        )
+        .returning(Task)
+    )
+    return result.one()
+
+
+def _task_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="태스크를 찾을 수 없습니다.",
+    )
+
+
+# sort_by 값 -> 정렬에 사용하는 Task 속성 (priority는 알파벳순이 아닌 rank로 정렬)
+TASK_SORT_FIELDS = {
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "title": "title",
+    "priority": "priority_rank",
+    "status": "status",
+    "position": "position",
+}
+DEFAULT_TASK_PAGE_SIZE = 50
+DEFAULT_BOARD_COLUMN_SIZE = 20
+DEFAULT_TASK_CHANGES_SIZE = 500
+
+
+def _task_sort_key(sort_by: str, sort_order: str) -> tuple[str, str]:
+    if sort_by not in TASK_SORT_FIELDS:
+        sort_by = "created_at"
+    if sort_order != "asc":
+        sort_order = "desc"
+    return sort_by, sort_order
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """JSON payload를 불투명 커서 문자열로 인코딩"""
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """커서 문자열을 payload로 디코딩 (형식 검증은 호출하는 쪽에서)"""
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    payload = json.loads(raw)
+    if not isinstance(payload, dict):
+        raise ValueError("invalid payload")
+    return payload
+
+
+def invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="유효하지 않은 커서입니다.",
+    )
+
+
+def encode_task_cursor(task: Task | Row[Any], sort_by: str, sort_order: str) -> str:
+    """마지막 태스크(또는 정렬 컬럼과 id를 고른 행)의 (정렬 값, id)를 불투명 커서로 인코딩"""
+    value = getattr(task, TASK_SORT_FIELDS[sort_by])
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, enum.Enum):
+        value = value.value
+    return encode_cursor({"s": sort_by, "o": sort_order, "v": value, "id": task.id})
+
+
+def decode_task_cursor(cursor: str, sort_by: str, sort_order: str) -> tuple[Any, int]:
+    """커서 디코딩 (정렬 조건이 다르거나 형식이 잘못되면 400)"""
+    try:
+        payload = decode_cursor(cursor)
+        if payload["s"] != sort_by or payload["o"] != sort_order:
+            raise ValueError("sort mismatch")
+        value = payload["v"]
+        if sort_by in ("created_at", "updated_at"):
+            value = datetime.fromisoformat(value)
+        elif sort_by == "status":
+            value = TaskStatus(value)
+        elif sort_by == "priority":
+            if not isinstance(value, int):
+                raise ValueError("invalid rank")
+        elif not isinstance(value, str):
+            raise ValueError("invalid value")
+        return value, int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise invalid_cursor() from None
+
+
+def resolve_task_fields(fields: str | None, view: str = "full") -> tuple[str, ...]:
+    """
+    목록 API의 fields=(쉼표 구분)/view=card -> 응답에 넣을 태스크 필드
+
+    fields가 있으면 view보다 우선한다. id는 항상 포함한다. 모르는 필드면 400.
+    """
+    if fields is None:
+        return TASK_CARD_FIELDS if view == "card" else TASK_FIELDS
+    requested = (name.strip() for name in fields.split(","))
+    names = tuple(dict.fromkeys(["id", *(name for name in requested if name)]))
+    unknown = [name for name in names if name not in TASK_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 필드입니다: {', '.join(unknown)}",
+        )
+    return names
+
+
+def _task_columns(fields: tuple[str, ...], *required: str) -> list[Any]:
+    """요청 필드 + 커서/그룹핑에 필요한 속성만 SELECT (ORM 객체를 만들지 않음)"""
+    return [getattr(Task, name) for name in dict.fromkeys([*fields, *required])]
+
+
+def _task_dicts(rows: Any, fields: tuple[str, ...]) -> list[dict[str, Any]]:
+    """_task_columns로 고른 행 -> 요청 필드 dict (SELECT 목록이 fields 순서로 시작)"""
+    return [dict(zip(fields, row, strict=False)) for row in rows]
+
+
+def _task_filters(
+    project_id: int,
+    status: TaskStatus | None,
+    priority: TaskPriority | None,
+    assignee_id: int | None,
+) -> list[ColumnElement[bool]]:
+    conditions = [Task.project_id == project_id]
+    if status is not None:
+        conditions.append(Task.status == status)
+    if priority is not None:
+        conditions.append(Task.priority == priority)
+    if assignee_id is not None:
+        conditions.append(Task.assignee_id == assignee_id)
+    return conditions
+
+
+def _task_order_by(sort_by: str, sort_order: str) -> tuple[ColumnElement[Any], ...]:
+    """정렬 (같은 값끼리는 id로 순서를 고정)"""
+    sort_column = getattr(Task, TASK_SORT_FIELDS[sort_by])
+    if sort_order == "asc":
+        return sort_column.asc(), Task.id.asc()
+    return sort_column.desc(), Task.id.desc()
+
+
+def _task_list_query(
+    project_id: int,
+    status: TaskStatus | None,
+    priority: TaskPriority | None,
+    assignee_id: int | None,
+    sort_by: str,
+    sort_order: str,
+    fields: tuple[str, ...] = TASK_FIELDS,
+) -> Select[Any]:
+    return (
+        select(*_task_columns(fields, "id", TASK_SORT_FIELDS[sort_by]))
+        .where(*_task_filters(project_id, status, priority, assignee_id))
+        .order_by(*_task_order_by(sort_by, sort_order))
+    )
+
+
+async def _coalesce(
+    version: int | None, key: tuple[Any, ...], loader: Callable[[], Awaitable[T]]
+) -> T:
+    """
+    같은 project version을 본 동시 조회를 쿼리 한 번으로 합친다 (coalesced_reads)
+
+    version은 호출자가 이 조회 전에 자기 세션에서 읽은 커밋된 값이다. tasks가 바뀌면
+    트리거가 version을 올리므로, 같은 version을 본 요청에게는 먼저 시작한 조회의 결과가
+    자기가 직접 읽었을 결과와 같다 (그 사이 커밋이 있었다면 version이 달라 합류하지 않음).
+    version이 None이면 합치지 않는다. 멤버십 확인은 호출 전에 요청마다 따로 한다.
+    """
+    if version is None or not settings.READ_COALESCING_ENABLED:
+        return await loader()
+    return await coalesced_reads.do((*key, version), loader)
 
 
 async def get_tasks(
@@ -32,30 +261,293 @@ async def get_tasks(
     assignee_id: int | None = None,
     sort_by: str = "created_at",
     sort_order: str = "desc",
-) -> list[Task]:
-    """태스크 목록 조회 (동적 WHERE + ORDER BY)"""
-    query = select(Task).where(Task.project_id == project_id)
+    fields: tuple[str, ...] = TASK_FIELDS,
+    version: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    태스크 목록 조회 (동적 WHERE + ORDER BY)
+
+    목록은 ORM 객체를 만들지 않고 fields 컬럼만 SELECT해서 응답 모양의 dict로 반환한다.
+    version(project version)을 넘기면 같은 조건의 동시 조회와 결과를 공유한다.
+    """
+    sort_by, sort_order = _task_sort_key(sort_by, sort_order)
+    query = _task_list_query(project_id, status, priority, assignee_id, sort_by, sort_order, fields)
+
+    async def load() -> list[dict[str, Any]]:
+        return _task_dicts(await db.execute(query), fields)
 
+    key = ("tasks", project_id, status, priority, assignee_id, sort_by, sort_order, fields)
+    return await _coalesce(version, key, load)
+
+
+async def get_task_page(
+    db: AsyncSession,
+    project_id: int,
+    status: TaskStatus | None = None,
+    priority: TaskPriority | None = None,
+    assignee_id: int | None = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    limit: int = DEFAULT_TASK_PAGE_SIZE,
+    cursor: str | None = None,
+    fields: tuple[str, ...] = TASK_FIELDS,
+    version: int | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    태스크 목록 keyset 페이지네이션 (OFFSET 없이 (정렬 값, id) 다음부터 조회)
+
+    version을 넘기면 같은 조건의 동시 조회와 결과를 공유한다 (get_tasks 참고).
+    """
+    sort_by, sort_order = _task_sort_key(sort_by, sort_order)
+    query = _task_list_query(project_id, status, priority, assignee_id, sort_by, sort_order, fields)
+    query = _task_keyset(query, cursor, sort_by, sort_order)
+
+    async def load() -> tuple[list[dict[str, Any]], str | None]:
+        result = await db.execute(query.limit(limit + 1))
+        rows = result.all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_task_cursor(rows[-1], sort_by, sort_order)
+        return _task_dicts(rows, fields), next_cursor
+
+    key = (
+        "task_page",
+        project_id,
+        status,
+        priority,
+        assignee_id,
+        sort_by,
+        sort_order,
+        limit,
+        cursor,
+        fields,
+    )
+    return await _coalesce(version, key, load)
+
+
+def _assigned_task_query(
+    user_id: int,
+    status: TaskStatus | None,
+    priority: TaskPriority | None,
+    sort_by: str,
+    sort_order: str,
+    fields: tuple[str, ...] = TASK_FIELDS,
+) -> Select[Any]:
+    columns = _task_columns(fields, "id", "project_id", TASK_SORT_FIELDS[sort_by])
+    query = (
+        select(*columns, Project.name.label("project_name"))
+        .join(
+            ProjectMember,
+            and_(ProjectMember.project_id == Task.project_id, ProjectMember.user_id == user_id),
+        )
+        .join(Project, Project.id == Task.project_id)
+        .where(Task.assignee_id == user_id, Project.deleted_at.is_(None))
+        .order_by(*_task_order_by(sort_by, sort_order))
+    )
     if status is not None:
         query = query.where(Task.status == status)
     if priority is not None:
         query = query.where(Task.priority == priority)
-    if assignee_id is not None:
-        query = query.where(Task.assignee_id == assignee_id)
+    return query
 
-    # 정렬
-    allowed_sort_fields = {"created_at", "updated_at", "title", "priority", "status"}
-    if sort_by not in allowed_sort_fields:
-        sort_by = "created_at"
 
-    sort_column = getattr(Task, sort_by)
-    if sort_order == "asc":
-        query = query.order_by(sort_column.asc())
-    else:
-        query = query.order_by(sort_column.desc())
+def _task_keyset(
+    query: Select[Any], cursor: str | None, sort_by: str, sort_order: str
+) -> Select[Any]:
+    """커서의 (정렬 값, id) 다음 행부터 조회하도록 조건 추가"""
+    if cursor is None:
+        return query
+    value, last_id = decode_task_cursor(cursor, sort_by, sort_order)
+    sort_column = getattr(Task, TASK_SORT_FIELDS[sort_by])
+    position = tuple_(sort_column, Task.id)
+    boundary = tuple_(literal(value, sort_column.type), literal(last_id))
+    return query.where(position > boundary if sort_order == "asc" else position < boundary)
+
+
+async def get_assigned_task_page(
+    db: AsyncSession,
+    user_id: int,
+    status: TaskStatus | None = None,
+    priority: TaskPriority | None = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    limit: int = DEFAULT_TASK_PAGE_SIZE,
+    cursor: str | None = None,
+    fields: tuple[str, ...] = TASK_FIELDS,
+) -> tuple[list[dict[str, Any]], dict[int, str], str | None]:
+    """
+    내가 멤버인 모든 프로젝트에서 나에게 배정된 태스크 keyset 페이지
+
+    tasks를 assignee 인덱스로 읽고 project_members (user_id, project_id) 유니크
+    인덱스로 멤버십을 확인하는 쿼리 한 번이다. 배정 후 프로젝트에서 빠진 경우는
+    제외된다. 페이지에 나온 프로젝트의 {id: 이름}을 함께 반환한다.
+    """
+    sort_by, sort_order = _task_sort_key(sort_by, sort_order)
+    query = _assigned_task_query(user_id, status, priority, sort_by, sort_order, fields)
+    query = _task_keyset(query, cursor, sort_by, sort_order)
+
+    result = await db.execute(query.limit(limit + 1))
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_task_cursor(rows[-1], sort_by, sort_order) if has_more else None
+    project_names = {row.project_id: row.project_name for row in rows}
+    return _task_dicts(rows, fields), project_names, next_cursor
+
+
+def _decode_sync_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        payload = decode_cursor(cursor)
+        return datetime.fromisoformat(payload["t"]), int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise invalid_cursor() from None
+
+
+async def get_task_changes(
+    db: AsyncSession,
+    project_id: int,
+    since: str | None = None,
+    limit: int = DEFAULT_TASK_CHANGES_SIZE,
+) -> dict[str, Any]:
+    """
+    커서 이후 생성/수정/삭제된 태스크 (since가 없으면 처음부터)
+
+    수정분은 (updated_at, id), 삭제 기록은 (deleted_at, task_id) 순서로 각각 인덱스에서
+    limit+1개씩 읽어 합친 뒤 앞에서 limit개를 반환한다. updated_at은 트랜잭션 시작
+    시각이라 늦게 커밋된 변경이 커서보다 앞선 시각을 가질 수 있으므로, 따라잡은
+    경우(has_more=false)의 커서는 TASK_SYNC_SETTLE_SECONDS만큼 뒤로 둔다. 그 구간의
+    변경은 다음 요청에서 다시 올 수 있으므로 클라이언트는 id 기준으로 덮어쓴다.
+    응답 모양(TaskChangesResponse)의 dict를 ORM 객체 없이 만든다.
+    """
+    db_now = await db.scalar(select(func.localtimestamp()))
+    boundary = None
+    if since is not None:
+        boundary = _decode_sync_cursor(since)
+        if boundary[0] < db_now - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS):
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="커서가 너무 오래되었습니다. 전체 목록을 다시 받아야 합니다.",
+            )
+
+    task_query = (
+        select(*_task_columns(TASK_FIELDS))
+        .where(Task.project_id == project_id)
+        .order_by(Task.updated_at, Task.id)
+        .limit(limit + 1)
+    )
+    tombstone_query = (
+        select(TaskTombstone.task_id, TaskTombstone.deleted_at)
+        .where(TaskTombstone.project_id == project_id)
+        .order_by(TaskTombstone.deleted_at, TaskTombstone.task_id)
+        .limit(limit + 1)
+    )
+    if boundary is not None:
+        changed_at, last_id = literal(boundary[0], Task.updated_at.type), literal(boundary[1])
+        task_query = task_query.where(
+            tuple_(Task.updated_at, Task.id) > tuple_(changed_at, last_id)
+        )
+        tombstone_query = tombstone_query.where(
+            tuple_(TaskTombstone.deleted_at, TaskTombstone.task_id) > tuple_(changed_at, last_id)
+        )
 
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    # (정렬 키, 삭제 여부, 응답 항목)
+    changes: list[tuple[tuple[datetime, int], bool, dict[str, Any]]] = [
+        ((task["updated_at"], task["id"]), False, task)
+        for task in _task_dicts(await db.execute(task_query), TASK_FIELDS)
+    ]
+    changes += [
+        ((deleted_at, task_id), True, {"id": task_id, "deleted_at": deleted_at})
+        for task_id, deleted_at in await db.execute(tombstone_query)
+    ]
+    changes.sort(key=lambda change: change[0])
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    key = changes[-1][0] if changes else boundary
+    if not has_more:
+        settled = (db_now - timedelta(seconds=settings.TASK_SYNC_SETTLE_SECONDS), 0)
+        key = settled if key is None else min(key, settled)
+
+    return {
+        "tasks": [item for _, deleted, item in changes if not deleted],
+        "deleted": [item for _, deleted, item in changes if deleted],
+        "cursor": encode_cursor({"t": key[0].isoformat(), "id": key[1]}),
+        "has_more": has_more,
+    }
+
+
+async def purge_task_tombstones(db: AsyncSession, batch_size: int = 10_000) -> int:
+    """보관 기간이 지난 삭제 기록 한 배치 삭제 (삭제한 행 수 반환, 커밋은 호출자)"""
+    cutoff = func.localtimestamp() - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS)
+    expired = (
+        select(TaskTombstone.task_id)
+        .where(TaskTombstone.deleted_at < cutoff)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        delete(TaskTombstone).where(TaskTombstone.task_id.in_(expired)),
+        execution_options={"synchronize_session": False},
+    )
+    return result.rowcount
+
+
+async def get_task_board(
+    db: AsyncSession,
+    project_id: int,
+    priority: TaskPriority | None = None,
+    assignee_id: int | None = None,
+    sort_by: str = "position",
+    sort_order: str = "asc",
+    limit: int = DEFAULT_BOARD_COLUMN_SIZE,
+    fields: tuple[str, ...] = TASK_FIELDS,
+    version: int | None = None,
+) -> list[dict[str, Any]]:
+    """칸반 보드 (상태별 전체 개수 + 앞쪽 limit개, 윈도 함수 쿼리 한 번)
+
+    컬럼의 next_cursor는 태스크 목록 API에 status와 함께 넘기면 이어서 조회된다.
+    fields 컬럼만 조회해 응답 모양(TaskBoardColumn)의 dict로 반환한다.
+    version을 넘기면 같은 조건의 동시 조회와 결과를 공유한다 (get_tasks 참고).
+    """
+    sort_by, sort_order = _task_sort_key(sort_by, sort_order)
+    ranked = (
+        select(
+            *_task_columns(fields, "id", "status", TASK_SORT_FIELDS[sort_by]),
+            func.row_number()
+            .over(partition_by=Task.status, order_by=_task_order_by(sort_by, sort_order))
+            .label("column_position"),
+            func.count().over(partition_by=Task.status).label("column_count"),
+        )
+        .where(*_task_filters(project_id, None, priority, assignee_id))
+        .subquery()
+    )
+    query = (
+        select(ranked)
+        .where(ranked.c.column_position <= limit)
+        .order_by(ranked.c.status, ranked.c.column_position)
+    )
+
+    async def load() -> list[dict[str, Any]]:
+        columns: dict[TaskStatus, dict[str, Any]] = {
+            task_status: {"status": task_status, "count": 0, "tasks": [], "next_cursor": None}
+            for task_status in TaskStatus
+        }
+        last_rows: dict[TaskStatus, Row[Any]] = {}
+        for row in (await db.execute(query)).all():
+            column = columns[row.status]
+            column["count"] = row.column_count
+            column["tasks"].extend(_task_dicts([row], fields))
+            last_rows[row.status] = row
+        for task_status, column in columns.items():
+            if column["count"] > len(column["tasks"]):
+                column["next_cursor"] = encode_task_cursor(
+                    last_rows[task_status], sort_by, sort_order
+                )
+        return list(columns.values())
+
+    key = ("board", project_id, priority, assignee_id, sort_by, sort_order, limit, fields)
+    return await _coalesce(version, key, load)
 
 
 async def get_task_by_id(
@@ -68,36 +560,345 @@ async def get_task_by_id(
     return result.scalar_one_or_none()
 
 
+async def _update_task_returning(
+    db: AsyncSession,
+    project_id: int,
+    task_id: int,
+    values: dict[str, Any],
+) -> Task:
+    """UPDATE ... WHERE id AND project_id RETURNING (없거나 다른 프로젝트면 404)"""
+    result = await db.scalars(
+        update(Task)
+        .where(Task.id == task_id, Task.project_id == project_id)
+        .values(**values)
+        .returning(Task),
+        execution_options={"synchronize_session": False, "populate_existing": True},
+    )
+    task = result.one_or_none()
+    if task is None:
+        raise _task_not_found()
+    return task
+
+
 async def update_task(
     db: AsyncSession,
-    task: Task,
+    project_id: int,
+    task_id: int,
     data: TaskUpdate,
 ) -> Task:
-    """태스크 수정"""
+    """태스크 수정 (partial update, 문장 하나)"""
     update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-    await db.flush()
-    await db.refresh(task)
-    return task
+    if not update_data:
+        task = await get_task_by_id(db, task_id, project_id)
+        if task is None:
+            raise _task_not_found()
+        return task
+    if "status" in update_data:
+        update_data["position"] = _status_change_position(project_id, update_data["status"])
+    return await _update_task_returning(db, project_id, task_id, update_data)
 
 
 async def update_task_status(
     db: AsyncSession,
-    task: Task,
+    project_id: int,
+    task_id: int,
     data: TaskStatusUpdate,
 ) -> Task:
-    """태스크 상태 변경"""
-    task.status = data.status
-    await db.flush()
-    await db.refresh(task)
-    return task
+    """태스크 상태 변경 (새 컬럼 맨 앞으로, 문장 하나)"""
+    values = {
+        "status": data.status,
+        "position": _status_change_position(project_id, data.status),
+    }
+    return await _update_task_returning(db, project_id, task_id, values)
+
+
+def _status_change_position(project_id: int, new_status: TaskStatus) -> ColumnElement[str]:
+    """상태가 바뀌면 새 컬럼 맨 앞, 그대로면 기존 위치 유지"""
+    return case(
+        (Task.status == new_status, Task.position),
+        else_=_column_head_position(project_id, new_status),
+    )
+
+
+def _move_conflict() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="카드 위치가 변경되었습니다. 보드를 새로고침한 뒤 다시 시도해 주세요.",
+    )
+
+
+async def move_task(
+    db: AsyncSession,
+    project_id: int,
+    task_id: int,
+    data: TaskMove,
+) -> Task:
+    """카드를 after_id와 before_id 사이로 이동 (이동한 행 하나만 수정)
+
+    대상과 이웃 카드를 id 순서로 잠근 뒤 두 이웃 rank 사이의 rank를 만든다.
+    이웃이 삭제되었거나 다른 컬럼으로 옮겨졌으면 409를 반환한다.
+    """
+    ids = {task_id, data.after_id, data.before_id} - {None}
+    result = await db.execute(
+        select(Task.id, Task.status, Task.position)
+        .where(Task.project_id == project_id, Task.id.in_(ids))
+        .order_by(Task.id)
+        .with_for_update()
+    )
+    rows = {row.id: row for row in result.all()}
+    if task_id not in rows:
+        raise _task_not_found()
+
+    target_status = data.status or rows[task_id].status
+    neighbours = []
+    for neighbour_id in (data.after_id, data.before_id):
+        if neighbour_id is None:
+            neighbours.append(None)
+            continue
+        row = rows.get(neighbour_id)
+        if neighbour_id == task_id or row is None or row.status != target_status:
+            raise _move_conflict()
+        neighbours.append(row.position)
+    lower, upper = neighbours
+
+    if lower is None and upper is None:
+        # 이웃을 지정하지 않으면 컬럼 맨 앞
+        position: Any = _column_head_position(project_id, target_status)
+    else:
+        if lower is not None and upper is not None and lower >= upper:
+            # 동시 생성 등으로 rank가 같아진 경우 (같은 rank끼리는 id 순) 같은 rank의
+            # 행들만 바로 뒤 구간에 다시 나눈 뒤 다시 계산한다
+            if lower != upper or data.after_id > data.before_id:
+                raise _move_conflict()
+            tied = await _split_tied_positions(db, project_id, target_status, lower, task_id)
+            lower, upper = tied[data.after_id], tied[data.before_id]
+        position = rank_between(lower, upper)
+
+    return await _update_task_returning(
+        db, project_id, task_id, {"status": target_status, "position": position}
+    )
+
+
+async def _split_tied_positions(
+    db: AsyncSession,
+    project_id: int,
+    task_status: TaskStatus,
+    position: str,
+    exclude_id: int,
+) -> dict[int, str]:
+    """컬럼에서 rank가 position으로 같은 행들을 id 순서 그대로 서로 다른 rank로 나눔
+
+    첫 행은 그대로 두고 나머지를 (position, 다음 rank) 사이에 배치한다. 컬럼 전체가
+    아니라 같은 rank의 행(보통 두세 개)만 잠그고 수정한다. 같은 rank 행들의 id -> rank.
+    """
+    result = await db.execute(
+        select(Task.id)
+        .where(
+            Task.project_id == project_id,
+            Task.status == task_status,
+            Task.position == position,
+            Task.id != exclude_id,
+        )
+        .order_by(Task.id)
+        .with_for_update()
+    )
+    first_id, *rest = result.scalars().all()
+    upper = await db.scalar(
+        select(func.min(Task.position)).where(
+            Task.project_id == project_id,
+            Task.status == task_status,
+            Task.position > position,
+        )
+    )
+    changes = dict(zip(rest, rank_sequence(len(rest), after=position, before=upper), strict=True))
+    tasks = Task.__table__
+    await db.execute(
+        update(tasks)
+        .where(tasks.c.id == bindparam("b_id"))
+        .values(position=bindparam("b_position")),
+        [
+            {"b_id": task_id, "b_position": new_position}
+            for task_id, new_position in changes.items()
+        ],
+    )
+    return {first_id: position, **changes}
+
+
+def needs_rebalance(task: Task | TaskResponse) -> bool:
+    return len(task.position) > MAX_RANK_LENGTH
+
+
+async def rebalance_task_column(
+    db: AsyncSession,
+    project_id: int,
+    task_status: TaskStatus,
+) -> int:
+    """컬럼의 rank를 순서를 유지한 채 짧고 고르게 다시 배치 (바뀐 행 수 반환)
+
+    컬럼의 행을 id 순서로 잠그므로 동시에 진행 중인 이동은 재배치가 끝난 뒤
+    새 rank를 기준으로 처리된다. 바뀐 행은 updated_at도 갱신되어 변경분 동기화로
+    새 rank가 전달된다.
+    """
+    result = await db.execute(
+        select(Task.id, Task.position)
+        .where(Task.project_id == project_id, Task.status == task_status)
+        .order_by(Task.id)
+        .with_for_update()
+    )
+    rows = sorted(result.tuples().all(), key=lambda row: (row[1], row[0]))
+    changes = [
+        {"b_id": task_id, "b_position": new_position}
+        for (task_id, old_position), new_position in zip(
+            rows, rank_sequence(len(rows)), strict=True
+        )
+        if old_position != new_position
+    ]
+    if changes:
+        tasks = Task.__table__
+        await db.execute(
+            update(tasks)
+            .where(tasks.c.id == bindparam("b_id"))
+            .values(position=bindparam("b_position")),
+            changes,
+        )
+    return len(changes)
+
+
+async def rebalance_task_column_in_background(project_id: int, task_status: TaskStatus) -> None:
+    """응답 후 별도 세션/트랜잭션에서 컬럼 재배치 (BackgroundTasks용)"""
+    try:
+        async with async_session() as db, db.begin():
+            changed = await rebalance_task_column(db, project_id, task_status)
+        logger.info(
+            "Rebalanced task column project=%s status=%s rows=%s",
+            project_id,
+            task_status.value,
+            changed,
+        )
+    except Exception:
+        logger.exception(
+            "Task column rebalance failed: project=%s status=%s", project_id, task_status.value
+        )
 
 
 async def delete_task(
     db: AsyncSession,
-    task: Task,
+    project_id: int,
+    task_id: int,
 ) -> None:
-    """태스크 삭제"""
-    await db.delete(task)
-    await db.flush()
+    """태스크 삭제 (댓글은 DB의 ON DELETE CASCADE로 삭제)"""
+    result = await db.execute(
+        delete(Task).where(Task.id == task_id, Task.project_id == project_id).returning(Task.id),
+        execution_options={"synchronize_session": False},
+    )
+    if result.scalar_one_or_none() is None:
+        raise _task_not_found()
+
+
+def _id_array(ids: list[int]) -> ColumnElement[list[int]]:
+    return literal(ids, ARRAY(Integer))
+
+
+async def _batch_status_position(
+    db: AsyncSession,
+    project_id: int,
+    new_status: TaskStatus,
+    task_ids: list[int],
+) -> ColumnElement[str]:
+    """task_ids를 요청 순서대로 new_status 컬럼 맨 앞에 둘 rank (이미 그 컬럼이면 그대로)"""
+    first = await db.scalar(
+        select(func.min(Task.position)).where(
+            Task.project_id == project_id, Task.status == new_status
+        )
+    )
+    ranks = (
+        func.unnest(
+            _id_array(task_ids),
+            literal(rank_sequence(len(task_ids), before=first), ARRAY(String)),
+        )
+        .table_valued("id", "position")
+        .render_derived(name="ranks")
+    )
+    return case(
+        (Task.status == new_status, Task.position),
+        else_=select(ranks.c.position).where(ranks.c.id == Task.id).scalar_subquery(),
+    )
+
+
+async def apply_task_batch(
+    db: AsyncSession,
+    project_id: int,
+    data: TaskBatchRequest,
+) -> TaskBatchResponse:
+    """여러 태스크의 수정/삭제를 한 트랜잭션에서 적용 (작업별 결과 반환)
+
+    대상 행을 id 순서로 한 번에 잠근 뒤, 바꿀 값이 같은 수정끼리 묶어
+    UPDATE ... WHERE id = ANY(:ids) AND project_id = :pid RETURNING 한 문장씩,
+    삭제는 DELETE 한 문장으로 처리한다. 없거나 다른 프로젝트의 태스크는 not_found.
+    """
+    operations = data.operations
+    if len(operations) > settings.TASK_BATCH_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"한 번에 {settings.TASK_BATCH_MAX_OPERATIONS}개까지 처리할 수 있습니다.",
+        )
+
+    result = await db.scalars(
+        select(Task.id)
+        .where(
+            Task.project_id == project_id, Task.id == any_(_id_array([o.id for o in operations]))
+        )
+        .order_by(Task.id)
+        .with_for_update()
+    )
+    found = set(result)
+
+    # (필드, 값) 묶음 -> 같은 값으로 바꿀 태스크 id (요청 순서)
+    updates: dict[tuple[tuple[str, Any], ...], list[int]] = {}
+    deletes: list[int] = []
+    for operation in operations:
+        if operation.id not in found:
+            continue
+        if isinstance(operation, TaskBatchDelete):
+            deletes.append(operation.id)
+            continue
+        values = operation.model_dump(exclude_unset=True, exclude={"op", "id"})
+        updates.setdefault(tuple(sorted(values.items())), []).append(operation.id)
+
+    updated: dict[int, Task] = {}
+    for items, task_ids in updates.items():
+        values = dict(items)
+        if "status" in values:
+            values["position"] = await _batch_status_position(
+                db, project_id, values["status"], task_ids
+            )
+        result = await db.scalars(
+            update(Task)
+            .where(Task.id == any_(_id_array(task_ids)), Task.project_id == project_id)
+            .values(**values)
+            .returning(Task),
+            execution_options={"synchronize_session": False, "populate_existing": True},
+        )
+        updated.update((task.id, task) for task in result)
+    if deletes:
+        await db.execute(
+            delete(Task).where(Task.id == any_(_id_array(deletes)), Task.project_id == project_id),
+            execution_options={"synchronize_session": False},
+        )
+
+    results = []
+    for operation in operations:
+        if operation.id not in found:
+            results.append(TaskBatchResult(id=operation.id, op=operation.op, outcome="not_found"))
+        elif operation.op == "delete":
+            results.append(TaskBatchResult(id=operation.id, op=operation.op, outcome="deleted"))
+        else:
+            results.append(
+                TaskBatchResult(
+                    id=operation.id,
+                    op=operation.op,
+                    outcome="updated",
+                    task=TaskResponse.model_validate(updated[operation.id]),
+                )
+            )
+    return TaskBatchResponse(results=results)
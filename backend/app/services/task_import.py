@@ -0,0 +1,309 @@
+"""
+태스크 일괄 가져오기 (CSV / NDJSON)
+
+본문을 스트리밍으로 읽어 IMPORT_CHUNK_SIZE행씩 TaskCreate로 검증하고, 청크에 나온
+담당자의 프로젝트 멤버십을 쿼리 한 번으로 확인한 뒤 통과한 행을 asyncpg COPY로 임시
+스테이징 테이블에 넣는다. 끝까지 읽으면 스테이징 테이블을 INSERT ... SELECT 한 문장으로
+tasks에 합친다 (todo 컬럼 맨 뒤에 파일 순서대로). 모두 호출자의 트랜잭션 안이므로
+중간에 실패하면 아무 행도 남지 않는다. 문제가 있는 행은 건너뛰고 행 번호와 함께 보고한다.
+"""
+
+import codecs
+import csv
+from collections.abc import AsyncIterator
+from typing import Any
+
+import orjson
+from fastapi import HTTPException, status
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    String,
+    any_,
+    column,
+    func,
+    insert,
+    literal,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.ranking import rank_sequence
+from app.models.project import ProjectMember
+from app.models.task import Task, TaskStatus
+from app.schemas.task import TaskCreate, TaskImportError, TaskImportResponse
+
+IMPORT_CHUNK_SIZE = 5000
+MAX_IMPORT_ERRORS = 1000
+# Content-Type -> 형식 (format 파라미터가 없을 때)
+IMPORT_MEDIA_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+# 트랜잭션이 끝나면 사라지는 스테이징 테이블 (순서 번호 seq는 통과한 행에만 1부터)
+STAGING_COLUMNS = ("seq", "title", "description", "priority", "assignee_id")
+_staging = table(
+    "task_import_staging",
+    column("seq", Integer),
+    column("title", String),
+    column("description", String),
+    column("priority", String),
+    column("assignee_id", Integer),
+)
+_CREATE_STAGING = text(
+    "CREATE TEMPORARY TABLE task_import_staging ("
+    "seq integer PRIMARY KEY, title text NOT NULL, description text NOT NULL, "
+    "priority text NOT NULL, assignee_id integer) ON COMMIT DROP"
+)
+
+# (데이터 행 번호, 필드 dict 또는 행 형식 오류 메시지)
+ImportRecord = tuple[int, dict[str, Any] | str]
+
+_task_list_adapter = TypeAdapter(list[TaskCreate])
+
+
+def resolve_import_format(import_format: str | None, content_type: str | None) -> str:
+    """format 파라미터, 없으면 Content-Type으로 형식 결정 (모르면 415)"""
+    if import_format is not None:
+        return import_format
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in IMPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="text/csv 또는 application/x-ndjson 본문만 가져올 수 있습니다.",
+        )
+    return IMPORT_MEDIA_TYPES[media_type]
+
+
+async def _text_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """바이트 조각 -> 줄 (UTF-8, BOM과 줄 끝 \\r 제거)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+async def _csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRecord]:
+    """헤더 행의 컬럼 이름으로 dict (빈 칸은 생략해 기본값 적용)"""
+    header: list[str] | None = None
+    lines: list[str] = []
+    quotes = 0
+    row = 0
+    async for line in _text_lines(chunks):
+        lines.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            # 따옴표 안의 줄바꿈: 따옴표가 닫힐 때까지 한 레코드
+            continue
+        values = next(csv.reader(["\n".join(lines)]), [])
+        lines, quotes = [], 0
+        if not values:
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, "컬럼 수가 헤더와 다릅니다."
+            continue
+        yield row, {name: value for name, value in zip(header, values, strict=True) if value}
+    if lines:
+        yield row + 1, "닫히지 않은 따옴표가 있습니다."
+
+
+async def _ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRecord]:
+    """한 줄에 JSON 객체 하나 (빈 줄은 건너뜀)"""
+    row = 0
+    async for line in _text_lines(chunks):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            values = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield row, "JSON 형식이 올바르지 않습니다."
+            continue
+        if not isinstance(values, dict):
+            yield row, "JSON 객체가 아닙니다."
+            continue
+        yield row, values
+
+
+async def _batched(
+    records: AsyncIterator[ImportRecord], size: int
+) -> AsyncIterator[list[ImportRecord]]:
+    batch: list[ImportRecord] = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _validate(
+    chunk: list[ImportRecord],
+) -> tuple[list[tuple[int, TaskCreate]], list[TaskImportError]]:
+    """
+    청크를 list[TaskCreate]로 한 번에 검증 (통과한 행, 행 오류)
+
+    오류가 있으면 오류 위치(loc[0])의 행을 빼고 나머지만 다시 한 번 검증한다.
+    """
+    errors = [
+        TaskImportError(row=row, field=None, message=values)
+        for row, values in chunk
+        if isinstance(values, str)
+    ]
+    records = [(row, values) for row, values in chunk if not isinstance(values, str)]
+    try:
+        tasks = _task_list_adapter.validate_python([values for _, values in records])
+    except ValidationError as exc:
+        invalid = set()
+        for error in exc.errors():
+            index, *field = error["loc"]
+            invalid.add(index)
+            errors.append(
+                TaskImportError(
+                    row=records[index][0],
+                    field=".".join(str(part) for part in field) or None,
+                    message=error["msg"],
+                )
+            )
+        records = [record for index, record in enumerate(records) if index not in invalid]
+        tasks = _task_list_adapter.validate_python([values for _, values in records])
+    return [(row, task) for (row, _), task in zip(records, tasks, strict=True)], errors
+
+
+async def _project_members(db: AsyncSession, project_id: int, user_ids: set[int]) -> set[int]:
+    """user_ids 중 프로젝트 멤버 (= ANY(:ids) 쿼리 한 번)"""
+    result = await db.scalars(
+        select(ProjectMember.user_id).where(
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id == any_(literal(sorted(user_ids), ARRAY(Integer))),
+        )
+    )
+    return set(result)
+
+
+async def _copy_to_staging(db: AsyncSession, records: list[tuple[Any, ...]]) -> None:
+    """asyncpg COPY로 스테이징 테이블에 적재 (세션의 연결/트랜잭션 그대로)"""
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "task_import_staging", records=records, columns=STAGING_COLUMNS
+    )
+
+
+async def _merge_staging(db: AsyncSession, project_id: int, count: int) -> None:
+    """스테이징 행을 todo 컬럼 맨 뒤에 seq 순서대로 INSERT ... SELECT (문장 하나)"""
+    last = await db.scalar(
+        select(func.max(Task.position)).where(
+            Task.project_id == project_id, Task.status == TaskStatus.todo
+        )
+    )
+    ranks = (
+        func.unnest(literal(rank_sequence(count, after=last), ARRAY(String)))
+        .table_valued("position", with_ordinality="seq")
+        .render_derived(name="ranks")
+    )
+    await db.execute(
+        insert(Task).from_select(
+            ["title", "description", "priority", "assignee_id", "project_id", "status", "position"],
+            select(
+                _staging.c.title,
+                _staging.c.description,
+                _staging.c.priority,
+                _staging.c.assignee_id,
+                literal(project_id),
+                literal(TaskStatus.todo, Task.status.type),
+                ranks.c.position,
+            )
+            .join(ranks, ranks.c.seq == _staging.c.seq)
+            .order_by(_staging.c.seq),
+        )
+    )
+
+
+async def import_tasks(
+    db: AsyncSession,
+    project_id: int,
+    chunks: AsyncIterator[bytes],
+    import_format: str,
+    dry_run: bool = False,
+) -> TaskImportResponse:
+    """
+    CSV/NDJSON 본문의 태스크를 한 트랜잭션으로 가져오기 (커밋은 호출자)
+
+    dry_run이면 검증과 멤버십 확인만 하고 쓰지 않는다. 전체 행 수가
+    TASK_IMPORT_MAX_ROWS를 넘으면 413.
+    """
+    records = _csv_records(chunks) if import_format == "csv" else _ndjson_records(chunks)
+    errors: list[TaskImportError] = []
+    failed = 0
+    staged = 0
+    total = 0
+    # 이미 확인한 담당자 id -> 멤버 여부 (청크마다 새로 나온 id만 조회)
+    assignees: dict[int, bool] = {}
+
+    if not dry_run:
+        await db.execute(_CREATE_STAGING)
+    try:
+        async for chunk in _batched(records, IMPORT_CHUNK_SIZE):
+            total += len(chunk)
+            if total > settings.TASK_IMPORT_MAX_ROWS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"한 번에 {settings.TASK_IMPORT_MAX_ROWS}행까지 가져올 수 있습니다.",
+                )
+
+            valid, chunk_errors = _validate(chunk)
+            unknown = {task.assignee_id for _, task in valid} - assignees.keys() - {None}
+            if unknown:
+                members = await _project_members(db, project_id, unknown)
+                assignees.update((user_id, user_id in members) for user_id in unknown)
+            rows = []
+            for row, task in valid:
+                if task.assignee_id is not None and not assignees[task.assignee_id]:
+                    chunk_errors.append(
+                        TaskImportError(
+                            row=row,
+                            field="assignee_id",
+                            message="담당자가 프로젝트 멤버가 아닙니다.",
+                        )
+                    )
+                    continue
+                staged += 1
+                rows.append(
+                    (staged, task.title, task.description, task.priority.name, task.assignee_id)
+                )
+
+            failed += len({error.row for error in chunk_errors})
+            chunk_errors.sort(key=lambda error: error.row)
+            errors.extend(chunk_errors[: MAX_IMPORT_ERRORS - len(errors)])
+            if rows and not dry_run:
+                await _copy_to_staging(db, rows)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="본문이 UTF-8이 아닙니다.",
+        ) from None
+
+    if not dry_run:
+        if staged:
+            await _merge_staging(db, project_id, staged)
+        # 같은 트랜잭션에서 다시 가져올 수 있도록 바로 지운다
+        await db.execute(text("DROP TABLE task_import_staging"))
+    return TaskImportResponse(imported=staged, failed=failed, errors=errors, dry_run=dry_run)
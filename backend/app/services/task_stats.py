@@ -0,0 +1,88 @@
+"""
+프로젝트별 태스크 수 집계(project_task_stats) 점검/복구
+
+평소에는 tasks 트리거가 집계를 유지하므로 여기 함수들은 운영 점검용이다.
+tasks 전체를 다시 세므로 요청 경로에서 호출하지 않는다.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project, ProjectTaskStats
+from app.models.task import Task, TaskPriority, TaskStatus
+
+# 집계 컬럼 -> tasks 조건
+COUNT_COLUMNS = {
+    **{f"{s.value}_count": Task.status == s for s in TaskStatus},
+    **{f"{p.value}_count": Task.priority == p for p in TaskPriority},
+}
+
+
+@dataclass
+class TaskStatsDrift:
+    project_id: int
+    # 컬럼별 (저장된 값, 실제 값). 집계 행이 없으면 저장된 값은 None
+    columns: dict[str, tuple[int | None, int]]
+
+
+async def find_task_stats_drift(db: AsyncSession) -> list[TaskStatsDrift]:
+    """tasks를 다시 세어 집계 행과 다른 프로젝트 목록 (한 스냅샷의 쿼리 한 번)"""
+    actual = (
+        select(
+            Project.id.label("project_id"),
+            *[func.count(Task.id).filter(cond).label(name) for name, cond in COUNT_COLUMNS.items()],
+        )
+        .outerjoin(Task, Task.project_id == Project.id)
+        .group_by(Project.id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(actual, ProjectTaskStats)
+        .outerjoin(ProjectTaskStats, ProjectTaskStats.project_id == actual.c.project_id)
+        .order_by(actual.c.project_id)
+    )
+
+    drift = []
+    for row in result:
+        stats = row.ProjectTaskStats
+        columns = {
+            name: (None if stats is None else getattr(stats, name), row._mapping[name])
+            for name in COUNT_COLUMNS
+        }
+        columns = {name: pair for name, pair in columns.items() if pair[0] != pair[1]}
+        if columns:
+            drift.append(TaskStatsDrift(project_id=row.project_id, columns=columns))
+    return drift
+
+
+async def repair_task_stats(db: AsyncSession) -> list[TaskStatsDrift]:
+    """
+    어긋난 집계 행을 실제 값으로 덮어쓰고 고친 목록을 반환 (커밋은 호출자)
+
+    다시 세는 동안 커밋된 태스크 쓰기가 덮어쓰여 사라지지 않도록 tasks를
+    SHARE 모드로 잠근다 (조회는 가능, 쓰기는 커밋까지 대기).
+    """
+    await db.execute(text("LOCK TABLE tasks IN SHARE MODE"))
+    drift = await find_task_stats_drift(db)
+    if not drift:
+        return drift
+
+    rows = [
+        {"project_id": d.project_id} | {name: actual for name, (_, actual) in d.columns.items()}
+        for d in drift
+    ]
+    for row in rows:
+        statement = insert(ProjectTaskStats).values(row)
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ProjectTaskStats.project_id],
+                set_={
+                    **{name: statement.excluded[name] for name in row if name != "project_id"},
+                    "updated_at": func.now(),
+                },
+            )
+        )
+    return drift
@@ -1,10 +1,24 @@
+from functools import partial
+
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import object_session
 
-from app.core.security import hash_password, verify_password
+from app.core.cache import (
+    evict_after_commit,
+    invalidate_principal,
+    principal_cache,
+    shared_cache,
+)
+from app.core.security import (
+    PasswordHasherBusyError,
+    hash_password_async,
+    verify_password_async,
+)
 from app.models.user import User
-from app.schemas.user import UserRegister
+from app.schemas.auth import Principal
+from app.schemas.user import UserRegister, UserResponse
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
@@ -13,10 +27,63 @@ async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
     return result.scalar_one_or_none()
 
 
+def _user_key(user_id: int) -> str:
+    return shared_cache.key("user", user_id)
+
+
 async def get_user_by_id(db: AsyncSession, user_id: int) -> User | None:
-    """ID로 사용자 조회"""
-    result = await db.execute(select(User).where(User.id == user_id))
-    return result.scalar_one_or_none()
+    """
+    ID로 사용자 조회 (공유 캐시 우선)
+
+    캐시에는 UserResponse 필드만 담으므로 돌려주는 User에는 hashed_password가 없다.
+    비밀번호 확인은 get_user_by_email로 읽은 사용자로 한다.
+    """
+
+    async def load() -> dict | None:
+        result = await db.execute(
+            select(User.id, User.email, User.name, User.created_at).where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        return None if row is None else UserResponse.model_validate(row).model_dump(mode="json")
+
+    values = await shared_cache.get_or_load(db, _user_key(user_id), load)
+    if values is None:
+        return None
+    return User(**UserResponse.model_validate(values).model_dump())
+
+
+async def get_principal_by_id(db: AsyncSession, user_id: int) -> Principal | None:
+    """ID로 principal 조회 (캐시 우선, hashed_password 등은 읽지 않음)"""
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    result = await db.execute(select(User.id, User.email, User.name).where(User.id == user_id))
+    row = result.one_or_none()
+    if row is None:
+        return None
+    principal = Principal.model_validate(row)
+    principal_cache.set(user_id, principal)
+    return principal
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user_principal(mapper, connection, target: User) -> None:
+    session = object_session(target)
+    if session is None:
+        invalidate_principal(target.id)
+        return
+    evict_after_commit(session, partial(invalidate_principal, target.id))
+    shared_cache.invalidate(session, _user_key(target.id))
+
+
+def _password_hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청이 많아 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "1"},
+    )
 
 
 async def create_user(db: AsyncSession, user_data: UserRegister) -> User:
@@ -30,7 +97,10 @@ async def create_user(db: AsyncSession, user_data: UserRegister) -> User:
         )
 
     # 비밀번호 해싱
-    hashed_password = hash_password(user_data.password)
+    try:
+        hashed_password = await hash_password_async(user_data.password)
+    except PasswordHasherBusyError:
+        raise _password_hasher_busy() from None
 
     # 사용자 생성
     user = User(
@@ -50,6 +120,10 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> User
     user = await get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    try:
+        verified = await verify_password_async(password, user.hashed_password)
+    except PasswordHasherBusyError:
+        raise _password_hasher_busy() from None
+    if not verified:
         return None
     return user
@@ -1,17 +1,42 @@
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.pool import NullPool
 
+from app.core.cache import (
+    MemoryBackend,
+    coalesced_reads,
+    membership_cache,
+    principal_cache,
+    shared_cache,
+    token_cache,
+)
 from app.core.config import settings
-from app.core.dependencies import get_db
+from app.core.database import engine
+from app.core.dependencies import get_db, get_session_factory
 from app.core.security import create_access_token, hash_password
 from app.main import app
 from app.models.project import Project, ProjectMember, ProjectRole
 from app.models.task import Task
 from app.models.user import User
 
+# 기본값(CACHE_BACKEND=none)에서도 캐시 경로를 검증하도록 테스트는 프로세스 내 백엔드를 쓴다
+if shared_cache.backend is None:
+    shared_cache.backend = MemoryBackend(maxsize=settings.CACHE_MAX_ENTRIES)
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """프로세스 로컬 캐시가 테스트 간에 공유되지 않도록 비운다"""
+    for cache in (membership_cache, principal_cache, token_cache):
+        cache.clear()
+    if isinstance(shared_cache.backend, MemoryBackend):
+        shared_cache.backend.clear()
+    coalesced_reads.reset_stats()
+    yield
+
 
 @pytest_asyncio.fixture
 async def db_session():
@@ -35,6 +60,23 @@ async def db_session():
     await engine.dispose()
 
 
+@pytest.fixture
+def query_counter(db_session: AsyncSession):
+    """
+    db_session에서 실행되는 SQL 문을 기록한다.
+    statements.clear()로 구간을 나눠 요청별 쿼리 수를 확인할 수 있다.
+    """
+    statements: list[str] = []
+    sync_engine = db_session.bind.sync_engine
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest_asyncio.fixture
 async def client(db_session: AsyncSession) -> AsyncClient:
     """테스트용 클라이언트 (get_db를 테스트 세션으로 override)"""
@@ -43,6 +85,10 @@ async def client(db_session: AsyncSession) -> AsyncClient:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # 스트리밍 응답도 테스트 트랜잭션의 연결에서 읽는다 (롤백 전 데이터가 보이도록)
+    app.dependency_overrides[get_session_factory] = lambda: lambda: AsyncSession(
+        bind=db_session.bind, expire_on_commit=False
+    )
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -51,6 +97,9 @@ async def client(db_session: AsyncSession) -> AsyncClient:
         yield ac
 
     app.dependency_overrides.clear()
+    # BackgroundTasks는 앱의 기본 엔진으로 별도 세션을 연다. 테스트마다 이벤트 루프가
+    # 다르므로 이 테스트 루프에서 만든 연결을 풀에 남기지 않는다
+    await engine.dispose()
 
 
 @pytest_asyncio.fixture
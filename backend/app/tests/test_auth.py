@@ -2,7 +2,9 @@ from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import principal_cache
 from app.models.user import User
+from app.services.user import get_principal_by_id
 
 
 class TestRegister:
@@ -222,3 +224,50 @@ class TestAuthIntegration:
         assert me_data["email"] == "flowtest@example.com"
         assert me_data["name"] == "Flow Test User"
         assert me_data["id"] == user_data["id"]
+
+
+class TestPrincipalCache:
+    """principal 캐시 테스트"""
+
+    async def test_principal_lookup_skips_users_table_when_cached(
+        self, client: AsyncClient, auth_headers: dict, query_counter: list[str]
+    ):
+        """두 번째 요청부터는 users 테이블을 조회하지 않음"""
+        await client.get("/api/v1/projects/", headers=auth_headers)
+        assert any("FROM users" in sql for sql in query_counter)
+        assert not any("hashed_password" in sql for sql in query_counter)
+
+        query_counter.clear()
+        response = await client.get("/api/v1/projects/", headers=auth_headers)
+        assert response.status_code == 200
+        assert not any("FROM users" in sql for sql in query_counter)
+
+    async def test_principal_invalidated_on_user_update(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """사용자 정보가 바뀌면 캐시된 principal 제거"""
+        principal = await get_principal_by_id(db_session, test_user.id)
+        assert principal is not None
+        assert principal_cache.get(test_user.id) == principal
+
+        test_user.name = "Renamed User"
+        await db_session.flush()
+        assert principal_cache.get(test_user.id) is None
+
+        principal = await get_principal_by_id(db_session, test_user.id)
+        assert principal.name == "Renamed User"
+
+    async def test_principal_evicted_again_after_commit(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """flush와 커밋 사이에 다른 요청이 이전 값을 채워도 커밋 후 다시 제거"""
+        stale = await get_principal_by_id(db_session, test_user.id)
+        async with AsyncSession(bind=db_session.bind) as session:
+            user = await session.get(User, test_user.id)
+            user.name = "Renamed User"
+            await session.flush()
+            assert principal_cache.get(test_user.id) is None
+
+            principal_cache.set(test_user.id, stale)
+            await session.commit()
+        assert principal_cache.get(test_user.id) is None
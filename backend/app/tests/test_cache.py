@@ -0,0 +1,405 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import (
+    MemoryBackend,
+    RedisBackend,
+    SharedCache,
+    SingleFlight,
+    shared_cache,
+    wait_for_invalidations,
+)
+from app.models.project import ProjectMember
+
+BASE = "/api/v1/projects"
+
+
+class FakeRedisServer:
+    """테스트용 Redis 프로토콜 서버 (AUTH/SELECT/MGET/SET PX NX/DEL만 지원)"""
+
+    def __init__(self, password: str | None = None) -> None:
+        self.password = password
+        self.data: dict[bytes, tuple[float, bytes]] = {}
+        self.commands: list[list[bytes]] = []
+        self.connections = 0
+        self.paused = False
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}127.0.0.1:{self.port}/2"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        authenticated = self.password is None
+        while line := await reader.readline():
+            args = []
+            for _ in range(int(line[1:-2])):
+                length = int((await reader.readline())[1:-2])
+                args.append((await reader.readexactly(length + 2))[:-2])
+            self.commands.append(args)
+            while self.paused:
+                await asyncio.sleep(0.01)
+            if args[0] == b"AUTH":
+                authenticated = args[-1].decode() == self.password
+                writer.write(b"+OK\r\n" if authenticated else b"-WRONGPASS invalid password\r\n")
+            elif not authenticated:
+                writer.write(b"-NOAUTH Authentication required.\r\n")
+            else:
+                writer.write(self._execute(args))
+            await writer.drain()
+        writer.close()
+
+    def _get(self, key: bytes) -> bytes | None:
+        entry = self.data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self.data.pop(key, None)
+            return None
+        return entry[1]
+
+    def _execute(self, args: list[bytes]) -> bytes:
+        command, *rest = args
+        if command == b"SELECT":
+            return b"+OK\r\n"
+        if command == b"MGET":
+            values = [self._get(key) for key in rest]
+            return b"*%d\r\n" % len(values) + b"".join(
+                b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+                for value in values
+            )
+        if command == b"SET":
+            key, value, _, ttl_ms, *flags = rest
+            if b"NX" in flags and self._get(key) is not None:
+                return b"$-1\r\n"
+            self.data[key] = (time.monotonic() + int(ttl_ms) / 1000, value)
+            return b"+OK\r\n"
+        if command == b"DEL":
+            return b":%d\r\n" % sum(self.data.pop(key, None) is not None for key in rest)
+        return b"-ERR unknown command\r\n"
+
+
+@pytest_asyncio.fixture
+async def redis_server():
+    server = FakeRedisServer(password="s3cret")
+    await server.start()
+    yield server
+    await server.stop()
+
+
+class TestRedisBackend:
+    @pytest.mark.asyncio
+    async def test_commands(self, redis_server: FakeRedisServer):
+        backend = RedisBackend(redis_server.url, pool_size=2)
+        try:
+            await backend.set("a", b"1", ttl=60)
+            assert await backend.add("a", b"2", ttl=60) is False
+            assert await backend.add("b", b"", ttl=60) is True
+            assert await backend.get_many(["a", "b", "c"]) == [b"1", b"", None]
+            await backend.delete(["a", "b"])
+            assert await backend.get_many(["a", "b"]) == [None, None]
+
+            await backend.set("short", b"x", ttl=0.05)
+            await asyncio.sleep(0.1)
+            assert await backend.get_many(["short"]) == [None]
+        finally:
+            await backend.close()
+        # 연결 하나를 재사용하고, 연결할 때 인증 후 DB를 선택한다
+        assert redis_server.connections == 1
+        assert redis_server.commands[:2] == [[b"AUTH", b"s3cret"], [b"SELECT", b"2"]]
+
+    @pytest.mark.asyncio
+    async def test_wrong_password(self, redis_server: FakeRedisServer):
+        cache = SharedCache(RedisBackend(redis_server.url), prefix="t", ttl=60)
+        redis_server.password = "other"
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return {"value": calls}
+
+        session = AsyncSession()
+        # 캐시 서버 오류는 캐시 없음과 같다
+        assert await cache.get_or_load(session, "k", loader) == {"value": 1}
+        assert await cache.get_or_load(session, "k", loader) == {"value": 2}
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_falls_back_to_loader(self, redis_server: FakeRedisServer):
+        backend = RedisBackend(redis_server.url, timeout=0.05)
+        cache = SharedCache(backend, prefix="t", ttl=60)
+        redis_server.password = None
+        redis_server.paused = True
+
+        async def loader():
+            return [1, 2]
+
+        start = time.monotonic()
+        assert await cache.get_or_load(AsyncSession(), "k", loader) == [1, 2]
+        assert time.monotonic() - start < 1
+        redis_server.paused = False
+        await cache.close()
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_same_key_share_one_load(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return [calls]
+
+        results = await asyncio.gather(*(flights.do(("tasks", 1), loader) for _ in range(10)))
+        assert calls == 1
+        # 모두 같은 결과 객체를 받는다
+        assert all(result is results[0] for result in results)
+        assert flights.snapshot() == {"hits": 9, "misses": 1, "failures": 0, "inflight": 0}
+
+        # 끝난 결과는 저장하지 않는다
+        assert await flights.do(("tasks", 1), loader) == [2]
+
+    @pytest.mark.asyncio
+    async def test_different_keys_load_separately(self):
+        flights = SingleFlight()
+
+        async def loader(value):
+            await asyncio.sleep(0.02)
+            return value
+
+        results = await asyncio.gather(
+            flights.do(("tasks", 1, 7), lambda: loader("a")),
+            flights.do(("tasks", 1, 8), lambda: loader("b")),
+        )
+        assert results == ["a", "b"]
+        assert flights.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_is_not_shared(self):
+        flights = SingleFlight()
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def own():
+            return "own"
+
+        leader = asyncio.create_task(flights.do("k", slow))
+        await started.wait()
+        waiter = asyncio.create_task(flights.do("k", own))
+        await asyncio.sleep(0)
+        leader.cancel()
+        # 기다리던 요청은 취소를 넘겨받지 않고 자기 조회로 읽는다
+        assert await waiter == "own"
+        assert flights.snapshot() == {"hits": 0, "misses": 1, "failures": 1, "inflight": 0}
+
+
+class TestSharedCache:
+    def make_cache(self, backend=None) -> SharedCache:
+        return SharedCache(backend or MemoryBackend(maxsize=100), prefix="test", ttl=60)
+
+    def test_key_scheme(self):
+        assert self.make_cache().key("project", 42) == "test:v1:project:42"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        cache = self.make_cache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"id": 1}
+
+        results = await asyncio.gather(
+            *(cache.get_or_load(AsyncSession(), "k", loader) for _ in range(20))
+        )
+        assert results == [{"id": 1}] * 20
+        assert calls == 1
+        assert await cache.get_or_load(AsyncSession(), "k", loader) == {"id": 1}
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_workers_share_fill_lock(self, redis_server: FakeRedisServer):
+        """같은 Redis를 쓰는 두 워커가 동시에 놓쳐도 DB 조회는 한 번"""
+        redis_server.password = None
+        workers = [self.make_cache(RedisBackend(redis_server.url)) for _ in range(2)]
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.1)
+            return "value"
+
+        results = await asyncio.gather(
+            *(worker.get_or_load(AsyncSession(), "k", loader) for worker in workers)
+        )
+        assert results == ["value", "value"]
+        assert calls == 1
+        for worker in workers:
+            await worker.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_shared(self):
+        cache = self.make_cache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            if calls == 1:
+                raise RuntimeError("db down")
+            return calls
+
+        first, second = await asyncio.gather(
+            cache.get_or_load(AsyncSession(), "k", loader),
+            cache.get_or_load(AsyncSession(), "k", loader),
+            return_exceptions=True,
+        )
+        assert isinstance(first, RuntimeError)
+        # 기다리던 요청은 자기 조회로 다시 읽는다
+        assert second == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_waits_for_commit(self, db_session: AsyncSession):
+        cache = self.make_cache()
+
+        async def stale():
+            return "old"
+
+        async def fresh():
+            return "new"
+
+        assert await cache.get_or_load(db_session, "k", stale) == "old"
+
+        # 커밋 전: 이 세션은 캐시를 건너뛰고, 다른 세션은 커밋된 값(캐시)을 계속 읽는다
+        cache.invalidate(db_session, "k")
+        assert await cache.get_or_load(db_session, "k", fresh) == "new"
+        assert await cache.get_or_load(AsyncSession(), "k", fresh) == "old"
+
+        await cache.delete(["k"])
+        # 무효화 직후에는 커밋 전에 읽은 예전 값이 다시 채워지지 않는다
+        assert await cache.fill(AsyncSession(), "k", "old") is False
+        assert await cache.get_or_load(AsyncSession(), "k", fresh) == "new"
+
+    @pytest.mark.asyncio
+    async def test_after_commit_hook(self, db_session: AsyncSession, monkeypatch):
+        deleted: list[list[str]] = []
+
+        async def record(keys):
+            deleted.append(list(keys))
+
+        monkeypatch.setattr(shared_cache, "delete", record)
+        async with AsyncSession(bind=db_session.bind) as session:
+            shared_cache.invalidate(session, "a", "b")
+            await session.commit()
+            await wait_for_invalidations(session)
+
+            shared_cache.invalidate(session, "c")
+            await session.rollback()
+            await wait_for_invalidations(session)
+        assert deleted == [["a", "b"]]
+
+
+class TestSharedCacheWiring:
+    @pytest.mark.asyncio
+    async def test_project_detail_members_cached(
+        self, client: AsyncClient, auth_headers, test_project, query_counter
+    ):
+        url = f"{BASE}/{test_project.id}"
+        await client.get(url, headers=auth_headers)
+
+        query_counter.clear()
+        response = await client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        assert len(response.json()["members"]) == 1
+        # 멤버십 확인만 (principal 캐시, 멤버 목록은 공유 캐시)
+        assert len(query_counter) == 1
+        assert "JOIN project_members" in query_counter[0]
+
+    @pytest.mark.asyncio
+    async def test_add_member_invalidates(
+        self, client: AsyncClient, auth_headers, test_project, other_user
+    ):
+        url = f"{BASE}/{test_project.id}"
+        await client.get(url, headers=auth_headers)
+        await client.post(f"{url}/members", json={"user_id": other_user.id}, headers=auth_headers)
+        response = await client.get(url, headers=auth_headers)
+        assert {m["user_id"] for m in response.json()["members"]} == {
+            test_project.owner_id,
+            other_user.id,
+        }
+
+    @pytest.mark.asyncio
+    async def test_project_list_cached(
+        self, client: AsyncClient, auth_headers, test_project, test_task, query_counter
+    ):
+        first = (await client.get(f"{BASE}/", headers=auth_headers)).json()
+
+        query_counter.clear()
+        second = (await client.get(f"{BASE}/", headers=auth_headers)).json()
+        assert second == first
+        assert second[0]["task_stats"]["total_count"] == 1
+        # 태스크 수만 DB에서 읽는다
+        assert len(query_counter) == 1
+        assert "FROM project_task_stats" in query_counter[0]
+
+        await client.put(
+            f"{BASE}/{test_project.id}", json={"name": "Renamed"}, headers=auth_headers
+        )
+        renamed = (await client.get(f"{BASE}/", headers=auth_headers)).json()
+        assert renamed[0]["name"] == "Renamed"
+
+    @pytest.mark.asyncio
+    async def test_new_project_appears_in_list(self, client: AsyncClient, auth_headers):
+        assert (await client.get(f"{BASE}/", headers=auth_headers)).json() == []
+        await client.post(f"{BASE}/", json={"name": "Fresh"}, headers=auth_headers)
+        names = [p["name"] for p in (await client.get(f"{BASE}/", headers=auth_headers)).json()]
+        assert names == ["Fresh"]
+
+    @pytest.mark.asyncio
+    async def test_deleted_project_leaves_member_lists(
+        self,
+        client: AsyncClient,
+        auth_headers,
+        other_auth_headers,
+        test_project,
+        other_user,
+        db_session,
+    ):
+        db_session.add(ProjectMember(user_id=other_user.id, project_id=test_project.id))
+        await db_session.flush()
+        assert len((await client.get(f"{BASE}/", headers=other_auth_headers)).json()) == 1
+
+        response = await client.delete(f"{BASE}/{test_project.id}", headers=auth_headers)
+        assert response.status_code == 202
+        assert (await client.get(f"{BASE}/", headers=other_auth_headers)).json() == []
+
+    @pytest.mark.asyncio
+    async def test_me_cached(self, client: AsyncClient, auth_headers, test_user, query_counter):
+        await client.get("/api/v1/auth/me", headers=auth_headers)
+        query_counter.clear()
+        response = await client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.json()["email"] == test_user.email
+        assert query_counter == []
@@ -0,0 +1,132 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from app.models.project import Project, ProjectMember, ProjectRole
+from app.models.task import Task, TaskPriority, TaskStatus
+
+URL = "/api/v1/dashboard"
+
+
+async def make_project(db_session, owner_id: int, name: str) -> Project:
+    project = Project(name=name, owner_id=owner_id)
+    db_session.add(project)
+    await db_session.flush()
+    db_session.add(ProjectMember(user_id=owner_id, project_id=project.id, role=ProjectRole.owner))
+    await db_session.flush()
+    return project
+
+
+class TestDashboard:
+    @pytest_asyncio.fixture
+    async def tasks(self, db_session, test_project, test_user, other_user):
+        """test_project: todo 2, in_progress 1, done 1 (나에게 배정된 미완료 2개)"""
+        tasks = [
+            Task(title="a", project_id=test_project.id, assignee_id=test_user.id),
+            Task(
+                title="b",
+                project_id=test_project.id,
+                assignee_id=test_user.id,
+                status=TaskStatus.in_progress,
+                priority=TaskPriority.critical,
+            ),
+            Task(title="c", project_id=test_project.id, assignee_id=other_user.id),
+            Task(
+                title="d",
+                project_id=test_project.id,
+                assignee_id=test_user.id,
+                status=TaskStatus.done,
+            ),
+        ]
+        db_session.add_all(tasks)
+        await db_session.flush()
+        return tasks
+
+    @pytest.mark.asyncio
+    async def test_project_counts(
+        self, client: AsyncClient, auth_headers: dict, test_project, tasks
+    ):
+        response = await client.get(URL, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+
+        [project] = data["projects"]
+        assert project["id"] == test_project.id
+        assert project["name"] == test_project.name
+        assert project["todo_count"] == 2
+        assert project["in_progress_count"] == 1
+        assert project["done_count"] == 1
+        assert project["total_count"] == 4
+        assert project["completion_ratio"] == 0.25
+        assert project["assigned_open_count"] == 2
+        assert data["totals"] == {
+            "project_count": 1,
+            "todo_count": 2,
+            "in_progress_count": 1,
+            "done_count": 1,
+            "total_count": 4,
+            "assigned_open_count": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_assigned_open_tasks(
+        self, client: AsyncClient, auth_headers: dict, test_project, tasks
+    ):
+        response = await client.get(URL, headers=auth_headers)
+        assigned = response.json()["assigned_tasks"]
+        # 완료/다른 사람 태스크 제외, 우선순위 높은 순
+        assert [t["title"] for t in assigned] == ["b", "a"]
+        assert assigned[0]["project_name"] == test_project.name
+
+    @pytest.mark.asyncio
+    async def test_empty_project(self, client: AsyncClient, auth_headers: dict, test_project):
+        data = (await client.get(URL, headers=auth_headers)).json()
+        assert data["projects"][0]["total_count"] == 0
+        assert data["projects"][0]["completion_ratio"] == 0.0
+        assert data["assigned_tasks"] == []
+
+    @pytest.mark.asyncio
+    async def test_excludes_other_projects(
+        self, client: AsyncClient, auth_headers: dict, db_session, test_user, other_user, tasks
+    ):
+        """멤버가 아닌 프로젝트는 집계하지 않고, 배정된 태스크가 있어도 보여주지 않는다"""
+        foreign = await make_project(db_session, other_user.id, "Foreign")
+        db_session.add(Task(title="x", project_id=foreign.id, assignee_id=test_user.id))
+        await db_session.flush()
+
+        data = (await client.get(URL, headers=auth_headers)).json()
+        assert foreign.id not in [p["id"] for p in data["projects"]]
+        assert "x" not in [t["title"] for t in data["assigned_tasks"]]
+
+    @pytest.mark.asyncio
+    async def test_assigned_limit(self, client: AsyncClient, auth_headers: dict, tasks):
+        response = await client.get(URL, params={"assigned_limit": 1}, headers=auth_headers)
+        assert [t["title"] for t in response.json()["assigned_tasks"]] == ["b"]
+        assert response.json()["totals"]["assigned_open_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unauthenticated(self, client: AsyncClient):
+        response = await client.get(URL)
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("project_count", [1, 10])
+    async def test_constant_query_count(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        db_session,
+        test_user,
+        query_counter,
+        project_count,
+    ):
+        for i in range(project_count):
+            project = await make_project(db_session, test_user.id, f"P{i}")
+            db_session.add(Task(title="t", project_id=project.id, assignee_id=test_user.id))
+        await db_session.flush()
+
+        query_counter.clear()
+        response = await client.get(URL, headers=auth_headers)
+        assert len(response.json()["projects"]) == project_count
+        # 사용자 + 프로젝트 집계 + 배정 태스크
+        assert len(query_counter) == 3
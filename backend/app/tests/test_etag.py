@@ -0,0 +1,129 @@
+"""
+프로젝트 version 기반 ETag / If-None-Match 테스트
+"""
+
+import pytest
+from httpx import AsyncClient
+
+BASE = "/api/v1/projects"
+
+
+def urls(project_id: int, task_id: int) -> list[str]:
+    return [
+        f"{BASE}/{project_id}",
+        f"{BASE}/{project_id}/tasks",
+        f"{BASE}/{project_id}/board",
+        f"{BASE}/{project_id}/tasks/{task_id}/comments",
+    ]
+
+
+class TestProjectETag:
+    @pytest.mark.asyncio
+    async def test_not_modified_after_membership_check_only(
+        self, client: AsyncClient, auth_headers, test_project, test_task, query_counter
+    ):
+        for url in urls(test_project.id, test_task.id):
+            response = await client.get(url, headers=auth_headers)
+            assert response.status_code == 200
+            etag = response.headers["etag"]
+            assert etag.startswith('W/"')
+
+            query_counter.clear()
+            response = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+            # 멤버십 확인(프로젝트 포함)만 하고 tasks/comments는 조회하지 않는다
+            assert not any("FROM tasks" in q or "FROM comments" in q for q in query_counter)
+
+    @pytest.mark.asyncio
+    async def test_strong_and_list_if_none_match(
+        self, client: AsyncClient, auth_headers, test_project, test_task
+    ):
+        url = f"{BASE}/{test_project.id}/tasks"
+        etag = (await client.get(url, headers=auth_headers)).headers["etag"]
+        strong = etag.removeprefix("W/")
+        for header in (strong, f'W/"other", {etag}', "*"):
+            response = await client.get(url, headers={**auth_headers, "If-None-Match": header})
+            assert response.status_code == 304, header
+
+    @pytest.mark.asyncio
+    async def test_mutations_change_etag(
+        self, client: AsyncClient, auth_headers, test_project, test_task, other_user
+    ):
+        project_url = f"{BASE}/{test_project.id}"
+        tasks_url = f"{project_url}/tasks"
+
+        async def etag() -> str:
+            return (await client.get(tasks_url, headers=auth_headers)).headers["etag"]
+
+        mutations = [
+            ("post", tasks_url, {"title": "new"}),
+            ("put", f"{tasks_url}/{test_task.id}", {"title": "renamed"}),
+            ("patch", f"{tasks_url}/{test_task.id}/status", {"status": "done"}),
+            ("post", f"{tasks_url}/{test_task.id}/comments", {"content": "hi"}),
+            ("post", f"{project_url}/members", {"user_id": other_user.id}),
+            ("put", project_url, {"name": "Renamed project"}),
+            ("delete", f"{tasks_url}/{test_task.id}", None),
+        ]
+        seen = {await etag()}
+        for method, url, body in mutations:
+            kwargs = {"headers": auth_headers}
+            if body is not None:
+                kwargs["json"] = body
+            response = await client.request(method.upper(), url, **kwargs)
+            assert response.status_code < 300, (method, url)
+            current = await etag()
+            assert current not in seen, (method, url)
+            seen.add(current)
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_returns_body(
+        self, client: AsyncClient, auth_headers, test_project, test_task
+    ):
+        url = f"{BASE}/{test_project.id}/tasks"
+        etag = (await client.get(url, headers=auth_headers)).headers["etag"]
+        await client.post(url, json={"title": "new"}, headers=auth_headers)
+
+        response = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+
+    @pytest.mark.asyncio
+    async def test_non_member_gets_403_not_304(
+        self, client: AsyncClient, auth_headers, other_auth_headers, test_project, test_task
+    ):
+        url = f"{BASE}/{test_project.id}/tasks"
+        etag = (await client.get(url, headers=auth_headers)).headers["etag"]
+        response = await client.get(url, headers={**other_auth_headers, "If-None-Match": etag})
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_project_members_match_etag_version(
+        self, client: AsyncClient, auth_headers, test_project, other_user, db_session
+    ):
+        """다른 워커가 멤버를 추가해 캐시를 지우지 못해도 새 ETag에는 새 멤버 목록"""
+        from app.models.project import ProjectMember, ProjectRole
+
+        url = f"{BASE}/{test_project.id}"
+        first = await client.get(url, headers=auth_headers)
+        assert len(first.json()["members"]) == 1
+
+        # 캐시 무효화 없이 DB에만 반영 (트리거가 projects.version을 올린다)
+        db_session.add(
+            ProjectMember(
+                user_id=other_user.id, project_id=test_project.id, role=ProjectRole.member
+            )
+        )
+        await db_session.flush()
+        db_session.expunge(test_project)
+
+        response = await client.get(
+            url, headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != first.headers["etag"]
+        assert {m["user_id"] for m in response.json()["members"]} == {
+            test_project.owner_id,
+            other_user.id,
+        }
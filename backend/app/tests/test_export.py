@@ -0,0 +1,138 @@
+import csv
+import io
+import json
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.comment import Comment
+from app.models.task import Task, TaskStatus
+from app.services.export import export_project_tasks
+
+
+def export_url(project_id: int) -> str:
+    return f"/api/v1/projects/{project_id}/export"
+
+
+class TestProjectExport:
+    @pytest_asyncio.fixture
+    async def tasks(self, db_session, test_project, test_user):
+        """태스크 5개, 첫 태스크에 댓글 2개"""
+        tasks = [
+            Task(title=f"Export {i}", project_id=test_project.id, status=list(TaskStatus)[i % 3])
+            for i in range(5)
+        ]
+        db_session.add_all(tasks)
+        await db_session.flush()
+        db_session.add_all(
+            [
+                Comment(content="first", task_id=tasks[0].id, author_id=test_user.id),
+                Comment(content="second", task_id=tasks[0].id, author_id=test_user.id),
+            ]
+        )
+        await db_session.flush()
+        return tasks
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self, client: AsyncClient, auth_headers, test_project, tasks):
+        response = await client.get(export_url(test_project.id), headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="project-' in response.headers["content-disposition"]
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == [task.id for task in tasks]
+        detail = await client.get(
+            f"/api/v1/projects/{test_project.id}/tasks/{tasks[0].id}", headers=auth_headers
+        )
+        assert lines[0] == detail.json()
+
+    @pytest.mark.asyncio
+    async def test_ndjson_with_comments(
+        self, client: AsyncClient, auth_headers, test_project, tasks
+    ):
+        response = await client.get(
+            export_url(test_project.id),
+            params={"include_comments": True},
+            headers=auth_headers,
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == [task.id for task in tasks]
+        assert [comment["content"] for comment in lines[0]["comments"]] == ["first", "second"]
+        assert all(line["comments"] == [] for line in lines[1:])
+
+    @pytest.mark.asyncio
+    async def test_csv(self, client: AsyncClient, auth_headers, test_project, tasks, db_session):
+        tasks[1].title = '=HYPERLINK("http://evil")'
+        await db_session.flush()
+
+        response = await client.get(
+            export_url(test_project.id),
+            params={"format": "csv", "include_comments": True},
+            headers=auth_headers,
+        )
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [int(row["id"]) for row in rows] == [task.id for task in tasks]
+        assert rows[0]["status"] == "todo"
+        assert [c["content"] for c in json.loads(rows[0]["comments"])] == ["first", "second"]
+        assert rows[1]["assignee_id"] == ""
+        # 스프레드시트에서 수식으로 실행되지 않도록 텍스트로 둔다
+        assert rows[1]["title"] == '\'=HYPERLINK("http://evil")'
+
+    @pytest.mark.asyncio
+    async def test_streams_in_batches(self, db_session: AsyncSession, test_project, tasks):
+        """batch_size행마다 한 조각씩, 댓글이 배치 경계를 넘어도 태스크 한 줄에 모인다"""
+        chunks = [
+            chunk
+            async for chunk in export_project_tasks(
+                lambda: AsyncSession(bind=db_session.bind),
+                test_project.id,
+                "ndjson",
+                include_comments=True,
+                batch_size=2,
+            )
+        ]
+        assert len(chunks) > 2
+        lines = [json.loads(line) for line in b"".join(chunks).splitlines()]
+        assert [line["id"] for line in lines] == [task.id for task in tasks]
+        assert len(lines[0]["comments"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_stops_when_client_disconnects(
+        self, db_session: AsyncSession, test_project, tasks
+    ):
+        checks = 0
+
+        async def is_disconnected() -> bool:
+            nonlocal checks
+            checks += 1
+            return checks > 1
+
+        chunks = [
+            chunk
+            async for chunk in export_project_tasks(
+                lambda: AsyncSession(bind=db_session.bind),
+                test_project.id,
+                "ndjson",
+                is_disconnected=is_disconnected,
+                batch_size=2,
+            )
+        ]
+        # 첫 배치 뒤 연결이 끊겨 나머지 배치는 읽지 않는다
+        assert checks == 2
+        assert len(b"".join(chunks).splitlines()) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_format(self, client: AsyncClient, auth_headers, test_project):
+        response = await client.get(
+            export_url(test_project.id), params={"format": "xml"}, headers=auth_headers
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_non_member(self, client: AsyncClient, other_auth_headers, test_project):
+        response = await client.get(export_url(test_project.id), headers=other_auth_headers)
+        assert response.status_code == 403
@@ -1,5 +1,10 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import Settings, settings
+from app.core.database import AcquireLatencyHistogram, acquire_latency, build_engine_options
 
 
 @pytest.mark.asyncio
@@ -10,3 +15,80 @@ async def test_health_check(client: AsyncClient) -> None:
     data = response.json()
     assert data["status"] == "ok"
     assert data["message"] == "TaskFlow API is running"
+
+
+@pytest.fixture
+def metrics_token(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    monkeypatch.setattr(settings, "HEALTH_METRICS_TOKEN", "test-metrics-token")
+    return {"X-Metrics-Token": "test-metrics-token"}
+
+
+@pytest.mark.asyncio
+async def test_health_check_db_pool(client: AsyncClient, metrics_token: dict[str, str]) -> None:
+    """커넥션 풀 상태 API 테스트"""
+    response = await client.get("/api/v1/health/db/pool", headers=metrics_token)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["checked_out"] >= 0
+    assert data["overflow"] >= 0
+    assert "+Inf" in data["acquire"]["buckets"]
+
+
+@pytest.mark.asyncio
+async def test_health_check_db_coalescing(
+    client: AsyncClient, metrics_token: dict[str, str]
+) -> None:
+    """동시 조회 합치기 통계 API 테스트"""
+    response = await client.get("/api/v1/health/db/coalescing", headers=metrics_token)
+    assert response.status_code == 200
+    assert response.json() == {"hits": 0, "misses": 0, "failures": 0, "inflight": 0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/api/v1/health/db/pool", "/api/v1/health/db/coalescing"])
+async def test_health_check_metrics_requires_token(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch, path: str
+) -> None:
+    """상세 헬스체크는 토큰이 없으면 막힌다"""
+    # 토큰을 설정하지 않으면 엔드포인트가 없는 것처럼 응답
+    monkeypatch.setattr(settings, "HEALTH_METRICS_TOKEN", "")
+    response = await client.get(path, headers={"X-Metrics-Token": ""})
+    assert response.status_code == 404
+
+    monkeypatch.setattr(settings, "HEALTH_METRICS_TOKEN", "test-metrics-token")
+    response = await client.get(path)
+    assert response.status_code == 403
+    response = await client.get(path, headers={"X-Metrics-Token": "wrong"})
+    assert response.status_code == 403
+
+
+def test_acquire_latency_histogram() -> None:
+    histogram = AcquireLatencyHistogram(buckets_ms=(1, 10))
+    for elapsed_ms in (0.5, 1, 3, 20):
+        histogram.observe(elapsed_ms)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"1": 2, "10": 1, "+Inf": 1}
+    assert snapshot["count"] == 4
+    assert snapshot["max_ms"] == 20
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pgbouncer_mode", [False, True])
+async def test_engine_options_connect(pgbouncer_mode: bool) -> None:
+    """설정으로 만든 엔진이 실제로 연결되고 획득 지연이 기록되는지 확인"""
+    config = Settings(DB_POOL_SIZE=2, DB_PGBOUNCER_MODE=pgbouncer_mode)
+    options = build_engine_options(config)
+    if pgbouncer_mode:
+        assert options["connect_args"]["prepared_statement_cache_size"] == 0
+        assert options["connect_args"]["statement_cache_size"] == 0
+
+    engine = create_async_engine(settings.DATABASE_URL, **options)
+    before = acquire_latency.count
+    try:
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+            assert engine.pool.checkedout() == 1
+    finally:
+        await engine.dispose()
+    assert acquire_latency.count == before + 1
@@ -0,0 +1,270 @@
+"""
+핫 쿼리 인덱스 사용 여부 테스트
+
+테스트 트랜잭션 안에 충분한 데이터를 넣고 ANALYZE한 뒤, 서비스 레이어의
+조회 쿼리를 EXPLAIN하여 인덱스를 사용하는지 확인한다.
+"""
+
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import and_, func, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.comment import Comment
+from app.models.project import Project, ProjectMember
+from app.models.task import Task, TaskStatus
+from app.services.task import _assigned_task_query, _task_list_query
+
+PROJECTS = 1000
+TASKS_PER_PROJECT = 20
+# 컬럼/정렬 순서를 인덱스로 읽는지 확인하는 큰 프로젝트
+BIG_PROJECT_TASKS = 5000
+# 확인 대상 사용자가 멤버인 프로젝트마다 추가로 배정되는 태스크 (/me/tasks가 긴 사용자)
+ASSIGNED_TASKS_PER_PROJECT = 80
+# 서비스의 페이지 크기 + 1 (DEFAULT_TASK_PAGE_SIZE)
+PAGE = 51
+
+# project_id로 시작하는 tasks 인덱스 (플래너가 정렬 비용에 따라 하나를 고른다)
+TASK_PROJECT_INDEXES = {
+    "ix_tasks_project_id_created_at",
+    "ix_tasks_project_id_status_created_at",
+    "ix_tasks_project_id_priority_rank",
+    "ix_tasks_project_id_status_position",
+    "ix_tasks_project_id_updated_at",
+}
+MEMBER_INDEXES = {"project_members_user_id_project_id_key", "ix_project_members_project_id"}
+
+
+@pytest_asyncio.fixture
+async def seeded(db_session: AsyncSession) -> dict[str, int]:
+    """
+    사용자 50명, 프로젝트 1000개(멤버 3명씩), 태스크 2만 개, 댓글 4만 개
+
+    정렬된 페이지 조회가 정렬 없이 인덱스 순서로 읽히는지 보려면 행이 충분해야 하므로,
+    태스크 5000개짜리 프로젝트 하나와 확인 대상 사용자에게 배정된 태스크 수천 개를 더한다.
+    """
+    await db_session.execute(
+        text(
+            "INSERT INTO users (email, hashed_password, name) "
+            "SELECT 'seed' || i || '@example.com', 'x', 'Seed ' || i "
+            "FROM generate_series(1, 50) AS i"
+        )
+    )
+    result = await db_session.execute(
+        text("SELECT id FROM users WHERE email LIKE 'seed%' ORDER BY id")
+    )
+    user_ids = list(result.scalars())
+    first_user = user_ids[0]
+
+    await db_session.execute(
+        text(
+            "INSERT INTO projects (name, description, owner_id) "
+            "SELECT 'Seed project ' || i, '', :first_user + (i % 50) "
+            "FROM generate_series(1, :n) AS i"
+        ),
+        {"first_user": first_user, "n": PROJECTS},
+    )
+    await db_session.execute(
+        text(
+            "INSERT INTO project_members (user_id, project_id, role) "
+            "SELECT :first_user + ((p.id + k) % 50), p.id, 'member' "
+            "FROM projects p CROSS JOIN generate_series(0, 2) AS k "
+            "WHERE p.name LIKE 'Seed project %'"
+        ),
+        {"first_user": first_user},
+    )
+    await db_session.execute(
+        text(
+            "INSERT INTO tasks (title, description, status, priority, project_id, assignee_id) "
+            "SELECT 'Seed task ' || i, '', "
+            "(ARRAY['todo', 'in_progress', 'done'])[1 + i % 3], "
+            "(ARRAY['low', 'medium', 'high', 'critical'])[1 + i % 4], "
+            "p.id, :first_user + ((p.id + i % 3) % 50) "
+            "FROM projects p CROSS JOIN generate_series(1, :n) AS i "
+            "WHERE p.name LIKE 'Seed project %'"
+        ),
+        {"first_user": first_user, "n": TASKS_PER_PROJECT},
+    )
+    await db_session.execute(
+        text(
+            "INSERT INTO comments (content, task_id, author_id) "
+            "SELECT 'comment', t.id, t.assignee_id "
+            "FROM tasks t CROSS JOIN generate_series(1, 2) "
+            "WHERE t.title LIKE 'Seed task %'"
+        )
+    )
+    big_project_id = (
+        await db_session.execute(
+            text(
+                "INSERT INTO projects (name, description, owner_id) "
+                "VALUES ('Seed big project', '', :first_user) RETURNING id"
+            ),
+            {"first_user": first_user},
+        )
+    ).scalar_one()
+    await db_session.execute(
+        text(
+            "INSERT INTO tasks (title, description, status, priority, project_id) "
+            "SELECT 'Seed task ' || i, '', "
+            "(ARRAY['todo', 'in_progress', 'done'])[1 + i % 3], "
+            "(ARRAY['low', 'medium', 'high', 'critical'])[1 + i % 4], "
+            ":project_id "
+            "FROM generate_series(1, :n) AS i"
+        ),
+        {"project_id": big_project_id, "n": BIG_PROJECT_TASKS},
+    )
+    await db_session.execute(
+        text(
+            "INSERT INTO tasks (title, description, status, priority, project_id, assignee_id) "
+            "SELECT 'Seed assigned task ' || i, '', 'todo', 'medium', m.project_id, m.user_id "
+            "FROM project_members m CROSS JOIN generate_series(1, :n) AS i "
+            "WHERE m.user_id = :user_id"
+        ),
+        {"user_id": user_ids[7], "n": ASSIGNED_TASKS_PER_PROJECT},
+    )
+    for table in ("users", "projects", "project_members", "tasks", "comments"):
+        await db_session.execute(text(f"ANALYZE {table}"))
+
+    project_id = (
+        await db_session.execute(select(Project.id).where(Project.name == "Seed project 7"))
+    ).scalar_one()
+    task_id = (
+        await db_session.execute(select(Task.id).where(Task.project_id == project_id).limit(1))
+    ).scalar_one()
+    return {
+        "user_id": user_ids[7],
+        "project_id": project_id,
+        "big_project_id": big_project_id,
+        "task_id": task_id,
+    }
+
+
+def walk(plan: dict[str, Any]):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+async def plan_nodes(db: AsyncSession, statement) -> list[dict[str, Any]]:
+    sql = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    return list(walk(result.scalar_one()[0]["Plan"]))
+
+
+async def used_indexes(db: AsyncSession, statement) -> set[str]:
+    return {node["Index Name"] for node in await plan_nodes(db, statement) if "Index Name" in node}
+
+
+async def seq_scanned_tables(db: AsyncSession, statement) -> set[str]:
+    nodes = await plan_nodes(db, statement)
+    return {node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"}
+
+
+class TestHotQueryIndexes:
+    @pytest.mark.asyncio
+    async def test_task_list_uses_index(self, db_session: AsyncSession, seeded):
+        query = _task_list_query(seeded["project_id"], None, None, None, "created_at", "desc")
+        assert await used_indexes(db_session, query) & TASK_PROJECT_INDEXES
+
+    @pytest.mark.asyncio
+    async def test_task_list_status_filter_uses_index(self, db_session: AsyncSession, seeded):
+        query = _task_list_query(
+            seeded["project_id"], TaskStatus.todo, None, None, "created_at", "asc"
+        )
+        assert await used_indexes(db_session, query) & TASK_PROJECT_INDEXES
+
+    @pytest.mark.asyncio
+    async def test_task_list_priority_sort_uses_rank_index(self, db_session: AsyncSession, seeded):
+        # 큰 프로젝트의 첫 페이지: 정렬 대신 인덱스 순서로 LIMIT만큼 읽는다
+        query = _task_list_query(seeded["big_project_id"], None, None, None, "priority", "desc")
+        indexes = await used_indexes(db_session, query.limit(PAGE))
+        assert "ix_tasks_project_id_priority_rank" in indexes
+
+    @pytest.mark.asyncio
+    async def test_task_column_position_uses_index(self, db_session: AsyncSession, seeded):
+        query = _task_list_query(
+            seeded["big_project_id"], TaskStatus.todo, None, None, "position", "asc"
+        )
+        indexes = await used_indexes(db_session, query.limit(PAGE))
+        assert "ix_tasks_project_id_status_position" in indexes
+
+    @pytest.mark.asyncio
+    async def test_task_changes_uses_updated_at_index(self, db_session: AsyncSession, seeded):
+        since = func.now() - text("interval '1 day'")
+        query = (
+            select(Task)
+            .where(
+                Task.project_id == seeded["big_project_id"],
+                tuple_(Task.updated_at, Task.id) > tuple_(since, 0),
+            )
+            .order_by(Task.updated_at, Task.id)
+            .limit(501)
+        )
+        assert "ix_tasks_project_id_updated_at" in await used_indexes(db_session, query)
+
+    @pytest.mark.asyncio
+    async def test_task_search_uses_gin_index(self, db_session: AsyncSession, seeded):
+        query = select(Task.id).where(
+            Task.search_vector.op("@@")(text("to_tsquery('simple', 'nomatch')"))
+        )
+        assert "ix_tasks_search_vector" in await used_indexes(db_session, query)
+
+    @pytest.mark.asyncio
+    async def test_task_assignee_lookup_uses_index(self, db_session: AsyncSession, seeded):
+        query = (
+            select(Task)
+            .where(Task.assignee_id == seeded["user_id"])
+            .order_by(Task.created_at, Task.id)
+            .limit(PAGE)
+        )
+        assert "ix_tasks_assignee_id_created_at" in await used_indexes(db_session, query)
+
+    @pytest.mark.asyncio
+    async def test_my_tasks_uses_index(self, db_session: AsyncSession, seeded):
+        # 담당자 인덱스로 훑을지, 멤버인 프로젝트마다 프로젝트 인덱스로 훑을지는
+        # 플래너가 통계로 고른다. 어느 쪽이든 tasks 전체를 읽지 않아야 한다
+        query = _assigned_task_query(seeded["user_id"], None, None, "created_at", "desc")
+        query = query.limit(PAGE)
+        indexes = await used_indexes(db_session, query)
+        assert indexes & (TASK_PROJECT_INDEXES | {"ix_tasks_assignee_id_created_at"})
+        assert indexes & MEMBER_INDEXES
+        assert "tasks" not in await seq_scanned_tables(db_session, query)
+
+    @pytest.mark.asyncio
+    async def test_task_comments_uses_index(self, db_session: AsyncSession, seeded):
+        query = (
+            select(Comment)
+            .where(Comment.task_id == seeded["task_id"])
+            .order_by(Comment.created_at.asc())
+        )
+        assert "ix_comments_task_id_created_at" in await used_indexes(db_session, query)
+
+    @pytest.mark.asyncio
+    async def test_user_projects_uses_index(self, db_session: AsyncSession, seeded):
+        query = (
+            select(Project)
+            .join(ProjectMember, ProjectMember.project_id == Project.id)
+            .where(ProjectMember.user_id == seeded["user_id"])
+            .order_by(Project.created_at.desc())
+        )
+        assert await used_indexes(db_session, query) & MEMBER_INDEXES
+
+    @pytest.mark.asyncio
+    async def test_project_member_lookup_uses_index(self, db_session: AsyncSession, seeded):
+        query = (
+            select(Project, ProjectMember)
+            .outerjoin(
+                ProjectMember,
+                and_(
+                    ProjectMember.project_id == Project.id,
+                    ProjectMember.user_id == seeded["user_id"],
+                ),
+            )
+            .where(Project.id == seeded["project_id"])
+        )
+        indexes = await used_indexes(db_session, query)
+        assert "projects_pkey" in indexes
+        assert indexes & MEMBER_INDEXES
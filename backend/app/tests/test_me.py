@@ -0,0 +1,116 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from app.models.project import Project, ProjectMember, ProjectRole
+from app.models.task import Task, TaskPriority, TaskStatus
+
+URL = "/api/v1/me/tasks"
+
+
+class TestMyTasks:
+    @pytest_asyncio.fixture
+    async def projects(self, db_session, test_project, test_user, other_user):
+        """test_project + 내가 멤버인 second + 내가 빠진 foreign 프로젝트에 태스크 배정"""
+        second = Project(name="Second", owner_id=other_user.id)
+        foreign = Project(name="Foreign", owner_id=other_user.id)
+        db_session.add_all([second, foreign])
+        await db_session.flush()
+        db_session.add_all(
+            [
+                ProjectMember(user_id=other_user.id, project_id=second.id, role=ProjectRole.owner),
+                ProjectMember(user_id=test_user.id, project_id=second.id),
+                ProjectMember(user_id=other_user.id, project_id=foreign.id, role=ProjectRole.owner),
+            ]
+        )
+        db_session.add_all(
+            [
+                Task(title="mine 1", project_id=test_project.id, assignee_id=test_user.id),
+                Task(
+                    title="mine 2",
+                    project_id=test_project.id,
+                    assignee_id=test_user.id,
+                    status=TaskStatus.done,
+                ),
+                Task(
+                    title="mine 3",
+                    project_id=second.id,
+                    assignee_id=test_user.id,
+                    priority=TaskPriority.high,
+                ),
+                Task(title="theirs", project_id=second.id, assignee_id=other_user.id),
+                Task(title="left project", project_id=foreign.id, assignee_id=test_user.id),
+            ]
+        )
+        await db_session.flush()
+        return {"test": test_project, "second": second}
+
+    @pytest.mark.asyncio
+    async def test_lists_assigned_tasks_across_projects(
+        self, client: AsyncClient, auth_headers, projects, query_counter
+    ):
+        query_counter.clear()
+        response = await client.get(URL, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+
+        assert sorted(t["title"] for t in data["tasks"]) == ["mine 1", "mine 2", "mine 3"]
+        assert data["projects"] == {
+            str(projects["test"].id): projects["test"].name,
+            str(projects["second"].id): "Second",
+        }
+        assert data["next_cursor"] is None
+        # 사용자 + 태스크/프로젝트 이름 조인 한 번
+        assert len(query_counter) == 2
+
+    @pytest.mark.asyncio
+    async def test_filters(self, client: AsyncClient, auth_headers, projects):
+        response = await client.get(URL, params={"status": "done"}, headers=auth_headers)
+        assert [t["title"] for t in response.json()["tasks"]] == ["mine 2"]
+
+        response = await client.get(URL, params={"priority": "high"}, headers=auth_headers)
+        data = response.json()
+        assert [t["title"] for t in data["tasks"]] == ["mine 3"]
+        assert data["projects"] == {str(projects["second"].id): "Second"}
+
+    @pytest.mark.asyncio
+    async def test_keyset_pagination(self, client: AsyncClient, auth_headers, projects):
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2, "sort_by": "title", "sort_order": "asc"}
+            if cursor:
+                params["cursor"] = cursor
+            data = (await client.get(URL, params=params, headers=auth_headers)).json()
+            seen += [t["title"] for t in data["tasks"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == ["mine 1", "mine 2", "mine 3"]
+
+    @pytest.mark.asyncio
+    async def test_card_view(self, client: AsyncClient, auth_headers, projects):
+        params = {"view": "card", "limit": 2}
+        first = await client.get(URL, params=params, headers=auth_headers)
+        assert first.status_code == 200
+        data = first.json()
+        assert all("description" not in t and "project_id" not in t for t in data["tasks"])
+        # project_id는 응답에서 빠져도 프로젝트 이름 맵은 채워진다
+        assert data["projects"]
+        assert set(data["projects"]) <= {str(p.id) for p in projects.values()}
+
+        second = await client.get(
+            URL, params={**params, "cursor": data["next_cursor"]}, headers=auth_headers
+        )
+        titles = [t["title"] for t in data["tasks"] + second.json()["tasks"]]
+        assert sorted(titles) == ["mine 1", "mine 2", "mine 3"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, client: AsyncClient, auth_headers, projects):
+        response = await client.get(URL, params={"cursor": "bogus"}, headers=auth_headers)
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_requires_auth(self, client: AsyncClient):
+        response = await client.get(URL)
+        assert response.status_code == 401
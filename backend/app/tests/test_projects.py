@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.core.cache import membership_cache
+
 BASE = "/api/v1/projects"
 
 
@@ -150,7 +152,80 @@ class TestDeleteProject:
         self, client: AsyncClient, auth_headers: dict, test_project
     ):
         response = await client.delete(f"{BASE}/{test_project.id}", headers=auth_headers)
-        assert response.status_code == 204
+        assert response.status_code == 202
+        assert response.headers["location"] == f"{BASE}/{test_project.id}/deletion"
+        data = response.json()
+        assert data["project_id"] == test_project.id
+        assert data["status"] == "in_progress"
+
+        # 삭제 중인 프로젝트는 목록/상세에서 바로 사라진다
+        response = await client.get(f"{BASE}/", headers=auth_headers)
+        assert [p["id"] for p in response.json()] == []
+        response = await client.get(f"{BASE}/{test_project.id}", headers=auth_headers)
+        assert response.status_code == 404
+        response = await client.delete(f"{BASE}/{test_project.id}", headers=auth_headers)
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_delete_project_purges_in_batches(
+        self, client: AsyncClient, auth_headers: dict, db_session, test_user, test_project
+    ):
+        from sqlalchemy import func, select
+
+        from app.models.comment import Comment
+        from app.models.project import Project
+        from app.models.task import Task
+        from app.services.project_deletion import purge_project_deletion_step
+
+        tasks = [Task(title=f"태스크 {i}", project_id=test_project.id) for i in range(3)]
+        db_session.add_all(tasks)
+        await db_session.flush()
+        db_session.add_all(
+            [Comment(content="댓글", task_id=t.id, author_id=test_user.id) for t in tasks]
+        )
+        await db_session.flush()
+
+        response = await client.delete(f"{BASE}/{test_project.id}", headers=auth_headers)
+        deletion_id = response.json()["id"]
+        assert response.json()["tasks_remaining"] == 3
+
+        # 댓글 2 + 태스크 2 + 멤버 1 배치, 마지막 호출이 프로젝트 행을 지운다
+        assert await purge_project_deletion_step(db_session, deletion_id, batch_size=2)
+        response = await client.get(f"{BASE}/{test_project.id}/deletion", headers=auth_headers)
+        assert response.json()["comments_deleted"] == 2
+        steps = 1
+        while await purge_project_deletion_step(db_session, deletion_id, batch_size=2):
+            steps += 1
+        assert steps == 5
+
+        assert await db_session.get(Project, test_project.id, populate_existing=True) is None
+        task_count = await db_session.scalar(
+            select(func.count()).select_from(Task).where(Task.project_id == test_project.id)
+        )
+        assert task_count == 0
+
+        response = await client.get(f"{BASE}/{test_project.id}/deletion", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["finished_at"] is not None
+        assert (data["comments_deleted"], data["tasks_deleted"], data["members_deleted"]) == (
+            3,
+            3,
+            1,
+        )
+        assert data["tasks_remaining"] == 0
+
+    @pytest.mark.asyncio
+    async def test_deletion_status_only_for_requester(
+        self, client: AsyncClient, auth_headers: dict, other_auth_headers: dict, test_project
+    ):
+        url = f"{BASE}/{test_project.id}/deletion"
+        assert (await client.get(url, headers=auth_headers)).status_code == 404
+
+        await client.delete(f"{BASE}/{test_project.id}", headers=auth_headers)
+        assert (await client.get(url, headers=auth_headers)).status_code == 200
+        assert (await client.get(url, headers=other_auth_headers)).status_code == 404
 
     @pytest.mark.asyncio
     async def test_delete_project_admin_forbidden(
@@ -257,3 +332,150 @@ class TestAddMember:
             headers=auth_headers,
         )
         assert response.status_code == 404
+
+
+class TestMembershipQueries:
+    """프로젝트 스코프 요청의 쿼리 수"""
+
+    @pytest.fixture
+    def enable_membership_cache(self, monkeypatch):
+        monkeypatch.setattr(membership_cache, "ttl", 60)
+        membership_cache.clear()
+        yield
+        membership_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_single_membership_query(
+        self, client: AsyncClient, auth_headers: dict, test_project, query_counter
+    ):
+        query_counter.clear()
+        response = await client.get(f"{BASE}/{test_project.id}/tasks", headers=auth_headers)
+        assert response.status_code == 200
+        # 사용자 + 멤버십(프로젝트 존재 확인 포함) + 태스크
+        assert len(query_counter) == 3
+
+    @pytest.mark.asyncio
+    async def test_get_project_reuses_loaded_project(
+        self, client: AsyncClient, auth_headers: dict, test_project, query_counter
+    ):
+        query_counter.clear()
+        response = await client.get(f"{BASE}/{test_project.id}", headers=auth_headers)
+        assert response.status_code == 200
+        assert len(response.json()["members"]) == 1
+        # 사용자 + 멤버십 + members (프로젝트는 identity map에서 재사용)
+        assert len(query_counter) == 3
+
+    @pytest.mark.asyncio
+    async def test_update_project_single_statement(
+        self, client: AsyncClient, auth_headers: dict, test_project, query_counter
+    ):
+        query_counter.clear()
+        response = await client.put(
+            f"{BASE}/{test_project.id}", json={"name": "Renamed"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["name"] == "Renamed"
+        # 사용자 + 멤버십 + UPDATE ... RETURNING
+        assert len(query_counter) == 3
+
+    @pytest.mark.asyncio
+    async def test_add_member_single_statement(
+        self, client: AsyncClient, auth_headers: dict, test_project, other_user, query_counter
+    ):
+        query_counter.clear()
+        response = await client.post(
+            f"{BASE}/{test_project.id}/members",
+            json={"user_id": other_user.id, "role": "member"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        # 사용자 + 멤버십 + INSERT ... SELECT ... ON CONFLICT RETURNING
+        assert len(query_counter) == 3
+
+    @pytest.mark.asyncio
+    async def test_membership_cache_hit(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_project,
+        query_counter,
+        enable_membership_cache,
+    ):
+        url = f"{BASE}/{test_project.id}/tasks"
+        await client.get(url, headers=auth_headers)
+
+        query_counter.clear()
+        response = await client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        # principal + 멤버십 모두 캐시 적중, 태스크 쿼리만 실행
+        assert len(query_counter) == 1
+
+    @pytest.mark.asyncio
+    async def test_membership_cache_invalidated_on_delete(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_project,
+        enable_membership_cache,
+    ):
+        url = f"{BASE}/{test_project.id}"
+        assert (await client.get(url, headers=auth_headers)).status_code == 200
+        assert len(membership_cache) == 1
+
+        assert (await client.delete(url, headers=auth_headers)).status_code == 202
+        assert len(membership_cache) == 0
+        assert (await client.get(url, headers=auth_headers)).status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_membership_cache_respects_deleted_project(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_project,
+        db_session,
+        query_counter,
+        enable_membership_cache,
+    ):
+        """다른 워커가 삭제한 프로젝트는 멤버십 캐시가 남아 있어도 404"""
+        from sqlalchemy import func, update
+
+        from app.core.cache import shared_cache
+        from app.models.project import Project
+        from app.services.project import project_cache_key
+
+        url = f"{BASE}/{test_project.id}/tasks"
+        await client.get(url, headers=auth_headers)
+        # 요청마다 새 세션인 것처럼 identity map에서 뺀다
+        db_session.expunge(test_project)
+
+        query_counter.clear()
+        assert (await client.get(url, headers=auth_headers)).status_code == 200
+        assert not any("JOIN project_members" in q for q in query_counter)
+
+        # 다른 워커의 삭제 요청: deleted_at 표시 후 커밋되면 공유 캐시 항목을 지운다
+        await db_session.execute(
+            update(Project).where(Project.id == test_project.id).values(deleted_at=func.now())
+        )
+        await shared_cache.delete([project_cache_key(test_project.id)])
+        assert len(membership_cache) == 1
+        assert (await client.get(url, headers=auth_headers)).status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_membership_cache_invalidated_on_add_member(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_project,
+        other_user,
+        enable_membership_cache,
+    ):
+        await client.get(f"{BASE}/{test_project.id}", headers=auth_headers)
+        assert len(membership_cache) == 1
+
+        response = await client.post(
+            f"{BASE}/{test_project.id}/members",
+            json={"user_id": other_user.id},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        assert len(membership_cache) == 0
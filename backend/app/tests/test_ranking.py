@@ -0,0 +1,116 @@
+import random
+
+import pytest
+from sqlalchemy import String, cast, literal, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.ranking import (
+    RANK_MIDPOINT,
+    SMALLEST_INTEGER,
+    _split,
+    rank_before_sql,
+    rank_between,
+    rank_sequence,
+)
+
+
+def valid(ranks: list[str]) -> bool:
+    """정수부가 온전하고 소수부가 0으로 끝나지 않음"""
+    return all(not _split(rank)[1].endswith("0") for rank in ranks)
+
+
+class TestRankBetween:
+    def test_empty(self):
+        assert rank_between(None, None) == RANK_MIDPOINT
+
+    def test_random_inserts_stay_ordered(self):
+        rng = random.Random(7)
+        ranks = rank_sequence(10)
+        for _ in range(2000):
+            i = rng.randrange(len(ranks) + 1)
+            lower = ranks[i - 1] if i > 0 else None
+            upper = ranks[i] if i < len(ranks) else None
+            ranks.insert(i, rank_between(lower, upper))
+        assert ranks == sorted(ranks)
+        assert len(set(ranks)) == len(ranks)
+        assert valid(ranks)
+
+    def test_invalid_order(self):
+        with pytest.raises(ValueError):
+            rank_between("a1", "a0")
+
+    @pytest.mark.parametrize("prepend", [True, False])
+    def test_repeated_end_inserts_grow_logarithmically(self, prepend):
+        """컬럼 맨 앞(또는 맨 뒤)에 계속 추가해도 rank는 개수의 로그로만 길어진다"""
+        ranks = [RANK_MIDPOINT]
+        for _ in range(20_000):
+            if prepend:
+                ranks.insert(0, rank_between(None, ranks[0]))
+            else:
+                ranks.append(rank_between(ranks[-1], None))
+        assert ranks == sorted(set(ranks))
+        assert max(map(len, ranks)) <= 4
+
+    def test_integer_head_boundaries(self):
+        assert rank_between(None, "a0") == "Zz"
+        assert rank_between(None, "Z0") == "Yzz"
+        assert rank_between(None, "b00") == "az"
+        assert rank_between("az", None) == "b00"
+        assert rank_between("Zz", None) == "a0"
+        assert rank_between("a0", "a1") == "a0V"
+        assert rank_between(None, "a0V") == "a0"
+        smallest = SMALLEST_INTEGER + "V"
+        assert SMALLEST_INTEGER < rank_between(None, smallest) < smallest
+        with pytest.raises(ValueError):
+            rank_between(None, SMALLEST_INTEGER)
+
+    @pytest.mark.parametrize("count", [1, 2, 61, 62, 5000])
+    def test_sequence(self, count):
+        ranks = rank_sequence(count)
+        assert len(ranks) == count
+        assert ranks == sorted(set(ranks))
+        assert valid(ranks)
+        assert max(map(len, ranks)) <= 4
+
+    @pytest.mark.parametrize("after", ["a0", "a0V", "Zz", "b01", "Y0z"])
+    @pytest.mark.parametrize("count", [1, 61, 50_000])
+    def test_sequence_after(self, after, count):
+        ranks = rank_sequence(count, after=after)
+        assert len(ranks) == count
+        assert ranks == sorted(set(ranks))
+        assert ranks[0] > after
+        assert valid(ranks)
+        # 개수에 로그로 비례하는 길이
+        assert max(map(len, ranks)) <= len(after) + 4
+
+    @pytest.mark.parametrize(
+        ("after", "before"),
+        [(None, "a0"), (None, "a0V"), (None, "Zz"), ("a0", "a1"), ("a0", "a0V"), ("Zz", "b00")],
+    )
+    @pytest.mark.parametrize("count", [1, 61, 5000])
+    def test_sequence_between(self, after, before, count):
+        ranks = rank_sequence(count, after=after, before=before)
+        assert len(ranks) == count
+        assert ranks == sorted(set(ranks))
+        assert (after or "") < ranks[0] and ranks[-1] < before
+        assert valid(ranks)
+        # 양쪽이 막힌 구간은 반씩 나눠 채우므로 개수에 로그로 비례하는 길이
+        assert max(map(len, ranks)) <= len(before) + 4
+
+
+class TestRankBeforeSql:
+    @pytest.mark.asyncio
+    async def test_matches_python(self, db_session: AsyncSession):
+        ranks = [None, "a0", "a1", "az", "a0V", "b00", "b10", "bz0", "b0z1", "Zz", "Z0", "Y00"]
+        ranks += ["B" + "0" * 25, "z" * 27]
+        ranks += rank_sequence(30) + rank_sequence(30, before="a0")
+        for rank in ranks:
+            first = cast(null(), String()) if rank is None else literal(rank, String())
+            result = await db_session.execute(select(rank_before_sql(first)))
+            assert result.scalar_one() == rank_between(None, rank), rank
+
+        # 가장 작은 정수부 앞은 SQL에서 다루지 않는다
+        result = await db_session.execute(
+            select(rank_before_sql(literal(SMALLEST_INTEGER + "V", String())))
+        )
+        assert result.scalar_one() is None
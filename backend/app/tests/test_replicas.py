@@ -0,0 +1,176 @@
+"""
+Read replica 라우팅 테스트
+
+TEST_DATABASE_REPLICA_URL을 지정하면 별도 데이터베이스를 replica로 사용하는
+통합 테스트도 실행한다 (예: 같은 서버의 taskflow_test_replica).
+"""
+
+import os
+import time
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import dependencies
+from app.core.config import settings
+from app.core.database import Base, Replica, ReplicaRouter
+from app.models.project import Project
+from app.models.user import User
+
+REPLICA_URL = os.environ.get("TEST_DATABASE_REPLICA_URL")
+
+
+def make_router(*urls: str, read_after_write_seconds: float = 5.0) -> ReplicaRouter:
+    replicas = [Replica(create_async_engine(url, poolclass=NullPool)) for url in urls]
+    return ReplicaRouter(replicas, read_after_write_seconds)
+
+
+class TestReplicaRouter:
+    async def test_round_robin(self):
+        router = make_router(settings.DATABASE_URL, settings.DATABASE_URL)
+        first, second = router.choose(1), router.choose(1)
+        assert first is not None and second is not None
+        assert first is not second
+        assert router.choose(1) is first
+        await router.dispose()
+
+    async def test_no_replicas_uses_primary(self):
+        router = make_router()
+        assert router.choose(1) is None
+        assert await router.open_session(1) is None
+
+    async def test_read_after_write_sticks_to_primary(self):
+        router = make_router(settings.DATABASE_URL)
+        router.record_write(1)
+        assert router.choose(1) is None
+        assert router.choose(2) is not None
+        await router.dispose()
+
+    async def test_last_write_from_other_worker_sticks_to_primary(self):
+        """다른 워커가 남긴 마지막 쓰기 시각(쿠키)도 창 안이면 primary"""
+        router = make_router(settings.DATABASE_URL)
+        assert router.choose(1, last_write_at=time.time() - 1) is None
+        assert router.choose(1, last_write_at=time.time() - 10) is not None
+        # 창보다 먼 미래 시각(위조/시계 오류)은 무시
+        assert router.choose(1, last_write_at=time.time() + 3600) is not None
+        await router.dispose()
+
+    async def test_sticky_window_expires(self):
+        router = make_router(settings.DATABASE_URL, read_after_write_seconds=0)
+        router.record_write(1)
+        assert router.choose(1) is not None
+        await router.dispose()
+
+    async def test_open_session_is_read_only(self):
+        router = make_router(settings.DATABASE_URL)
+        session = await router.open_session(1)
+        assert session is not None
+        try:
+            result = await session.execute(text("SHOW transaction_read_only"))
+            assert result.scalar() == "on"
+        finally:
+            await session.close()
+            await router.dispose()
+
+    async def test_failed_replica_is_dropped(self):
+        bad_url = settings.DATABASE_URL.rsplit("@", 1)[0] + "@127.0.0.1:1/unreachable"
+        router = make_router(bad_url)
+        assert await router.open_session(1) is None
+        assert router.replicas[0].healthy is False
+        await router.dispose()
+
+    async def test_health_check_restores_replica(self):
+        router = make_router(settings.DATABASE_URL)
+        router.mark_down(router.replicas[0])
+        assert router.choose(1) is None
+
+        await router.check_health(timeout=5)
+        assert router.replicas[0].healthy is True
+        assert router.choose(1) is not None
+        await router.dispose()
+
+
+class TestLastWriteCookie:
+    async def test_cookie_only_on_committed_writes(self):
+        app = FastAPI()
+        app.add_middleware(dependencies.LastWriteCookieMiddleware)
+
+        @app.api_route("/api/items", methods=["GET", "POST"])
+        async def items(request: Request, wrote: bool = True):
+            if wrote:
+                request.state.last_write_at = 1_700_000_000.25
+            return {}
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            cookie = (await client.post("/api/items")).headers["set-cookie"]
+            assert cookie.startswith(f"{dependencies.LAST_WRITE_COOKIE}=1700000000.250;")
+            assert "Max-Age=5" in cookie and "HttpOnly" in cookie
+            assert "set-cookie" not in (await client.post("/api/items?wrote=false")).headers
+            assert "set-cookie" not in (await client.get("/api/items")).headers
+
+
+@pytest_asyncio.fixture
+async def replica_router(monkeypatch):
+    """빈 스키마만 있는 replica DB를 가리키는 라우터"""
+    engine = create_async_engine(REPLICA_URL, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+    router = make_router(REPLICA_URL)
+    monkeypatch.setattr(dependencies, "replica_router", router)
+    yield router
+    await router.dispose()
+
+
+@pytest.mark.skipif(REPLICA_URL is None, reason="TEST_DATABASE_REPLICA_URL not set")
+class TestReplicaRouting:
+    async def test_list_projects_reads_from_replica(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_user: User,
+        test_project: Project,
+        replica_router: ReplicaRouter,
+    ):
+        # replica에는 primary 트랜잭션의 데이터가 없다
+        response = await client.get("/api/v1/projects/", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == []
+
+        # 쓰기 직후에는 primary에서 읽는다
+        replica_router.record_write(test_user.id)
+        response = await client.get("/api/v1/projects/", headers=auth_headers)
+        assert [p["id"] for p in response.json()] == [test_project.id]
+
+    async def test_replica_down_falls_back_to_primary(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_project: Project,
+        replica_router: ReplicaRouter,
+    ):
+        replica_router.mark_down(replica_router.replicas[0])
+        response = await client.get("/api/v1/projects/", headers=auth_headers)
+        assert [p["id"] for p in response.json()] == [test_project.id]
+
+    async def test_last_write_cookie_reads_from_primary(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_project: Project,
+        replica_router: ReplicaRouter,
+    ):
+        """다른 워커에서 쓴 직후(이 워커에는 기록 없음)도 쿠키로 primary에서 읽는다"""
+        client.cookies.set(dependencies.LAST_WRITE_COOKIE, str(time.time() - 60))
+        response = await client.get("/api/v1/projects/", headers=auth_headers)
+        assert response.json() == []
+
+        client.cookies.set(dependencies.LAST_WRITE_COOKIE, str(time.time()))
+        response = await client.get("/api/v1/projects/", headers=auth_headers)
+        assert [p["id"] for p in response.json()] == [test_project.id]
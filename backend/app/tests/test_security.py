@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+from httpx import AsyncClient
+
+from app.core import security
+from app.core.security import (
+    PasswordHasherBusyError,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
+from app.models.user import User
+
+
+@pytest.fixture
+def saturated_password_pool(monkeypatch):
+    """슬롯이 모두 사용 중인 해싱 풀"""
+    security._get_password_pool()
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()
+    monkeypatch.setattr(security, "_password_slots", slots)
+    yield
+    slots.release()
+
+
+class TestPasswordHashingPool:
+    async def test_hash_and_verify_async(self):
+        hashed = await hash_password_async("secret123")
+        assert verify_password("secret123", hashed)
+        assert await verify_password_async("secret123", hashed) is True
+        assert await verify_password_async("wrong", hashed) is False
+
+    async def test_pool_saturated_raises(self, saturated_password_pool):
+        with pytest.raises(PasswordHasherBusyError):
+            await hash_password_async("secret123")
+
+    async def test_login_returns_503_when_saturated(
+        self, client: AsyncClient, test_user: User, saturated_password_pool
+    ):
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user.email, "password": "test1234"},
+        )
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
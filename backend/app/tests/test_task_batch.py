@@ -0,0 +1,176 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.models.project import Project, ProjectMember, ProjectRole
+from app.models.task import Task, TaskStatus
+
+
+def batch_url(project_id: int) -> str:
+    return f"/api/v1/projects/{project_id}/tasks:batch"
+
+
+class TestTaskBatch:
+    @pytest_asyncio.fixture
+    async def tasks(self, db_session, test_project):
+        """todo 컬럼 태스크 30개 + done 컬럼 태스크 1개"""
+        tasks = [Task(title=f"Card {i}", project_id=test_project.id) for i in range(30)]
+        tasks.append(Task(title="Done", project_id=test_project.id, status=TaskStatus.done))
+        db_session.add_all(tasks)
+        await db_session.flush()
+        return tasks
+
+    @pytest_asyncio.fixture
+    async def foreign_task(self, db_session, test_project):
+        project = Project(name="Other", owner_id=test_project.owner_id)
+        db_session.add(project)
+        await db_session.flush()
+        db_session.add(
+            ProjectMember(
+                user_id=test_project.owner_id, project_id=project.id, role=ProjectRole.owner
+            )
+        )
+        task = Task(title="Foreign", project_id=project.id)
+        db_session.add(task)
+        await db_session.flush()
+        return task
+
+    async def column_titles(self, client, auth_headers, project_id, task_status):
+        response = await client.get(
+            f"/api/v1/projects/{project_id}/tasks",
+            params={"status": task_status, "sort_by": "position", "sort_order": "asc"},
+            headers=auth_headers,
+        )
+        return [task["title"] for task in response.json()]
+
+    @pytest.mark.asyncio
+    async def test_move_many_to_done(
+        self, client: AsyncClient, auth_headers, test_project, tasks, query_counter
+    ):
+        """같은 값으로 바꾸는 30개는 UPDATE 한 문장, 요청 순서대로 컬럼 맨 앞"""
+        moved = list(reversed(tasks[:30]))
+        query_counter.clear()
+        response = await client.post(
+            batch_url(test_project.id),
+            json={
+                "operations": [{"op": "update", "id": task.id, "status": "done"} for task in moved]
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 200, response.text
+        results = response.json()["results"]
+        assert [result["id"] for result in results] == [task.id for task in moved]
+        assert all(result["outcome"] == "updated" for result in results)
+        assert all(result["task"]["status"] == "done" for result in results)
+
+        updates = [s for s in query_counter if s.lstrip().startswith("UPDATE tasks")]
+        assert len(updates) == 1
+        assert "ANY" in updates[0]
+        # 사용자 + 멤버십 + 잠금 + 컬럼 맨 앞 rank + UPDATE
+        assert len(query_counter) == 5
+
+        titles = await self.column_titles(client, auth_headers, test_project.id, "done")
+        assert titles == [task.title for task in moved] + ["Done"]
+        assert await self.column_titles(client, auth_headers, test_project.id, "todo") == []
+
+    @pytest.mark.asyncio
+    async def test_mixed_operations(
+        self,
+        client: AsyncClient,
+        auth_headers,
+        test_project,
+        test_user,
+        tasks,
+        foreign_task,
+        db_session,
+    ):
+        response = await client.post(
+            batch_url(test_project.id),
+            json={
+                "operations": [
+                    {"op": "update", "id": tasks[0].id, "assignee_id": test_user.id},
+                    {"op": "delete", "id": tasks[1].id},
+                    {"op": "update", "id": foreign_task.id, "title": "Hijacked"},
+                    {"op": "update", "id": tasks[2].id, "assignee_id": test_user.id},
+                    {"op": "delete", "id": 999_999},
+                    {"op": "update", "id": tasks[30].id, "status": "done", "priority": "high"},
+                ]
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 200, response.text
+        results = response.json()["results"]
+        assert [(result["op"], result["outcome"]) for result in results] == [
+            ("update", "updated"),
+            ("delete", "deleted"),
+            ("update", "not_found"),
+            ("update", "updated"),
+            ("delete", "not_found"),
+            ("update", "updated"),
+        ]
+        assert results[0]["task"]["assignee_id"] == test_user.id
+        assert results[1]["task"] is None
+        # 이미 done이던 태스크는 위치를 유지한다
+        assert results[5]["task"]["position"] == tasks[30].position
+        assert results[5]["task"]["priority"] == "high"
+
+        assert await db_session.get(Task, tasks[1].id, populate_existing=True) is None
+        foreign = await db_session.get(Task, foreign_task.id, populate_existing=True)
+        assert foreign.title == "Foreign"
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests(
+        self, client: AsyncClient, auth_headers, test_project, tasks, monkeypatch, db_session
+    ):
+        url = batch_url(test_project.id)
+        for operations in (
+            [],
+            [{"op": "update", "id": tasks[0].id}],
+            [{"op": "move", "id": tasks[0].id}],
+            [
+                {"op": "delete", "id": tasks[0].id},
+                {"op": "update", "id": tasks[0].id, "title": "x"},
+            ],
+        ):
+            response = await client.post(url, json={"operations": operations}, headers=auth_headers)
+            assert response.status_code == 422, operations
+
+        # NOT NULL 컬럼을 null로 바꾸는 작업은 DB까지 가지 않고 422 (배치 전체가 거부됨)
+        for field in ("title", "description", "status", "priority"):
+            response = await client.post(
+                url,
+                json={
+                    "operations": [
+                        {"op": "update", "id": tasks[1].id, "assignee_id": None},
+                        {"op": "update", "id": tasks[0].id, field: None},
+                    ]
+                },
+                headers=auth_headers,
+            )
+            assert response.status_code == 422, field
+            [error] = response.json()["detail"]
+            assert error["loc"][-1] == field
+
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "TASK_BATCH_MAX_OPERATIONS", 2)
+        response = await client.post(
+            url,
+            json={"operations": [{"op": "delete", "id": task.id} for task in tasks[:3]]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 413
+        count = await db_session.scalar(
+            select(func.count()).where(Task.project_id == test_project.id)
+        )
+        assert count == len(tasks)
+
+    @pytest.mark.asyncio
+    async def test_non_member(self, client: AsyncClient, other_auth_headers, test_project, tasks):
+        response = await client.post(
+            batch_url(test_project.id),
+            json={"operations": [{"op": "delete", "id": tasks[0].id}]},
+            headers=other_auth_headers,
+        )
+        assert response.status_code == 403
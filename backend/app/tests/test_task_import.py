@@ -0,0 +1,230 @@
+import json
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.models.project import ProjectMember
+from app.models.task import Task
+
+
+def import_url(project_id: int) -> str:
+    return f"/api/v1/projects/{project_id}/tasks:import"
+
+
+def csv_body(*lines: str) -> bytes:
+    return "\r\n".join(lines).encode("utf-8")
+
+
+def ndjson_body(*rows) -> bytes:
+    return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows).encode()
+
+
+class TestTaskImport:
+    @pytest_asyncio.fixture
+    async def member(self, db_session, test_project, other_user):
+        db_session.add(ProjectMember(user_id=other_user.id, project_id=test_project.id))
+        await db_session.flush()
+        return other_user
+
+    async def todo_titles(self, client, auth_headers, project_id):
+        response = await client.get(
+            f"/api/v1/projects/{project_id}/tasks",
+            params={"status": "todo", "sort_by": "position", "sort_order": "asc"},
+            headers=auth_headers,
+        )
+        return [task["title"] for task in response.json()]
+
+    @pytest.mark.asyncio
+    async def test_csv_appends_to_todo_in_file_order(
+        self, client: AsyncClient, auth_headers, test_project, test_task, member
+    ):
+        body = "﻿".encode() + csv_body(
+            "title,description,priority,assignee_id",
+            "첫째,,high,",
+            f'둘째,"여러 줄\r\n설명, 쉼표 포함",,{member.id}',
+            'third,"따옴표 ""안""",low,',
+        )
+        response = await client.post(
+            import_url(test_project.id),
+            content=body,
+            headers={**auth_headers, "Content-Type": "text/csv"},
+        )
+        assert response.status_code == 200, response.text
+        assert response.json() == {"imported": 3, "failed": 0, "errors": [], "dry_run": False}
+
+        assert await self.todo_titles(client, auth_headers, test_project.id) == [
+            "Test Task",
+            "첫째",
+            "둘째",
+            "third",
+        ]
+        tasks = (
+            await client.get(f"/api/v1/projects/{test_project.id}/tasks", headers=auth_headers)
+        ).json()
+        by_title = {task["title"]: task for task in tasks}
+        assert by_title["첫째"]["priority"] == "high"
+        assert by_title["첫째"]["description"] == ""
+        assert by_title["둘째"]["description"] == "여러 줄\n설명, 쉼표 포함"
+        assert by_title["둘째"]["assignee_id"] == member.id
+        assert by_title["둘째"]["priority"] == "medium"
+        assert by_title["third"]["description"] == '따옴표 "안"'
+
+    @pytest.mark.asyncio
+    async def test_per_row_errors(
+        self, client: AsyncClient, auth_headers, test_project, other_user, db_session
+    ):
+        body = csv_body(
+            "title,priority,assignee_id",
+            "ok 1,,",
+            ",high,",
+            "bad priority,urgent,",
+            f"not a member,,{other_user.id}",
+            "x" * 301 + ",,",
+            "too,many,columns,here",
+            "ok 2,low,",
+        )
+        response = await client.post(
+            import_url(test_project.id),
+            params={"format": "csv"},
+            content=body,
+            headers=auth_headers,
+        )
+        data = response.json()
+        assert data["imported"] == 2
+        assert data["failed"] == 5
+        assert [(error["row"], error["field"]) for error in data["errors"]] == [
+            (2, "title"),
+            (3, "priority"),
+            (4, "assignee_id"),
+            (5, "title"),
+            (6, None),
+        ]
+        count = await db_session.scalar(
+            select(func.count()).where(Task.project_id == test_project.id)
+        )
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self, client: AsyncClient, auth_headers, test_project):
+        body = ndjson_body(
+            {"title": "json 1", "priority": "critical"},
+            "",
+            "{broken",
+            "[1, 2]",
+            {"title": "json 2", "description": "설명"},
+        )
+        response = await client.post(
+            import_url(test_project.id),
+            content=body,
+            headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        )
+        data = response.json()
+        assert data["imported"] == 2
+        assert [error["row"] for error in data["errors"]] == [2, 3]
+        assert await self.todo_titles(client, auth_headers, test_project.id) == [
+            "json 1",
+            "json 2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_dry_run_writes_nothing(
+        self, client: AsyncClient, auth_headers, test_project, db_session
+    ):
+        response = await client.post(
+            import_url(test_project.id),
+            params={"format": "ndjson", "dry_run": True},
+            content=ndjson_body({"title": "a"}, {"title": "b"}, {"nope": 1}),
+            headers=auth_headers,
+        )
+        data = response.json()
+        assert (data["imported"], data["failed"], data["dry_run"]) == (2, 1, True)
+        count = await db_session.scalar(
+            select(func.count()).where(Task.project_id == test_project.id)
+        )
+        assert count == 0
+
+    @pytest.mark.asyncio
+    async def test_one_membership_query_per_chunk(
+        self, client: AsyncClient, auth_headers, test_project, test_user, member, query_counter
+    ):
+        rows = [
+            {"title": f"t{i}", "assignee_id": (test_user.id, member.id, None)[i % 3]}
+            for i in range(300)
+        ]
+        query_counter.clear()
+        response = await client.post(
+            import_url(test_project.id),
+            params={"format": "ndjson"},
+            content=ndjson_body(*rows),
+            headers=auth_headers,
+        )
+        assert response.json()["imported"] == 300
+        member_queries = [s for s in query_counter if "FROM project_members" in s and "ANY" in s]
+        assert len(member_queries) == 1
+        inserts = [s for s in query_counter if s.lstrip().startswith("INSERT INTO tasks")]
+        assert len(inserts) == 1
+
+    @pytest.mark.asyncio
+    async def test_chunks_share_membership_lookups(
+        self, client: AsyncClient, auth_headers, test_project, test_user, monkeypatch, query_counter
+    ):
+        monkeypatch.setattr("app.services.task_import.IMPORT_CHUNK_SIZE", 10)
+        rows = [{"title": f"t{i}", "assignee_id": test_user.id} for i in range(35)]
+        query_counter.clear()
+        response = await client.post(
+            import_url(test_project.id),
+            params={"format": "ndjson"},
+            content=ndjson_body(*rows),
+            headers=auth_headers,
+        )
+        assert response.json()["imported"] == 35
+        # 두 번째 청크부터는 이미 확인한 담당자라 조회하지 않는다
+        assert len([s for s in query_counter if "FROM project_members" in s and "ANY" in s]) == 1
+        titles = await self.todo_titles(client, auth_headers, test_project.id)
+        assert titles == [f"t{i}" for i in range(35)]
+
+    @pytest.mark.asyncio
+    async def test_too_many_rows(
+        self, client: AsyncClient, auth_headers, test_project, monkeypatch
+    ):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "TASK_IMPORT_MAX_ROWS", 2)
+        response = await client.post(
+            import_url(test_project.id),
+            params={"format": "ndjson"},
+            content=ndjson_body({"title": "a"}, {"title": "b"}, {"title": "c"}),
+            headers=auth_headers,
+        )
+        assert response.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_unknown_content_type_and_encoding(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        response = await client.post(
+            import_url(test_project.id),
+            content=b"{}",
+            headers={**auth_headers, "Content-Type": "application/xml"},
+        )
+        assert response.status_code == 415
+
+        response = await client.post(
+            import_url(test_project.id),
+            params={"format": "csv"},
+            content="title\n한글".encode("euc-kr"),
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_non_member(self, client: AsyncClient, other_auth_headers, test_project):
+        response = await client.post(
+            import_url(test_project.id),
+            params={"format": "csv"},
+            content=csv_body("title", "a"),
+            headers=other_auth_headers,
+        )
+        assert response.status_code == 403
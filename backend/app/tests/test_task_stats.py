@@ -0,0 +1,160 @@
+"""
+project_task_stats 트리거 집계 테스트
+
+API, Core 일괄 쓰기, 프로젝트 삭제 각각의 경로에서 집계가 tasks와 일치하는지,
+어긋난 집계를 점검/복구 함수가 찾아 고치는지 확인한다.
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, insert, select, update
+
+from app.models.project import Project, ProjectTaskStats
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.services.task_stats import find_task_stats_drift, repair_task_stats
+
+BASE = "/api/v1/projects"
+
+
+async def get_stats(db_session, project_id: int) -> ProjectTaskStats | None:
+    result = await db_session.execute(
+        select(ProjectTaskStats)
+        .where(ProjectTaskStats.project_id == project_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+class TestTaskStatsTriggers:
+    @pytest.mark.asyncio
+    async def test_new_project_starts_at_zero(self, db_session, test_project):
+        stats = await get_stats(db_session, test_project.id)
+        assert stats.total_count == 0
+        assert stats.todo_count == stats.medium_count == 0
+
+    @pytest.mark.asyncio
+    async def test_api_writes(self, client: AsyncClient, auth_headers, db_session, test_project):
+        tasks_url = f"{BASE}/{test_project.id}/tasks"
+        created = []
+        for priority in ("high", "high", "low"):
+            response = await client.post(
+                tasks_url, json={"title": "t", "priority": priority}, headers=auth_headers
+            )
+            created.append(response.json()["id"])
+
+        stats = await get_stats(db_session, test_project.id)
+        assert (stats.todo_count, stats.high_count, stats.low_count, stats.total_count) == (
+            3,
+            2,
+            1,
+            3,
+        )
+
+        await client.patch(
+            f"{tasks_url}/{created[0]}/status", json={"status": "done"}, headers=auth_headers
+        )
+        await client.put(
+            f"{tasks_url}/{created[1]}",
+            json={"status": "in_progress", "priority": "critical"},
+            headers=auth_headers,
+        )
+        # 상태/우선순위가 그대로인 수정과 이동은 집계에 영향 없음
+        await client.put(f"{tasks_url}/{created[2]}", json={"title": "x"}, headers=auth_headers)
+        await client.post(f"{tasks_url}/{created[2]}/move", json={}, headers=auth_headers)
+
+        stats = await get_stats(db_session, test_project.id)
+        assert (stats.todo_count, stats.in_progress_count, stats.done_count) == (1, 1, 1)
+        assert (stats.low_count, stats.high_count, stats.critical_count) == (1, 1, 1)
+
+        await client.delete(f"{tasks_url}/{created[0]}", headers=auth_headers)
+        stats = await get_stats(db_session, test_project.id)
+        assert (stats.done_count, stats.high_count, stats.total_count) == (0, 0, 2)
+
+    @pytest.mark.asyncio
+    async def test_bulk_statements(self, db_session, test_project, test_user):
+        other = Project(name="Other", owner_id=test_user.id)
+        db_session.add(other)
+        await db_session.flush()
+
+        await db_session.execute(
+            insert(Task),
+            [
+                {"title": f"t{i}", "project_id": project_id, "status": status}
+                for i, (project_id, status) in enumerate(
+                    [(test_project.id, TaskStatus.todo)] * 5
+                    + [(test_project.id, TaskStatus.done)] * 3
+                    + [(other.id, TaskStatus.in_progress)] * 2
+                )
+            ],
+        )
+        await db_session.execute(
+            update(Task)
+            .where(Task.project_id == test_project.id, Task.status == TaskStatus.todo)
+            .values(priority=TaskPriority.critical)
+        )
+        await db_session.execute(delete(Task).where(Task.status == TaskStatus.done))
+
+        stats = await get_stats(db_session, test_project.id)
+        assert (stats.todo_count, stats.done_count, stats.critical_count) == (5, 0, 5)
+        assert stats.medium_count == 0
+        stats = await get_stats(db_session, other.id)
+        assert (stats.in_progress_count, stats.medium_count, stats.total_count) == (2, 2, 2)
+        assert await find_task_stats_drift(db_session) == []
+
+    @pytest.mark.asyncio
+    async def test_project_delete_removes_stats(
+        self, client: AsyncClient, auth_headers, db_session, test_project, test_task
+    ):
+        from app.services.project_deletion import purge_project_deletion_step
+
+        response = await client.delete(f"{BASE}/{test_project.id}", headers=auth_headers)
+        assert response.status_code == 202
+        while await purge_project_deletion_step(db_session, response.json()["id"]):
+            pass
+        assert await get_stats(db_session, test_project.id) is None
+
+
+class TestTaskStatsRepair:
+    @pytest.mark.asyncio
+    async def test_detect_and_repair(self, db_session, test_project, test_task):
+        assert await find_task_stats_drift(db_session) == []
+
+        await db_session.execute(
+            update(ProjectTaskStats)
+            .where(ProjectTaskStats.project_id == test_project.id)
+            .values(todo_count=7)
+        )
+        [drift] = await find_task_stats_drift(db_session)
+        assert drift.project_id == test_project.id
+        assert drift.columns == {"todo_count": (7, 1)}
+
+        repaired = await repair_task_stats(db_session)
+        assert [d.project_id for d in repaired] == [test_project.id]
+        assert await find_task_stats_drift(db_session) == []
+
+    @pytest.mark.asyncio
+    async def test_repair_missing_row(self, db_session, test_project, test_task):
+        await db_session.execute(
+            delete(ProjectTaskStats).where(ProjectTaskStats.project_id == test_project.id)
+        )
+        [drift] = await find_task_stats_drift(db_session)
+        assert drift.columns["todo_count"] == (None, 1)
+
+        await repair_task_stats(db_session)
+        stats = await get_stats(db_session, test_project.id)
+        assert (stats.todo_count, stats.medium_count, stats.total_count) == (1, 1, 1)
+
+
+class TestProjectListStats:
+    @pytest.mark.asyncio
+    async def test_list_includes_counts(
+        self, client: AsyncClient, auth_headers, test_project, test_task, query_counter
+    ):
+        query_counter.clear()
+        response = await client.get(f"{BASE}/", headers=auth_headers)
+        assert response.status_code == 200
+        [project] = [p for p in response.json() if p["id"] == test_project.id]
+        assert project["task_stats"]["todo_count"] == 1
+        assert project["task_stats"]["total_count"] == 1
+        # 사용자 + 목록 (집계는 같은 쿼리의 조인)
+        assert len(query_counter) == 2
@@ -1,4 +1,5 @@
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 
 
@@ -147,6 +148,118 @@ class TestListTasks:
         assert response.status_code == 403
 
 
+class TestRowsResponse:
+    """목록 API는 response_model을 거치지 않고 컬럼 행을 바로 직렬화한다"""
+
+    @pytest_asyncio.fixture
+    async def created(self, client: AsyncClient, auth_headers, test_project, test_user):
+        """API로 만든 배정된 태스크 + 댓글 (상세 API는 TaskResponse로 검증된 모양)"""
+        task = (
+            await client.post(
+                tasks_url(test_project.id),
+                json={"title": "Shape", "description": "본문", "assignee_id": test_user.id},
+                headers=auth_headers,
+            )
+        ).json()
+        comment = (
+            await client.post(
+                comments_url(test_project.id, task["id"]),
+                json={"content": "댓글"},
+                headers=auth_headers,
+            )
+        ).json()
+        detail = await client.get(task_url(test_project.id, task["id"]), headers=auth_headers)
+        return detail.json(), comment
+
+    @pytest.mark.asyncio
+    async def test_items_match_response_model(
+        self, client: AsyncClient, auth_headers, test_project, created
+    ):
+        """목록/보드/변경분/내 태스크/댓글 항목이 response_model 직렬화와 같은 JSON"""
+        task, comment = created
+
+        listed = await client.get(tasks_url(test_project.id), headers=auth_headers)
+        assert listed.headers["content-type"] == "application/json"
+        assert listed.json() == [task]
+
+        page = await client.get(
+            tasks_url(test_project.id), params={"limit": 1}, headers=auth_headers
+        )
+        assert page.json() == [task]
+
+        board = (
+            await client.get(f"/api/v1/projects/{test_project.id}/board", headers=auth_headers)
+        ).json()
+        assert board["columns"][0] == {
+            "status": "todo",
+            "count": 1,
+            "tasks": [task],
+            "next_cursor": None,
+        }
+        assert [column["status"] for column in board["columns"]] == ["todo", "in_progress", "done"]
+
+        changes = (
+            await client.get(tasks_url(test_project.id) + "/changes", headers=auth_headers)
+        ).json()
+        assert changes["tasks"] == [task]
+        assert set(changes) == {"tasks", "deleted", "cursor", "has_more"}
+
+        mine = (await client.get("/api/v1/me/tasks", headers=auth_headers)).json()
+        assert mine == {
+            "tasks": [task],
+            "projects": {str(test_project.id): test_project.name},
+            "next_cursor": None,
+        }
+
+        comments = await client.get(comments_url(test_project.id, task["id"]), headers=auth_headers)
+        assert comments.json() == [comment]
+
+    @pytest.mark.asyncio
+    async def test_tombstone_shape(self, client: AsyncClient, auth_headers, test_project, created):
+        task, _ = created
+        await client.delete(task_url(test_project.id, task["id"]), headers=auth_headers)
+        changes = (
+            await client.get(tasks_url(test_project.id) + "/changes", headers=auth_headers)
+        ).json()
+        assert changes["tasks"] == []
+        assert [set(item) for item in changes["deleted"]] == [{"id", "deleted_at"}]
+        assert changes["deleted"][0]["id"] == task["id"]
+
+    @pytest.mark.asyncio
+    async def test_headers_carried_over(
+        self, client: AsyncClient, auth_headers, test_project, created
+    ):
+        """ETag, 커서 헤더가 직접 만든 응답에도 붙는다"""
+        await client.post(
+            tasks_url(test_project.id), json={"title": "Second"}, headers=auth_headers
+        )
+        response = await client.get(
+            tasks_url(test_project.id), params={"limit": 1}, headers=auth_headers
+        )
+        assert response.headers["etag"].startswith('W/"')
+        assert "x-next-cursor" in response.headers
+        assert response.headers["content-length"] == str(len(response.content))
+
+    def test_repeated_headers_preserved(self):
+        from fastapi import Response
+        from fastapi.responses import ORJSONResponse
+
+        from app.core.responses import rows_response
+
+        sub_response = Response()
+        del sub_response.headers["content-length"]
+        sub_response.headers.append("Set-Cookie", "a=1")
+        sub_response.headers.append("Set-Cookie", "b=2")
+        sub_response.headers["ETag"] = 'W/"1-1"'
+
+        response = rows_response(sub_response, [{"id": 1}])
+        assert isinstance(response, ORJSONResponse)
+        assert response.body == b'[{"id":1}]'
+        assert response.headers.getlist("set-cookie") == ["a=1", "b=2"]
+        assert response.headers["etag"] == 'W/"1-1"'
+        assert response.headers.getlist("content-length") == ["10"]
+
+
 class TestGetTask:
     @pytest.mark.asyncio
     async def test_get_task_success(
@@ -362,3 +475,984 @@ class TestListComments:
             headers=other_auth_headers,
         )
         assert response.status_code == 403
+
+
+class TestListTasksPagination:
+    @pytest_asyncio.fixture
+    async def many_tasks(self, db_session, test_project, test_user):
+        from app.models.task import Task, TaskPriority, TaskStatus
+
+        # 같은 트랜잭션에서 생성되므로 created_at/updated_at이 모두 같다 (동점 처리 확인)
+        tasks = [
+            Task(
+                title=f"Task {i % 3}",
+                project_id=test_project.id,
+                status=list(TaskStatus)[i % 3],
+                priority=list(TaskPriority)[i % 4],
+                assignee_id=test_user.id if i % 2 else None,
+            )
+            for i in range(11)
+        ]
+        db_session.add_all(tasks)
+        await db_session.flush()
+        return tasks
+
+    async def collect_pages(self, client, auth_headers, project_id, params, limit=3):
+        ids, cursor, pages = [], None, 0
+        while True:
+            page_params = {**params, "limit": limit}
+            if cursor:
+                page_params["cursor"] = cursor
+            response = await client.get(
+                tasks_url(project_id), params=page_params, headers=auth_headers
+            )
+            assert response.status_code == 200
+            assert len(response.json()) <= limit
+            ids.extend(t["id"] for t in response.json())
+            pages += 1
+            cursor = response.headers.get("x-next-cursor")
+            if cursor is None:
+                return ids, pages
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_by", ["created_at", "updated_at", "title", "priority", "status"])
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    async def test_pages_match_full_list(
+        self, client: AsyncClient, auth_headers: dict, test_project, many_tasks, sort_by, sort_order
+    ):
+        params = {"sort_by": sort_by, "sort_order": sort_order}
+        full = await client.get(tasks_url(test_project.id), params=params, headers=auth_headers)
+        expected = [t["id"] for t in full.json()]
+
+        ids, pages = await self.collect_pages(client, auth_headers, test_project.id, params)
+        assert ids == expected
+        assert pages == 4
+
+    @pytest.mark.asyncio
+    async def test_priority_sorts_by_rank(
+        self, client: AsyncClient, auth_headers: dict, test_project, many_tasks
+    ):
+        params = {"sort_by": "priority", "sort_order": "desc", "limit": 3}
+        response = await client.get(tasks_url(test_project.id), params=params, headers=auth_headers)
+        assert [t["priority"] for t in response.json()] == ["critical", "critical", "high"]
+
+        ids, _ = await self.collect_pages(
+            client, auth_headers, test_project.id, {"sort_by": "priority", "sort_order": "asc"}
+        )
+        ranks = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+        by_id = {t.id: ranks[t.priority.value] for t in many_tasks}
+        assert [by_id[i] for i in ids] == sorted(by_id[i] for i in ids)
+
+    @pytest.mark.asyncio
+    async def test_pages_with_filters(
+        self, client: AsyncClient, auth_headers: dict, test_project, test_user, many_tasks
+    ):
+        params = {"assignee_id": test_user.id, "status": "todo", "sort_by": "title"}
+        full = await client.get(tasks_url(test_project.id), params=params, headers=auth_headers)
+        expected = [t["id"] for t in full.json()]
+        assert expected
+
+        ids, _ = await self.collect_pages(client, auth_headers, test_project.id, params, limit=1)
+        assert ids == expected
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, client: AsyncClient, auth_headers: dict, test_project):
+        response = await client.get(
+            tasks_url(test_project.id),
+            params={"limit": 2, "cursor": "not-a-cursor"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_cursor_sort_mismatch(
+        self, client: AsyncClient, auth_headers: dict, test_project, many_tasks
+    ):
+        response = await client.get(
+            tasks_url(test_project.id), params={"limit": 2}, headers=auth_headers
+        )
+        cursor = response.headers["x-next-cursor"]
+
+        response = await client.get(
+            tasks_url(test_project.id),
+            params={"limit": 2, "cursor": cursor, "sort_by": "title"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_card_view_selects_card_columns(
+        self, client: AsyncClient, auth_headers: dict, test_project, many_tasks, query_counter
+    ):
+        from app.schemas.task import TASK_CARD_FIELDS
+
+        params = {"sort_by": "priority", "sort_order": "desc"}
+        full = await client.get(tasks_url(test_project.id), params=params, headers=auth_headers)
+
+        query_counter.clear()
+        response = await client.get(
+            tasks_url(test_project.id), params={**params, "view": "card"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert [t["id"] for t in response.json()] == [t["id"] for t in full.json()]
+        assert all(tuple(t) == TASK_CARD_FIELDS for t in response.json())
+        # description은 SELECT 목록에도 없다
+        [task_query] = [q for q in query_counter if "FROM tasks" in q]
+        assert "description" not in task_query
+
+    @pytest.mark.asyncio
+    async def test_fields_with_cursor(
+        self, client: AsyncClient, auth_headers: dict, test_project, many_tasks
+    ):
+        params = {"sort_by": "updated_at", "fields": "title, status", "limit": 6}
+        first = await client.get(tasks_url(test_project.id), params=params, headers=auth_headers)
+        assert first.status_code == 200
+        assert [set(t) for t in first.json()] == [{"id", "title", "status"}] * 6
+
+        # 정렬 컬럼(updated_at)을 응답에서 빼도 커서는 만들어진다
+        second = await client.get(
+            tasks_url(test_project.id),
+            params={**params, "cursor": first.headers["x-next-cursor"]},
+            headers=auth_headers,
+        )
+        ids = [t["id"] for t in first.json() + second.json()]
+        assert sorted(ids) == sorted(t.id for t in many_tasks)
+
+    @pytest.mark.asyncio
+    async def test_unknown_field(self, client: AsyncClient, auth_headers: dict, test_project):
+        response = await client.get(
+            tasks_url(test_project.id), params={"fields": "title,secret"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+        response = await client.get(
+            tasks_url(test_project.id), params={"view": "tiny"}, headers=auth_headers
+        )
+        assert response.status_code == 422
+
+
+class TestTaskWriteQueries:
+    """쓰기 요청은 인증/멤버십 확인 후 문장 하나로 처리한다"""
+
+    @pytest_asyncio.fixture
+    async def other_project(self, db_session, test_project):
+        from app.models.project import Project, ProjectMember, ProjectRole
+
+        project = Project(name="Other", owner_id=test_project.owner_id)
+        db_session.add(project)
+        await db_session.flush()
+        db_session.add(
+            ProjectMember(
+                user_id=test_project.owner_id,
+                project_id=project.id,
+                role=ProjectRole.owner,
+            )
+        )
+        await db_session.flush()
+        return project
+
+    WRITES = [
+        ("put", "", {"title": "Renamed"}),
+        ("patch", "/status", {"status": "done"}),
+        ("delete", "", None),
+        ("post", "/comments", {"content": "hi"}),
+    ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,suffix,body", WRITES)
+    async def test_single_write_statement(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_project,
+        test_task,
+        query_counter,
+        method,
+        suffix,
+        body,
+    ):
+        query_counter.clear()
+        kwargs = (
+            {"headers": auth_headers} if body is None else {"headers": auth_headers, "json": body}
+        )
+        response = await client.request(
+            method.upper(), task_url(test_project.id, test_task.id) + suffix, **kwargs
+        )
+        assert response.status_code < 300
+        # 사용자 + 멤버십 + 쓰기(RETURNING)
+        assert len(query_counter) == 3
+
+    @pytest.mark.asyncio
+    async def test_create_task_single_statement(
+        self, client: AsyncClient, auth_headers: dict, test_project, query_counter
+    ):
+        query_counter.clear()
+        response = await client.post(
+            tasks_url(test_project.id), json={"title": "New"}, headers=auth_headers
+        )
+        assert response.status_code == 201
+        assert response.json()["created_at"]
+        assert len(query_counter) == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,suffix,body", WRITES)
+    async def test_foreign_task_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_task,
+        other_project,
+        db_session,
+        method,
+        suffix,
+        body,
+    ):
+        """다른 프로젝트의 태스크 ID로 쓰기 시 404, 태스크는 그대로"""
+        from app.models.task import Task, TaskStatus
+
+        kwargs = (
+            {"headers": auth_headers} if body is None else {"headers": auth_headers, "json": body}
+        )
+        response = await client.request(
+            method.upper(), task_url(other_project.id, test_task.id) + suffix, **kwargs
+        )
+        assert response.status_code == 404
+
+        task = await db_session.get(Task, test_task.id, populate_existing=True)
+        assert task is not None
+        assert task.title == "Test Task"
+        assert task.status == TaskStatus.todo
+
+    @pytest.mark.asyncio
+    async def test_status_change_returns_fresh_row(
+        self, client: AsyncClient, auth_headers: dict, test_project, test_task
+    ):
+        response = await client.patch(
+            task_url(test_project.id, test_task.id) + "/status",
+            json={"status": "in_progress"},
+            headers=auth_headers,
+        )
+        data = response.json()
+        assert data["status"] == "in_progress"
+        assert data["title"] == "Test Task"
+        assert data["updated_at"]
+
+
+class TestTaskBoard:
+    @pytest_asyncio.fixture
+    async def board_tasks(self, db_session, test_project):
+        """todo 5, in_progress 2, done 0"""
+        from app.models.task import Task, TaskPriority, TaskStatus
+
+        tasks = [
+            Task(
+                title=f"Todo {i}",
+                project_id=test_project.id,
+                priority=list(TaskPriority)[i % 4],
+            )
+            for i in range(5)
+        ] + [
+            Task(title=f"Doing {i}", project_id=test_project.id, status=TaskStatus.in_progress)
+            for i in range(2)
+        ]
+        db_session.add_all(tasks)
+        await db_session.flush()
+        return tasks
+
+    def board_url(self, project_id: int) -> str:
+        return f"/api/v1/projects/{project_id}/board"
+
+    @pytest.mark.asyncio
+    async def test_columns_and_counts(
+        self, client: AsyncClient, auth_headers: dict, test_project, board_tasks
+    ):
+        response = await client.get(
+            self.board_url(test_project.id), params={"limit": 3}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        columns = {c["status"]: c for c in response.json()["columns"]}
+        assert [c["status"] for c in response.json()["columns"]] == ["todo", "in_progress", "done"]
+
+        assert columns["todo"]["count"] == 5
+        assert len(columns["todo"]["tasks"]) == 3
+        assert columns["todo"]["next_cursor"] is not None
+        assert columns["in_progress"]["count"] == 2
+        assert len(columns["in_progress"]["tasks"]) == 2
+        assert columns["in_progress"]["next_cursor"] is None
+        assert columns["done"] == {"status": "done", "count": 0, "tasks": [], "next_cursor": None}
+
+    @pytest.mark.asyncio
+    async def test_column_order_matches_list(
+        self, client: AsyncClient, auth_headers: dict, test_project, board_tasks
+    ):
+        params = {"sort_by": "priority", "sort_order": "desc"}
+        board = await client.get(
+            self.board_url(test_project.id), params={**params, "limit": 3}, headers=auth_headers
+        )
+        todo = board.json()["columns"][0]
+
+        full = await client.get(
+            tasks_url(test_project.id), params={**params, "status": "todo"}, headers=auth_headers
+        )
+        assert [t["id"] for t in todo["tasks"]] == [t["id"] for t in full.json()][:3]
+
+        # 컬럼 커서로 태스크 목록 API에서 나머지를 이어서 조회
+        more = await client.get(
+            tasks_url(test_project.id),
+            params={**params, "status": "todo", "limit": 3, "cursor": todo["next_cursor"]},
+            headers=auth_headers,
+        )
+        assert [t["id"] for t in more.json()] == [t["id"] for t in full.json()][3:]
+        assert "x-next-cursor" not in more.headers
+
+    @pytest.mark.asyncio
+    async def test_board_single_query(
+        self, client: AsyncClient, auth_headers: dict, test_project, board_tasks, query_counter
+    ):
+        query_counter.clear()
+        response = await client.get(self.board_url(test_project.id), headers=auth_headers)
+        assert response.status_code == 200
+        # 사용자 + 멤버십 + 보드
+        assert len(query_counter) == 3
+
+    @pytest.mark.asyncio
+    async def test_board_burst_coalesced(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_project,
+        board_tasks,
+        db_session,
+        query_counter,
+    ):
+        """같은 version을 본 동시 보드 조회는 쿼리 한 번, 쓰기 후에는 새로 조회"""
+        import asyncio
+
+        from app.core.cache import coalesced_reads
+        from app.services.project import get_project_version
+        from app.services.task import get_task_board
+
+        version = await get_project_version(db_session, test_project.id)
+        query_counter.clear()
+        boards = await asyncio.gather(
+            *(get_task_board(db_session, test_project.id, version=version) for _ in range(10))
+        )
+        assert len(query_counter) == 1
+        assert all(board == boards[0] for board in boards)
+        assert coalesced_reads.snapshot() == {
+            "hits": 9,
+            "misses": 1,
+            "failures": 0,
+            "inflight": 0,
+        }
+
+        await client.post(
+            tasks_url(test_project.id), json={"title": "After standup"}, headers=auth_headers
+        )
+        response = await client.get(self.board_url(test_project.id), headers=auth_headers)
+        columns = {c["status"]: c for c in response.json()["columns"]}
+        assert columns["todo"]["count"] == 6
+
+    @pytest.mark.asyncio
+    async def test_board_card_view(
+        self, client: AsyncClient, auth_headers: dict, test_project, board_tasks
+    ):
+        from app.schemas.task import TASK_CARD_FIELDS
+
+        params = {"limit": 3}
+        full = await client.get(
+            self.board_url(test_project.id), params=params, headers=auth_headers
+        )
+        card = await client.get(
+            self.board_url(test_project.id), params={**params, "view": "card"}, headers=auth_headers
+        )
+        assert card.status_code == 200
+        for full_column, card_column in zip(
+            full.json()["columns"], card.json()["columns"], strict=True
+        ):
+            assert card_column["count"] == full_column["count"]
+            assert card_column["next_cursor"] == full_column["next_cursor"]
+            assert [t["id"] for t in card_column["tasks"]] == [
+                t["id"] for t in full_column["tasks"]
+            ]
+            assert all(tuple(t) == TASK_CARD_FIELDS for t in card_column["tasks"])
+
+    @pytest.mark.asyncio
+    async def test_board_non_member(
+        self, client: AsyncClient, other_auth_headers: dict, test_project
+    ):
+        response = await client.get(self.board_url(test_project.id), headers=other_auth_headers)
+        assert response.status_code == 403
+
+
+class TestSearchTasks:
+    @pytest_asyncio.fixture
+    async def search_tasks(self, db_session, test_project, test_user):
+        from app.models.comment import Comment
+        from app.models.task import Task
+
+        tasks = [
+            Task(
+                title="로그인 화면 구현",
+                description="소셜 로그인을 지원한다",
+                project_id=test_project.id,
+            ),
+            Task(
+                title="API 설계",
+                description="로그인한 사용자의 토큰 갱신",
+                project_id=test_project.id,
+            ),
+            Task(title="배포 파이프라인", description="CI 설정", project_id=test_project.id),
+        ]
+        db_session.add_all(tasks)
+        await db_session.flush()
+        db_session.add(
+            Comment(content="스테이징 배포는 금요일", task_id=tasks[1].id, author_id=test_user.id)
+        )
+        await db_session.flush()
+        return tasks
+
+    def search_url(self, project_id: int) -> str:
+        return f"/api/v1/projects/{project_id}/tasks/search"
+
+    @pytest.mark.asyncio
+    async def test_ranked_korean_prefix_match(
+        self, client: AsyncClient, auth_headers: dict, test_project, search_tasks
+    ):
+        response = await client.get(
+            self.search_url(test_project.id), params={"q": "로그인"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        # 제목 일치(가중치 A)가 설명 일치보다 먼저, 조사가 붙은 "로그인을"/"로그인한"도 일치
+        assert [t["id"] for t in data] == [search_tasks[0].id, search_tasks[1].id]
+        assert data[0]["rank"] > data[1]["rank"]
+        assert data[0]["title_highlight"] == "<mark>로그인</mark> 화면 구현"
+        assert "<mark>로그인한</mark>" in data[1]["description_highlight"]
+
+    @pytest.mark.asyncio
+    async def test_all_terms_required(
+        self, client: AsyncClient, auth_headers: dict, test_project, search_tasks
+    ):
+        response = await client.get(
+            self.search_url(test_project.id), params={"q": "api 토큰"}, headers=auth_headers
+        )
+        assert [t["id"] for t in response.json()] == [search_tasks[1].id]
+
+    @pytest.mark.asyncio
+    async def test_highlight_escapes_html(
+        self, client: AsyncClient, auth_headers: dict, db_session, test_project
+    ):
+        from app.models.task import Task
+
+        db_session.add(
+            Task(
+                title="<script>alert(1)</script> 배포",
+                description='<img src=x onerror="alert(1)"> 배포 & 롤백',
+                project_id=test_project.id,
+            )
+        )
+        await db_session.flush()
+        response = await client.get(
+            self.search_url(test_project.id), params={"q": "배포"}, headers=auth_headers
+        )
+        [result] = response.json()
+        assert result["title_highlight"] == (
+            "&lt;script&gt;alert(1)&lt;/script&gt; <mark>배포</mark>"
+        )
+        description = result["description_highlight"]
+        assert "<mark>배포</mark> &amp; 롤백" in description
+        assert "<" not in description.replace("<mark>", "").replace("</mark>", "")
+        assert result["title"] == "<script>alert(1)</script> 배포"
+
+    @pytest.mark.asyncio
+    async def test_include_comments(
+        self, client: AsyncClient, auth_headers: dict, test_project, search_tasks
+    ):
+        url = self.search_url(test_project.id)
+        response = await client.get(url, params={"q": "스테이징"}, headers=auth_headers)
+        assert response.json() == []
+
+        response = await client.get(
+            url, params={"q": "스테이징", "include_comments": True}, headers=auth_headers
+        )
+        assert [t["id"] for t in response.json()] == [search_tasks[1].id]
+
+        # 태스크 본문과 댓글 모두 일치하면 합산된 rank로 정렬
+        response = await client.get(
+            url, params={"q": "배포", "include_comments": True}, headers=auth_headers
+        )
+        assert [t["id"] for t in response.json()] == [search_tasks[2].id, search_tasks[1].id]
+
+    @pytest.mark.asyncio
+    async def test_pagination(
+        self, client: AsyncClient, auth_headers: dict, db_session, test_project
+    ):
+        from app.models.task import Task
+
+        db_session.add_all(
+            Task(title=f"검색 {'대상 ' * (i % 3)}{i}", project_id=test_project.id) for i in range(7)
+        )
+        await db_session.flush()
+        url = self.search_url(test_project.id)
+        full = await client.get(url, params={"q": "검색", "limit": 50}, headers=auth_headers)
+        expected = [t["id"] for t in full.json()]
+        assert len(expected) == 7
+
+        ids, cursor = [], None
+        while True:
+            params = {"q": "검색", "limit": 3, **({"cursor": cursor} if cursor else {})}
+            response = await client.get(url, params=params, headers=auth_headers)
+            ids.extend(t["id"] for t in response.json())
+            cursor = response.headers.get("x-next-cursor")
+            if cursor is None:
+                break
+        assert ids == expected
+
+        # 다른 검색어의 커서는 거부
+        first = await client.get(url, params={"q": "검색", "limit": 3}, headers=auth_headers)
+        response = await client.get(
+            url,
+            params={"q": "대상", "cursor": first.headers["x-next-cursor"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_scoped_to_project(
+        self, client: AsyncClient, auth_headers: dict, db_session, test_project, other_user
+    ):
+        from app.models.project import Project
+        from app.models.task import Task
+
+        other = Project(name="Other", owner_id=other_user.id)
+        db_session.add(other)
+        await db_session.flush()
+        db_session.add(Task(title="비밀 로그인", project_id=other.id))
+        await db_session.flush()
+
+        response = await client.get(
+            self.search_url(test_project.id), params={"q": "비밀"}, headers=auth_headers
+        )
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("q", ["", "&|!:*"])
+    async def test_invalid_query(self, client: AsyncClient, auth_headers: dict, test_project, q):
+        response = await client.get(
+            self.search_url(test_project.id), params={"q": q}, headers=auth_headers
+        )
+        assert response.status_code in (400, 422)
+
+    @pytest.mark.asyncio
+    async def test_search_non_member(
+        self, client: AsyncClient, other_auth_headers: dict, test_project
+    ):
+        response = await client.get(
+            self.search_url(test_project.id), params={"q": "x"}, headers=other_auth_headers
+        )
+        assert response.status_code == 403
+
+
+class TestMoveTask:
+    @pytest_asyncio.fixture
+    async def cards(self, client: AsyncClient, auth_headers: dict, test_project):
+        """API로 생성한 todo 카드 3개 (새 카드가 맨 앞이므로 C, B, A 순)"""
+        created = []
+        for title in ("A", "B", "C"):
+            response = await client.post(
+                tasks_url(test_project.id), json={"title": title}, headers=auth_headers
+            )
+            created.append(response.json())
+        return {task["title"]: task for task in created}
+
+    async def column(self, client, auth_headers, project_id, status="todo"):
+        response = await client.get(f"/api/v1/projects/{project_id}/board", headers=auth_headers)
+        [column] = [c for c in response.json()["columns"] if c["status"] == status]
+        return [t["title"] for t in column["tasks"]]
+
+    def move_url(self, project_id: int, task_id: int) -> str:
+        return task_url(project_id, task_id) + "/move"
+
+    @pytest.mark.asyncio
+    async def test_new_cards_on_top(self, client: AsyncClient, auth_headers, test_project, cards):
+        assert await self.column(client, auth_headers, test_project.id) == ["C", "B", "A"]
+        assert cards["C"]["position"] < cards["B"]["position"] < cards["A"]["position"]
+
+    @pytest.mark.asyncio
+    async def test_move_between_writes_one_row(
+        self, client: AsyncClient, auth_headers, test_project, cards, query_counter
+    ):
+        query_counter.clear()
+        response = await client.post(
+            self.move_url(test_project.id, cards["C"]["id"]),
+            json={"after_id": cards["B"]["id"], "before_id": cards["A"]["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        # (캐시되지 않은) 사용자/멤버십 조회 외에는 잠금 SELECT 하나와 UPDATE 한 행뿐
+        work = [q for q in query_counter if "FROM tasks" in q or q.startswith("UPDATE")]
+        assert len(work) == 2
+        assert work[0].rstrip().endswith("FOR UPDATE")
+        assert work[1].startswith("UPDATE tasks")
+        assert await self.column(client, auth_headers, test_project.id) == ["B", "C", "A"]
+
+    @pytest.mark.asyncio
+    async def test_move_to_ends(self, client: AsyncClient, auth_headers, test_project, cards):
+        await client.post(
+            self.move_url(test_project.id, cards["C"]["id"]),
+            json={"after_id": cards["A"]["id"]},
+            headers=auth_headers,
+        )
+        assert await self.column(client, auth_headers, test_project.id) == ["B", "A", "C"]
+
+        await client.post(
+            self.move_url(test_project.id, cards["A"]["id"]),
+            json={"before_id": cards["B"]["id"]},
+            headers=auth_headers,
+        )
+        assert await self.column(client, auth_headers, test_project.id) == ["A", "B", "C"]
+
+    @pytest.mark.asyncio
+    async def test_move_to_other_column(
+        self, client: AsyncClient, auth_headers, test_project, cards
+    ):
+        response = await client.post(
+            self.move_url(test_project.id, cards["B"]["id"]),
+            json={"status": "done"},
+            headers=auth_headers,
+        )
+        assert response.json()["status"] == "done"
+        response = await client.post(
+            self.move_url(test_project.id, cards["A"]["id"]),
+            json={"status": "done", "after_id": cards["B"]["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert await self.column(client, auth_headers, test_project.id, "done") == ["B", "A"]
+        assert await self.column(client, auth_headers, test_project.id) == ["C"]
+
+    @pytest.mark.asyncio
+    async def test_status_change_moves_to_top(
+        self, client: AsyncClient, auth_headers, test_project, cards
+    ):
+        for title in ("A", "C"):
+            await client.patch(
+                task_url(test_project.id, cards[title]["id"]) + "/status",
+                json={"status": "in_progress"},
+                headers=auth_headers,
+            )
+        column = await self.column(client, auth_headers, test_project.id, "in_progress")
+        assert column == ["C", "A"]
+
+        # 같은 상태로 변경하면 위치 유지
+        await client.patch(
+            task_url(test_project.id, cards["A"]["id"]) + "/status",
+            json={"status": "in_progress"},
+            headers=auth_headers,
+        )
+        column = await self.column(client, auth_headers, test_project.id, "in_progress")
+        assert column == ["C", "A"]
+
+    @pytest.mark.asyncio
+    async def test_stale_neighbour_conflict(
+        self, client: AsyncClient, auth_headers, test_project, cards
+    ):
+        await client.patch(
+            task_url(test_project.id, cards["A"]["id"]) + "/status",
+            json={"status": "done"},
+            headers=auth_headers,
+        )
+        response = await client.post(
+            self.move_url(test_project.id, cards["C"]["id"]),
+            json={"after_id": cards["B"]["id"], "before_id": cards["A"]["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_move_foreign_task_not_found(
+        self, client: AsyncClient, auth_headers, test_project, cards
+    ):
+        response = await client.post(
+            self.move_url(test_project.id, 999999), json={}, headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_tied_neighbours_rebalanced(
+        self, client: AsyncClient, auth_headers, test_project, cards, db_session
+    ):
+        from sqlalchemy import select, update
+
+        from app.models.task import Task
+
+        # 동시 생성으로 A와 B의 rank가 같아진 상황 (같은 rank끼리는 id 순이라 A, B)
+        await db_session.execute(
+            update(Task)
+            .where(Task.id.in_([cards["A"]["id"], cards["B"]["id"]]))
+            .values(position="a5")
+        )
+        response = await client.post(
+            self.move_url(test_project.id, cards["C"]["id"]),
+            json={"after_id": cards["A"]["id"], "before_id": cards["B"]["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert await self.column(client, auth_headers, test_project.id) == ["A", "C", "B"]
+        result = await db_session.execute(
+            select(Task.title, Task.position).where(Task.project_id == test_project.id)
+        )
+        positions = dict(result.tuples().all())
+        assert len(set(positions.values())) == 3
+        assert positions["A"] == "a5"
+
+        # 순서가 반대인 같은 rank 이웃은 충돌
+        response = await client.post(
+            self.move_url(test_project.id, cards["C"]["id"]),
+            json={"after_id": cards["B"]["id"], "before_id": cards["A"]["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_tied_neighbours_rewrite_only_tied_rows(
+        self, client: AsyncClient, auth_headers, test_project, cards, db_session, query_counter
+    ):
+        from sqlalchemy import update
+
+        from app.models.task import Task
+
+        await db_session.execute(
+            update(Task)
+            .where(Task.id.in_([cards["A"]["id"], cards["B"]["id"]]))
+            .values(position="a5")
+        )
+        query_counter.clear()
+        response = await client.post(
+            self.move_url(test_project.id, cards["C"]["id"]),
+            json={"after_id": cards["A"]["id"], "before_id": cards["B"]["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        # 컬럼 전체 재배치 없이 같은 rank의 두 행 + 이동한 행만 수정
+        updates = [q for q in query_counter if q.lstrip().startswith("UPDATE tasks")]
+        assert len(updates) == 2
+        assert "WHERE tasks.id = $" in updates[0]
+
+
+class TestRebalanceTaskColumn:
+    @pytest.mark.asyncio
+    async def test_head_inserts_stay_short(self, db_session, test_project):
+        """새 카드는 컬럼 맨 앞에 놓이지만 rank가 길어지지 않아 재배치가 필요 없다"""
+        from app.schemas.task import TaskCreate
+        from app.services.task import create_task, needs_rebalance
+
+        tasks = [
+            await create_task(db_session, test_project.id, TaskCreate(title=f"T{i}"))
+            for i in range(200)
+        ]
+        positions = [task.position for task in tasks]
+        assert positions == sorted(positions, reverse=True)
+        assert max(map(len, positions)) <= 3
+        assert not any(needs_rebalance(task) for task in tasks)
+
+    @pytest.mark.asyncio
+    async def test_rebalance_keeps_order(self, db_session, test_project):
+        from datetime import datetime
+
+        from sqlalchemy import func, select, update
+
+        from app.core.ranking import rank_between
+        from app.models.task import Task, TaskStatus
+        from app.services.task import rebalance_task_column
+
+        # 같은 두 카드 사이로 이동을 반복해 rank가 길어진 컬럼
+        lower, upper = "a5", "a6"
+        positions = [lower, upper]
+        for i in range(38):
+            position = rank_between(lower, upper)
+            positions.append(position)
+            lower, upper = (position, upper) if i % 2 else (lower, position)
+        tasks = [
+            Task(title=f"T{i}", project_id=test_project.id, position=position)
+            for i, position in enumerate(positions)
+        ]
+        db_session.add_all(tasks)
+        await db_session.flush()
+        before = [t.id for t in sorted(tasks, key=lambda t: t.position)]
+        assert max(len(t.position) for t in tasks) > 5
+
+        # 재배치된 행은 변경분 동기화로 전달되도록 updated_at이 갱신된다
+        await db_session.execute(
+            update(Task)
+            .where(Task.project_id == test_project.id)
+            .values(updated_at=datetime(2020, 1, 1))
+        )
+        changed = await rebalance_task_column(db_session, test_project.id, TaskStatus.todo)
+        assert changed == 40
+        stale = await db_session.scalar(
+            select(func.count()).where(
+                Task.project_id == test_project.id, Task.updated_at == datetime(2020, 1, 1)
+            )
+        )
+        assert stale == 0
+
+        result = await db_session.execute(
+            select(Task.id, Task.position)
+            .where(Task.project_id == test_project.id)
+            .order_by(Task.position, Task.id)
+        )
+        rows = result.all()
+        assert [row.id for row in rows] == before
+        assert max(len(row.position) for row in rows) == 2
+
+
+class TestTaskChanges:
+    @pytest.fixture(autouse=True)
+    def no_settle_window(self, monkeypatch):
+        # 테스트는 한 트랜잭션이라 now()가 고정이므로 지연 구간 없이 확인
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "TASK_SYNC_SETTLE_SECONDS", 0.0)
+
+    @pytest_asyncio.fixture
+    async def old_tasks(self, db_session, test_project):
+        """한 시간 이상 전에 마지막으로 수정된 태스크 200개"""
+        from datetime import datetime, timedelta
+
+        from app.models.task import Task
+
+        base = datetime.now() - timedelta(days=1)
+        tasks = [
+            Task(
+                title=f"Old {i}",
+                project_id=test_project.id,
+                created_at=base,
+                updated_at=base + timedelta(seconds=i),
+            )
+            for i in range(200)
+        ]
+        db_session.add_all(tasks)
+        await db_session.flush()
+        return tasks
+
+    def changes_url(self, project_id: int) -> str:
+        return tasks_url(project_id) + "/changes"
+
+    async def sync(self, client, auth_headers, project_id, since=None, limit=None):
+        params = {}
+        if since is not None:
+            params["since"] = since
+        if limit is not None:
+            params["limit"] = limit
+        response = await client.get(
+            self.changes_url(project_id), params=params, headers=auth_headers
+        )
+        assert response.status_code == 200, response.text
+        return response
+
+    @pytest.mark.asyncio
+    async def test_initial_sync_pages(
+        self, client: AsyncClient, auth_headers, test_project, old_tasks
+    ):
+        seen = []
+        since = None
+        while True:
+            data = (await self.sync(client, auth_headers, test_project.id, since, limit=64)).json()
+            seen += [t["id"] for t in data["tasks"]]
+            since = data["cursor"]
+            if not data["has_more"]:
+                break
+        assert seen == [t.id for t in old_tasks]
+
+        data = (await self.sync(client, auth_headers, test_project.id, since)).json()
+        assert data["tasks"] == [] and data["deleted"] == []
+
+    @pytest.mark.asyncio
+    async def test_edits_and_tombstones_are_small(
+        self, client: AsyncClient, auth_headers, test_project, old_tasks
+    ):
+        since = (await self.sync(client, auth_headers, test_project.id)).json()["cursor"]
+
+        for task in old_tasks[:2]:
+            await client.patch(
+                task_url(test_project.id, task.id) + "/status",
+                json={"status": "done"},
+                headers=auth_headers,
+            )
+        await client.delete(task_url(test_project.id, old_tasks[2].id), headers=auth_headers)
+
+        response = await self.sync(client, auth_headers, test_project.id, since)
+        data = response.json()
+        assert [t["id"] for t in data["tasks"]] == [t.id for t in old_tasks[:2]]
+        assert all(t["status"] == "done" for t in data["tasks"])
+        assert [d["id"] for d in data["deleted"]] == [old_tasks[2].id]
+        assert data["has_more"] is False
+        # 200개 보드의 변경 3건이 목록 전체가 아니라 수백 바이트로 전달된다
+        assert len(response.content) < 1500
+
+    @pytest.mark.asyncio
+    async def test_project_delete_leaves_no_tombstones(
+        self, client: AsyncClient, auth_headers, db_session, test_project, old_tasks
+    ):
+        from sqlalchemy import func, select
+
+        from app.models.task import TaskTombstone
+        from app.services.project_deletion import purge_project_deletion_step
+
+        response = await client.delete(f"/api/v1/projects/{test_project.id}", headers=auth_headers)
+        while await purge_project_deletion_step(db_session, response.json()["id"]):
+            pass
+        count = await db_session.scalar(select(func.count()).select_from(TaskTombstone))
+        assert count == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_and_expired_cursor(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        from datetime import datetime, timedelta
+
+        from app.services.task import encode_cursor
+
+        response = await client.get(
+            self.changes_url(test_project.id), params={"since": "bogus"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+
+        expired = encode_cursor({"t": (datetime.now() - timedelta(days=90)).isoformat(), "id": 0})
+        response = await client.get(
+            self.changes_url(test_project.id), params={"since": expired}, headers=auth_headers
+        )
+        assert response.status_code == 410
+
+    @pytest.mark.asyncio
+    async def test_non_member_forbidden(
+        self, client: AsyncClient, other_auth_headers, test_project
+    ):
+        response = await client.get(self.changes_url(test_project.id), headers=other_auth_headers)
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_purge_expired_tombstones(self, db_session, test_project):
+        from datetime import datetime, timedelta
+
+        from sqlalchemy import select
+
+        from app.models.task import TaskTombstone
+        from app.services.task import purge_task_tombstones
+
+        db_session.add_all(
+            [
+                TaskTombstone(
+                    task_id=-1,
+                    project_id=test_project.id,
+                    deleted_at=datetime.now() - timedelta(days=90),
+                ),
+                TaskTombstone(task_id=-2, project_id=test_project.id),
+            ]
+        )
+        await db_session.flush()
+
+        assert await purge_task_tombstones(db_session) == 1
+        remaining = await db_session.scalars(select(TaskTombstone.task_id))
+        assert list(remaining) == [-2]
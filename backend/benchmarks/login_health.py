@@ -0,0 +1,110 @@
+"""
+동시 로그인 중 /api/v1/health 응답 지연 측정
+
+로그인 N건을 동시에 실행하면서 같은 이벤트 루프에서 health 엔드포인트를
+반복 호출하고 p50/p99 지연을 출력한다. ``--blocking`` 옵션은 bcrypt를
+이벤트 루프에서 직접 실행하던 이전 동작과 비교하기 위한 기준선이다.
+
+    python -m benchmarks.login_health [--logins 50] [--blocking]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+
+from app.core.database import async_session
+from app.core.security import verify_password
+from app.main import app
+from app.models.user import User
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def poll_health(client: AsyncClient, stop: asyncio.Event, latencies: list[float]) -> None:
+    """고정 간격으로 호출하고, 예정 시각 기준으로 지연을 잰다 (루프 정지 시간 포함)"""
+    interval = 0.01
+    scheduled = time.perf_counter()
+    while not stop.is_set():
+        response = await client.get("/api/v1/health")
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+        assert response.status_code == 200
+        scheduled += interval
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+
+
+async def run(logins: int, blocking: bool) -> None:
+    if blocking:
+        import app.services.user as user_service
+
+        async def verify_on_loop(plain_password: str, hashed_password: str) -> bool:
+            return verify_password(plain_password, hashed_password)
+
+        user_service.verify_password_async = verify_on_loop
+
+    email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+    password = "bench-password"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={"email": email, "password": password, "name": "Benchmark"},
+        )
+        response.raise_for_status()
+
+        try:
+            stop = asyncio.Event()
+            latencies: list[float] = []
+            poller = asyncio.create_task(poll_health(client, stop, latencies))
+            await asyncio.sleep(0.1)
+
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(
+                    client.post(
+                        "/api/v1/auth/login",
+                        json={"email": email, "password": password},
+                    )
+                    for _ in range(logins)
+                )
+            )
+            elapsed = time.perf_counter() - start
+
+            stop.set()
+            await poller
+        finally:
+            async with async_session() as session:
+                await session.execute(delete(User).where(User.email == email))
+                await session.commit()
+
+    codes: dict[int, int] = {}
+    for result in results:
+        codes[result.status_code] = codes.get(result.status_code, 0) + 1
+
+    mode = "blocking (event loop)" if blocking else "thread pool"
+    print(f"mode:            {mode}")
+    print(f"logins:          {logins} in {elapsed:.2f}s  status={codes}")
+    print(f"health samples:  {len(latencies)}")
+    print(f"health p50:      {statistics.median(latencies):.1f} ms")
+    print(f"health p99:      {percentile(latencies, 99):.1f} ms")
+    print(f"health max:      {max(latencies):.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--blocking", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.blocking))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+동시 보드 조회 합치기 (single-flight) 전후 DB 쿼리 수
+
+멤버 N명이 있는 프로젝트(태스크 M개)를 만들고, 스탠드업 직후처럼 멤버 전원이 같은
+칸반 보드를 동시에 여는 요청을 READ_COALESCING_ENABLED를 끄고/켜고 보낸다.
+burst마다 실행된 전체 SQL 문 수, tasks를 읽은 문 수, 요청 지연 p50/max를 출력한다.
+
+    python -m benchmarks.read_coalescing [--members 30] [--tasks 500] [--bursts 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, event, insert
+
+from app.core.cache import coalesced_reads
+from app.core.config import settings
+from app.core.database import async_session, engine
+from app.core.security import create_access_token, hash_password
+from app.main import app
+from app.models.project import Project, ProjectMember, ProjectRole
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User
+
+
+async def seed(members: int, tasks: int) -> tuple[list[int], int]:
+    """멤버 + 프로젝트 + 태스크 생성 (user_ids, project_id), 첫 사용자가 owner"""
+    hashed_password = hash_password("bench-password")
+    async with async_session() as session:
+        users = [
+            User(
+                email=f"bench-{uuid.uuid4().hex[:12]}@example.com",
+                name=f"Benchmark {i}",
+                hashed_password=hashed_password,
+            )
+            for i in range(members)
+        ]
+        session.add_all(users)
+        await session.flush()
+        project = Project(name="Benchmark", owner_id=users[0].id)
+        session.add(project)
+        await session.flush()
+        session.add_all(
+            ProjectMember(
+                user_id=user.id,
+                project_id=project.id,
+                role=ProjectRole.owner if i == 0 else ProjectRole.member,
+            )
+            for i, user in enumerate(users)
+        )
+        await session.execute(
+            insert(Task),
+            [
+                {
+                    "title": f"벤치마크 태스크 {i}",
+                    "status": list(TaskStatus)[i % 3],
+                    "priority": list(TaskPriority)[i % 4],
+                    "project_id": project.id,
+                    "assignee_id": users[i % members].id,
+                }
+                for i in range(tasks)
+            ],
+        )
+        await session.commit()
+        return [user.id for user in users], project.id
+
+
+async def burst(client: AsyncClient, url: str, headers: list[dict]) -> list[float]:
+    async def fetch(member_headers: dict) -> float:
+        start = time.perf_counter()
+        response = await client.get(url, headers=member_headers)
+        response.raise_for_status()
+        return (time.perf_counter() - start) * 1000
+
+    return await asyncio.gather(*(fetch(member_headers) for member_headers in headers))
+
+
+async def run(members: int, tasks: int, bursts: int) -> None:
+    user_ids, project_id = await seed(members, tasks)
+    headers = [
+        {"Authorization": f"Bearer {create_access_token(data={'sub': str(user_id)})}"}
+        for user_id in user_ids
+    ]
+    url = f"/api/v1/projects/{project_id}/board"
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    enabled = settings.READ_COALESCING_ENABLED
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            # 사용자 principal 캐시를 채워 두고 보드 조회 쿼리만 비교한다
+            await burst(client, url, headers)
+            print(f"members={members} tasks={tasks} bursts={bursts} (burst당 평균)")
+            print(f"{'coalescing':<11} {'queries':>8} {'tasks':>6} {'p50 ms':>8} {'max ms':>8}")
+            for coalescing in (False, True):
+                settings.READ_COALESCING_ENABLED = coalescing
+                coalesced_reads.reset_stats()
+                statements.clear()
+                latencies: list[float] = []
+                for _ in range(bursts):
+                    latencies += await burst(client, url, headers)
+                task_queries = sum("FROM tasks" in statement for statement in statements)
+                print(
+                    f"{'on' if coalescing else 'off':<11} {len(statements) / bursts:>8.1f} "
+                    f"{task_queries / bursts:>6.1f} {statistics.median(latencies):>8.1f} "
+                    f"{max(latencies):>8.1f}"
+                )
+            stats = coalesced_reads.snapshot()
+            print(f"hits={stats['hits']} misses={stats['misses']} failures={stats['failures']}")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        settings.READ_COALESCING_ENABLED = enabled
+        async with async_session() as session:
+            await session.execute(delete(Project).where(Project.id == project_id))
+            await session.execute(delete(User).where(User.id.in_(user_ids)))
+            await session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=30)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--bursts", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.members, args.tasks, args.bursts))
+
+
+if __name__ == "__main__":
+    main()
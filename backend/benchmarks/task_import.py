@@ -0,0 +1,129 @@
+"""
+태스크 일괄 가져오기 처리량
+
+CSV/NDJSON 본문에 태스크 N행(담당자는 멤버 3명 중 하나)을 만들어
+POST /projects/{id}/tasks:import로 보내고 초당 처리 행 수를 출력한다.
+본문은 64KiB 조각으로 스트리밍한다.
+
+    python -m benchmarks.task_import [--rows 50000] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import statistics
+import time
+import uuid
+
+import orjson
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+
+from app.core.database import async_session
+from app.core.security import create_access_token, hash_password
+from app.main import app
+from app.models.project import Project, ProjectMember, ProjectRole
+from app.models.task import TaskPriority
+from app.models.user import User
+
+CHUNK_SIZE = 1 << 16
+
+
+async def seed() -> tuple[list[int], int]:
+    """멤버 3명 + 프로젝트 생성 (user_ids, project_id), 첫 사용자가 owner"""
+    async with async_session() as session:
+        users = [
+            User(
+                email=f"bench-{uuid.uuid4().hex[:12]}@example.com",
+                name=f"Benchmark {i}",
+                hashed_password=hash_password("bench-password"),
+            )
+            for i in range(3)
+        ]
+        session.add_all(users)
+        await session.flush()
+        project = Project(name="Benchmark", owner_id=users[0].id)
+        session.add(project)
+        await session.flush()
+        session.add_all(
+            ProjectMember(
+                user_id=user.id,
+                project_id=project.id,
+                role=ProjectRole.owner if i == 0 else ProjectRole.member,
+            )
+            for i, user in enumerate(users)
+        )
+        await session.commit()
+        return [user.id for user in users], project.id
+
+
+def build_body(import_format: str, rows: int, user_ids: list[int]) -> bytes:
+    records = [
+        {
+            "title": f"가져온 태스크 {i}",
+            "description": "이전 도구에서 옮긴 설명 " * 4,
+            "priority": list(TaskPriority)[i % 4].value,
+            "assignee_id": user_ids[i % 3],
+        }
+        for i in range(rows)
+    ]
+    if import_format == "ndjson":
+        return b"\n".join(orjson.dumps(record) for record in records)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(records[0]))
+    writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue().encode("utf-8")
+
+
+async def stream(body: bytes):
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start : start + CHUNK_SIZE]
+
+
+async def run(rows: int, rounds: int) -> None:
+    user_ids, project_id = await seed()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user_ids[0])})}"}
+    url = f"/api/v1/projects/{project_id}/tasks:import"
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench", timeout=None
+        ) as client:
+            print(f"rows={rows} rounds={rounds} (median)")
+            print(f"{'format':<7} {'bytes':>11} {'seconds':>8} {'rows/s':>10}")
+            for import_format in ("csv", "ndjson"):
+                body = build_body(import_format, rows, user_ids)
+                elapsed = []
+                for _ in range(rounds):
+                    start = time.perf_counter()
+                    response = await client.post(
+                        url,
+                        params={"format": import_format},
+                        content=stream(body),
+                        headers=headers,
+                    )
+                    elapsed.append(time.perf_counter() - start)
+                    response.raise_for_status()
+                    assert response.json()["imported"] == rows, response.text
+                seconds = statistics.median(elapsed)
+                print(
+                    f"{import_format:<7} {len(body):>11,} {seconds:>8.2f} {rows / seconds:>10,.0f}"
+                )
+    finally:
+        async with async_session() as session:
+            await session.execute(delete(Project).where(Project.id == project_id))
+            await session.execute(delete(User).where(User.id.in_(user_ids)))
+            await session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
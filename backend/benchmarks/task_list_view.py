@@ -0,0 +1,120 @@
+"""
+태스크 목록 full / view=card 응답 크기와 지연 비교
+
+설명이 긴 태스크 N개가 있는 프로젝트를 만들고 태스크 목록과 칸반 보드를 기본(full)과
+view=card로 번갈아 호출해 응답 크기와 p50/p99 지연을 출력한다. card는 카드에
+표시하는 컬럼만 SELECT하므로 description을 DB에서 읽지도, ORM 객체로 만들지도 않는다.
+
+    python -m benchmarks.task_list_view [--tasks 1000] [--description-length 2000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, insert
+
+from app.core.database import async_session
+from app.core.security import create_access_token, hash_password
+from app.main import app
+from app.models.project import Project, ProjectMember, ProjectRole
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def seed(tasks: int, description_length: int) -> tuple[int, int]:
+    """사용자 + 프로젝트 + 태스크 생성 (user_id, project_id)"""
+    async with async_session() as session:
+        user = User(
+            email=f"bench-{uuid.uuid4().hex[:12]}@example.com",
+            name="Benchmark",
+            hashed_password=hash_password("bench-password"),
+        )
+        session.add(user)
+        await session.flush()
+        project = Project(name="Benchmark", owner_id=user.id)
+        session.add(project)
+        await session.flush()
+        session.add(ProjectMember(user_id=user.id, project_id=project.id, role=ProjectRole.owner))
+        await session.execute(
+            insert(Task),
+            [
+                {
+                    "title": f"벤치마크 태스크 {i}",
+                    "description": "가" * description_length,
+                    "status": list(TaskStatus)[i % 3],
+                    "priority": list(TaskPriority)[i % 4],
+                    "project_id": project.id,
+                    "assignee_id": user.id if i % 2 else None,
+                }
+                for i in range(tasks)
+            ],
+        )
+        await session.commit()
+        return user.id, project.id
+
+
+async def measure(
+    client: AsyncClient, url: str, params: dict, headers: dict, rounds: int
+) -> tuple[int, list[float]]:
+    size = 0
+    latencies = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        response = await client.get(url, params=params, headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        size = len(response.content)
+    return size, latencies
+
+
+async def run(tasks: int, description_length: int, rounds: int) -> None:
+    user_id, project_id = await seed(tasks, description_length)
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user_id)})}"}
+    cases = [
+        ("list", f"/api/v1/projects/{project_id}/tasks", {"limit": 200}),
+        ("board", f"/api/v1/projects/{project_id}/board", {"limit": 50}),
+    ]
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            print(f"tasks={tasks} description={description_length} chars rounds={rounds}")
+            print(f"{'endpoint':<8} {'view':<5} {'bytes':>9} {'p50 ms':>8} {'p99 ms':>8}")
+            for name, url, params in cases:
+                # 워밍업 (연결, prepared statement 캐시)
+                await measure(client, url, params, headers, 3)
+                for view in ("full", "card"):
+                    size, latencies = await measure(
+                        client, url, {**params, "view": view}, headers, rounds
+                    )
+                    print(
+                        f"{name:<8} {view:<5} {size:>9} "
+                        f"{statistics.median(latencies):>8.1f} {percentile(latencies, 99):>8.1f}"
+                    )
+    finally:
+        async with async_session() as session:
+            await session.execute(delete(Project).where(Project.id == project_id))
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--description-length", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args.tasks, args.description_length, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
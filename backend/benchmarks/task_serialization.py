@@ -0,0 +1,142 @@
+"""
+태스크 목록 직렬화 경로 비교 (ORM + response_model vs 컬럼 행 + orjson)
+
+태스크 50,000개가 있는 프로젝트를 만들고 1k/10k/50k행마다 두 경로를 번갈아 실행해
+초당 처리 태스크 수를 출력한다.
+
+- orm: select(Task)로 ORM 객체를 만들고 FastAPI처럼 list[TaskResponse]로
+  from_attributes 검증 -> JSON 모드 dump -> JSONResponse 렌더링 (이전 목록 경로)
+- rows: 응답 컬럼만 SELECT한 행을 dict로 만들어 ORJSONResponse로 바로 렌더링 (현재 경로)
+
+total은 쿼리 포함, serialize는 DB에서 받은 뒤 응답 바이트까지의 시간 기준이다.
+
+    python -m benchmarks.task_serialization [--sizes 1000,10000,50000] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select
+
+from app.core.database import async_session
+from app.core.security import hash_password
+from app.models.project import Project, ProjectMember, ProjectRole
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User
+from app.schemas.task import TASK_FIELDS, TaskResponse
+from app.services.task import _task_dicts, _task_list_query
+
+task_list_adapter = TypeAdapter(list[TaskResponse])
+
+
+async def seed(tasks: int) -> tuple[int, int]:
+    """사용자 + 프로젝트 + 태스크 생성 (user_id, project_id)"""
+    async with async_session() as session:
+        user = User(
+            email=f"bench-{uuid.uuid4().hex[:12]}@example.com",
+            name="Benchmark",
+            hashed_password=hash_password("bench-password"),
+        )
+        session.add(user)
+        await session.flush()
+        project = Project(name="Benchmark", owner_id=user.id)
+        session.add(project)
+        await session.flush()
+        session.add(ProjectMember(user_id=user.id, project_id=project.id, role=ProjectRole.owner))
+        for start in range(0, tasks, 10_000):
+            await session.execute(
+                insert(Task),
+                [
+                    {
+                        "title": f"벤치마크 태스크 {i}",
+                        "description": "설명 " * 20,
+                        "status": list(TaskStatus)[i % 3],
+                        "priority": list(TaskPriority)[i % 4],
+                        "project_id": project.id,
+                        "assignee_id": user.id if i % 2 else None,
+                    }
+                    for i in range(start, min(start + 10_000, tasks))
+                ],
+            )
+        await session.commit()
+        return user.id, project.id
+
+
+async def orm_path(project_id: int, size: int) -> tuple[float, float]:
+    """ORM 객체 + response_model 검증 + JSONResponse (전체 초, 직렬화 초)"""
+    async with async_session() as session:
+        start = time.perf_counter()
+        result = await session.scalars(
+            select(Task)
+            .where(Task.project_id == project_id)
+            .order_by(Task.created_at.desc(), Task.id.desc())
+            .limit(size)
+        )
+        tasks = result.all()
+        fetched = time.perf_counter()
+        content = task_list_adapter.dump_python(
+            task_list_adapter.validate_python(tasks, from_attributes=True), mode="json"
+        )
+        body = JSONResponse(content).body
+        end = time.perf_counter()
+    assert len(tasks) == size and body
+    return end - start, end - fetched
+
+
+async def rows_path(project_id: int, size: int) -> tuple[float, float]:
+    """응답 컬럼 행 -> dict -> ORJSONResponse (전체 초, 직렬화 초)"""
+    async with async_session() as session:
+        start = time.perf_counter()
+        query = _task_list_query(project_id, None, None, None, "created_at", "desc")
+        rows = (await session.execute(query.limit(size))).all()
+        fetched = time.perf_counter()
+        body = ORJSONResponse(_task_dicts(rows, TASK_FIELDS)).body
+        end = time.perf_counter()
+    assert len(rows) == size and body
+    return end - start, end - fetched
+
+
+async def run(sizes: list[int], rounds: int) -> None:
+    user_id, project_id = await seed(max(sizes))
+    paths = {"orm": orm_path, "rows": rows_path}
+    try:
+        print(f"rounds={rounds} (median)")
+        print(
+            f"{'rows':>7} {'path':<5} {'total ms':>9} {'tasks/s':>10} "
+            f"{'serialize ms':>13} {'tasks/s':>10}"
+        )
+        for size in sizes:
+            # 워밍업 (연결, prepared statement 캐시)
+            for path in paths.values():
+                await path(project_id, size)
+            for name, path in paths.items():
+                samples = [await path(project_id, size) for _ in range(rounds)]
+                total = statistics.median(sample[0] for sample in samples)
+                serialize = statistics.median(sample[1] for sample in samples)
+                print(
+                    f"{size:>7} {name:<5} {total * 1000:>9.1f} {size / total:>10,.0f} "
+                    f"{serialize * 1000:>13.1f} {size / serialize:>10,.0f}"
+                )
+    finally:
+        async with async_session() as session:
+            await session.execute(delete(Project).where(Project.id == project_id))
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    asyncio.run(run(sizes, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
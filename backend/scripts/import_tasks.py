@@ -0,0 +1,75 @@
+"""
+CSV/NDJSON 파일의 태스크를 프로젝트로 일괄 가져오기 (다른 도구에서 이전할 때)
+
+API의 POST /projects/{id}/tasks:import와 같은 경로(청크 검증, 담당자 멤버십 확인,
+COPY 스테이징 후 한 번에 합치기)를 DB에 직접 연결해 실행한다. 전체가 한 트랜잭션이며
+--dry-run이면 검증만 하고 커밋하지 않는다. 건너뛴 행이 있으면 종료 코드 1.
+
+    python -m scripts.import_tasks PROJECT_ID FILE [--format csv|ndjson] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from fastapi import HTTPException
+
+from app.core.database import async_session
+from app.services.task_import import import_tasks
+
+READ_SIZE = 1 << 16
+FORMATS_BY_SUFFIX = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+async def read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(READ_SIZE):
+            yield chunk
+
+
+async def run(project_id: int, path: Path, import_format: str, dry_run: bool) -> int:
+    start = time.perf_counter()
+    async with async_session() as session:
+        try:
+            result = await import_tasks(
+                session, project_id, read_chunks(path), import_format, dry_run=dry_run
+            )
+        except HTTPException as exc:
+            print(f"import failed: {exc.detail}", file=sys.stderr)
+            return 2
+        if not dry_run:
+            await session.commit()
+    elapsed = time.perf_counter() - start
+
+    for error in result.errors:
+        field = f" {error.field}:" if error.field else ""
+        print(f"row {error.row}:{field} {error.message}")
+    if result.failed > len(result.errors):
+        print(f"... {result.failed - len(result.errors)} more row(s) with errors")
+    verb = "validated" if dry_run else "imported"
+    rate = (result.imported + result.failed) / elapsed if elapsed else 0
+    print(
+        f"{verb} {result.imported} task(s), skipped {result.failed} row(s) "
+        f"in {elapsed:.2f}s ({rate:,.0f} rows/s)"
+    )
+    return 1 if result.failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("project_id", type=int)
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--format", choices=["csv", "ndjson"], dest="import_format")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    import_format = args.import_format or FORMATS_BY_SUFFIX.get(args.file.suffix.lower())
+    if import_format is None:
+        parser.error("cannot infer format from file name, pass --format")
+    sys.exit(asyncio.run(run(args.project_id, args.file, import_format, args.dry_run)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+보관 기간(TASK_TOMBSTONE_RETENTION_DAYS)이 지난 태스크 삭제 기록 정리
+
+배치마다 커밋하므로 오래 잠그지 않는다. 이 기간보다 오래된 동기화 커서는
+410을 받고 전체 목록을 다시 받으므로 지워도 누락되는 클라이언트가 없다.
+
+    python -m scripts.purge_task_tombstones [--batch-size 10000]
+"""
+
+import argparse
+import asyncio
+
+from app.core.database import async_session
+from app.services.task import purge_task_tombstones
+
+
+async def run(batch_size: int) -> None:
+    total = 0
+    while True:
+        async with async_session() as session:
+            deleted = await purge_task_tombstones(session, batch_size)
+            await session.commit()
+        total += deleted
+        if deleted < batch_size:
+            break
+    print(f"purged {total} tombstone(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
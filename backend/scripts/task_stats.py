@@ -0,0 +1,51 @@
+"""
+프로젝트별 태스크 수 집계(project_task_stats) 점검/복구
+
+tasks를 처음부터 다시 세어 집계 행과 비교하고 어긋난 프로젝트를 출력한다.
+``--repair``를 주면 어긋난 행을 실제 값으로 고친다. 어긋남이 남아 있으면
+종료 코드 1 (모니터링/cron에서 사용).
+
+    python -m scripts.task_stats [--repair]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.core.database import async_session
+from app.services.task_stats import find_task_stats_drift, repair_task_stats
+
+
+async def run(repair: bool) -> int:
+    async with async_session() as session:
+        if repair:
+            drift = await repair_task_stats(session)
+            await session.commit()
+        else:
+            drift = await find_task_stats_drift(session)
+
+    for item in drift:
+        changes = ", ".join(
+            f"{name} {stored}->{actual}" for name, (stored, actual) in item.columns.items()
+        )
+        print(f"project {item.project_id}: {changes}")
+
+    if not drift:
+        print("no drift")
+        return 0
+    if repair:
+        print(f"repaired {len(drift)} project(s)")
+        return 0
+    print(f"{len(drift)} project(s) drifted (run with --repair to fix)")
+    return 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repair", action="store_true")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.repair)))
+
+
+if __name__ == "__main__":
+    main()
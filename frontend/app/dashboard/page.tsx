@@ -2,19 +2,14 @@
 
 import { useEffect, useState } from 'react';
 import Link from 'next/link';
-import { projectApi, taskApi, authApi } from '@/lib/api';
-import type { Project, Task, User } from '@/types/api';
+import { authApi, dashboardApi } from '@/lib/api';
+import type { Dashboard, User } from '@/types/api';
 import ProjectStatsCard from '@/components/dashboard/ProjectStatsCard';
 import AssignedTasksList from '@/components/dashboard/AssignedTasksList';
 
-interface ProjectWithTasks {
-  project: Project;
-  tasks: Task[];
-}
-
 export default function DashboardPage() {
   const [currentUser, setCurrentUser] = useState<User | null>(null);
-  const [projectsWithTasks, setProjectsWithTasks] = useState<ProjectWithTasks[]>([]);
+  const [dashboard, setDashboard] = useState<Dashboard | null>(null);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -27,22 +22,13 @@ export default function DashboardPage() {
       setIsLoading(true);
       setError(null);
 
-      // 현재 사용자 정보 가져오기
-      const user = await authApi.me();
+      // 사용자 정보 + 대시보드 집계 (프로젝트 수와 무관하게 요청 2개)
+      const [user, dashboardData] = await Promise.all([
+        authApi.me(),
+        dashboardApi.get(),
+      ]);
       setCurrentUser(user);
-
-      // 프로젝트 목록 가져오기
-      const projects = await projectApi.list();
-
-      // 각 프로젝트의 태스크 가져오기
-      const projectsData = await Promise.all(
-        projects.map(async (project) => {
-          const tasks = await taskApi.list(project.id);
-          return { project, tasks };
-        })
-      );
-
-      setProjectsWithTasks(projectsData);
+      setDashboard(dashboardData);
     } catch (err) {
       console.error('Failed to fetch dashboard data:', err);
       setError('대시보드 데이터를 불러오는데 실패했습니다.');
@@ -51,30 +37,9 @@ export default function DashboardPage() {
     }
   };
 
-  // 내게 배정된 태스크 필터링
-  const assignedTasks = projectsWithTasks.flatMap(({ project, tasks }) =>
-    tasks
-      .filter((task) => task.assignee_id === currentUser?.id)
-      .map((task) => ({
-        ...task,
-        projectId: project.id,
-        projectName: project.name,
-      }))
-  );
-
-  // 전체 통계
-  const totalTasks = projectsWithTasks.reduce(
-    (sum, { tasks }) => sum + tasks.length,
-    0
-  );
-  const completedTasks = projectsWithTasks.reduce(
-    (sum, { tasks }) => sum + tasks.filter((t) => t.status === 'done').length,
-    0
-  );
-  const inProgressTasks = projectsWithTasks.reduce(
-    (sum, { tasks }) => sum + tasks.filter((t) => t.status === 'in_progress').length,
-    0
-  );
+  const projects = dashboard?.projects ?? [];
+  const assignedTasks = dashboard?.assigned_tasks ?? [];
+  const totals = dashboard?.totals;
 
   if (isLoading) {
     return (
@@ -122,20 +87,20 @@ export default function DashboardPage() {
           <div className="bg-white rounded-lg shadow-sm p-6 border border-gray-200">
             <div className="text-sm text-gray-600 mb-1">프로젝트</div>
             <div className="text-3xl font-bold text-gray-900">
-              {projectsWithTasks.length}
+              {totals?.project_count ?? 0}
             </div>
           </div>
           <div className="bg-white rounded-lg shadow-sm p-6 border border-gray-200">
             <div className="text-sm text-gray-600 mb-1">전체 태스크</div>
-            <div className="text-3xl font-bold text-gray-900">{totalTasks}</div>
+            <div className="text-3xl font-bold text-gray-900">{totals?.total_count ?? 0}</div>
           </div>
           <div className="bg-white rounded-lg shadow-sm p-6 border border-gray-200">
             <div className="text-sm text-gray-600 mb-1">진행 중</div>
-            <div className="text-3xl font-bold text-blue-600">{inProgressTasks}</div>
+            <div className="text-3xl font-bold text-blue-600">{totals?.in_progress_count ?? 0}</div>
           </div>
           <div className="bg-white rounded-lg shadow-sm p-6 border border-gray-200">
             <div className="text-sm text-gray-600 mb-1">완료</div>
-            <div className="text-3xl font-bold text-green-600">{completedTasks}</div>
+            <div className="text-3xl font-bold text-green-600">{totals?.done_count ?? 0}</div>
           </div>
         </div>
 
@@ -143,7 +108,7 @@ export default function DashboardPage() {
         {assignedTasks.length > 0 && (
           <div className="mb-8">
             <h2 className="text-2xl font-bold text-gray-900 mb-4">
-              내게 배정된 태스크 ({assignedTasks.length})
+              내게 배정된 태스크 ({totals?.assigned_open_count ?? 0})
             </h2>
             <AssignedTasksList tasks={assignedTasks} />
           </div>
@@ -154,7 +119,7 @@ export default function DashboardPage() {
           <h2 className="text-2xl font-bold text-gray-900 mb-4">
             프로젝트 현황
           </h2>
-          {projectsWithTasks.length === 0 ? (
+          {projects.length === 0 ? (
             <div className="bg-white rounded-lg shadow-sm p-8 text-center border border-gray-200">
               <p className="text-gray-500 mb-4">아직 프로젝트가 없습니다.</p>
               <Link
@@ -166,12 +131,8 @@ export default function DashboardPage() {
             </div>
           ) : (
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-              {projectsWithTasks.map(({ project, tasks }) => (
-                <ProjectStatsCard
-                  key={project.id}
-                  project={project}
-                  tasks={tasks}
-                />
+              {projects.map((project) => (
+                <ProjectStatsCard key={project.id} project={project} />
               ))}
             </div>
           )}
@@ -4,11 +4,11 @@ import { useEffect, useState } from 'react';
 import { useRouter } from 'next/navigation';
 import Link from 'next/link';
 import { projectApi } from '@/lib/api';
-import type { Project } from '@/types/api';
+import type { ProjectListItem } from '@/types/api';
 
 export default function ProjectsPage() {
   const router = useRouter();
-  const [projects, setProjects] = useState<Project[]>([]);
+  const [projects, setProjects] = useState<ProjectListItem[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [showCreateModal, setShowCreateModal] = useState(false);
@@ -42,7 +42,7 @@ export default function ProjectsPage() {
         name: newProjectName,
         description: newProjectDescription,
       });
-      setProjects([...projects, newProject]);
+      setProjects([...projects, { ...newProject, task_stats: null }]);
       setShowCreateModal(false);
       setNewProjectName('');
       setNewProjectDescription('');
@@ -106,6 +106,24 @@ export default function ProjectsPage() {
                 <p className="text-gray-600 text-sm mb-4 line-clamp-2">
                   {project.description || '설명 없음'}
                 </p>
+                {project.task_stats && project.task_stats.total_count > 0 && (
+                  <div className="mb-4">
+                    <div className="flex justify-between text-xs text-gray-500 mb-1">
+                      <span>
+                        완료 {project.task_stats.done_count} / {project.task_stats.total_count}
+                      </span>
+                      <span>진행 중 {project.task_stats.in_progress_count}</span>
+                    </div>
+                    <div className="h-1.5 bg-gray-100 rounded-full overflow-hidden">
+                      <div
+                        className="h-full bg-green-500"
+                        style={{
+                          width: `${(project.task_stats.done_count / project.task_stats.total_count) * 100}%`,
+                        }}
+                      />
+                    </div>
+                  </div>
+                )}
                 <p className="text-xs text-gray-400">
                   생성일: {new Date(project.created_at).toLocaleDateString('ko-KR')}
                 </p>
@@ -1,8 +1,8 @@
 import Link from 'next/link';
-import type { Task, TaskPriority, TaskStatus } from '@/types/api';
+import type { DashboardAssignedTask, TaskPriority, TaskStatus } from '@/types/api';
 
 interface AssignedTasksListProps {
-  tasks: Array<Task & { projectId: number; projectName: string }>;
+  tasks: DashboardAssignedTask[];
 }
 
 const PRIORITY_CONFIG: Record<
@@ -40,7 +40,7 @@ export default function AssignedTasksList({ tasks }: AssignedTasksListProps) {
           return (
             <Link
               key={task.id}
-              href={`/projects/${task.projectId}`}
+              href={`/projects/${task.project_id}`}
               className="block p-4 hover:bg-gray-50 transition-colors"
             >
               <div className="flex items-start justify-between">
@@ -60,7 +60,7 @@ export default function AssignedTasksList({ tasks }: AssignedTasksListProps) {
                   {/* 프로젝트 & 상태 & 우선순위 */}
                   <div className="flex items-center gap-2 flex-wrap">
                     <span className="text-xs text-gray-500">
-                      📁 {task.projectName}
+                      📁 {task.project_name}
                     </span>
                     <span className={`text-xs font-medium ${statusConfig.color}`}>
                       • {statusConfig.label}
@@ -1,17 +1,18 @@
 import Link from 'next/link';
-import type { Project, Task } from '@/types/api';
+import type { DashboardProjectStats } from '@/types/api';
 import ProgressBar from './ProgressBar';
 
 interface ProjectStatsCardProps {
-  project: Project;
-  tasks: Task[];
+  project: DashboardProjectStats;
 }
 
-export default function ProjectStatsCard({ project, tasks }: ProjectStatsCardProps) {
-  const todoCount = tasks.filter((t) => t.status === 'todo').length;
-  const inProgressCount = tasks.filter((t) => t.status === 'in_progress').length;
-  const doneCount = tasks.filter((t) => t.status === 'done').length;
-  const totalCount = tasks.length;
+export default function ProjectStatsCard({ project }: ProjectStatsCardProps) {
+  const {
+    todo_count: todoCount,
+    in_progress_count: inProgressCount,
+    done_count: doneCount,
+    total_count: totalCount,
+  } = project;
 
   return (
     <Link
@@ -31,7 +32,7 @@ export default function ProjectStatsCard({ project, tasks }: ProjectStatsCardPro
         <ProgressBar total={totalCount} completed={doneCount} showLabel={false} />
         <p className="text-xs text-gray-600 mt-1">
           {doneCount}/{totalCount} 완료 (
-          {totalCount === 0 ? 0 : Math.round((doneCount / totalCount) * 100)}%)
+          {Math.round(project.completion_ratio * 100)}%)
         </p>
       </div>
 
@@ -1,7 +1,7 @@
 'use client';
 
 import { useState, useEffect, useCallback } from 'react';
-import type { Task, TaskStatus } from '@/types/api';
+import type { TaskBoardColumn, TaskStatus } from '@/types/api';
 import { taskApi } from '@/lib/api';
 import KanbanColumn from './KanbanColumn';
 
@@ -11,6 +11,9 @@ interface KanbanBoardProps {
   onCreateTask: (status: TaskStatus) => void;
 }
 
+// 컬럼별로 처음 불러오는/더 불러오는 카드 수
+const COLUMN_PAGE_SIZE = 20;
+
 const COLUMNS: { status: TaskStatus; title: string }[] = [
   { status: 'todo', title: 'Todo' },
   { status: 'in_progress', title: 'In Progress' },
@@ -22,15 +25,15 @@ export default function KanbanBoard({
   onTaskClick,
   onCreateTask,
 }: KanbanBoardProps) {
-  const [tasks, setTasks] = useState<Task[]>([]);
+  const [columns, setColumns] = useState<TaskBoardColumn[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [draggedTaskId, setDraggedTaskId] = useState<number | null>(null);
 
-  const fetchTasks = useCallback(async () => {
+  const fetchBoard = useCallback(async () => {
     try {
       setIsLoading(true);
-      const data = await taskApi.list(projectId);
-      setTasks(data);
+      const data = await taskApi.board(projectId, { limit: COLUMN_PAGE_SIZE });
+      setColumns(data.columns);
     } catch (err) {
       console.error('Failed to fetch tasks:', err);
       alert('태스크 목록을 불러오는데 실패했습니다.');
@@ -40,8 +43,32 @@ export default function KanbanBoard({
   }, [projectId]);
 
   useEffect(() => {
-    fetchTasks();
-  }, [fetchTasks]);
+    fetchBoard();
+  }, [fetchBoard]);
+
+  // 컬럼 커서로 해당 상태의 다음 카드들을 이어서 불러온다
+  const handleLoadMore = async (status: TaskStatus) => {
+    const column = columns.find((c) => c.status === status);
+    if (!column?.next_cursor) return;
+
+    try {
+      const page = await taskApi.listPage(projectId, {
+        status,
+        limit: COLUMN_PAGE_SIZE,
+        cursor: column.next_cursor,
+      });
+      setColumns((prev) =>
+        prev.map((c) =>
+          c.status === status
+            ? { ...c, tasks: [...c.tasks, ...page.tasks], next_cursor: page.next_cursor }
+            : c
+        )
+      );
+    } catch (err) {
+      console.error('Failed to load more tasks:', err);
+      alert('태스크 목록을 불러오는데 실패했습니다.');
+    }
+  };
 
   const handleDragStart = (e: React.DragEvent, taskId: number) => {
     setDraggedTaskId(taskId);
@@ -53,40 +80,84 @@ export default function KanbanBoard({
     e.dataTransfer.dropEffect = 'move';
   };
 
-  const handleDrop = async (e: React.DragEvent, newStatus: TaskStatus) => {
+  // beforeTaskId 카드 바로 앞에 놓는다 (없으면 컬럼 맨 앞)
+  const handleDrop = async (
+    e: React.DragEvent,
+    newStatus: TaskStatus,
+    beforeTaskId: number | null = null
+  ) => {
     e.preventDefault();
 
     if (!draggedTaskId) return;
 
-    const task = tasks.find((t) => t.id === draggedTaskId);
-    if (!task || task.status === newStatus) {
+    const task = columns
+      .flatMap((c) => c.tasks)
+      .find((t) => t.id === draggedTaskId);
+    if (!task || task.id === beforeTaskId) {
+      setDraggedTaskId(null);
+      return;
+    }
+
+    // 끌어온 카드를 뺀 대상 컬럼에서 삽입 위치와 이웃 카드를 구한다
+    const target = (getColumn(newStatus)?.tasks ?? []).filter((t) => t.id !== task.id);
+    const index =
+      beforeTaskId === null ? 0 : Math.max(target.findIndex((t) => t.id === beforeTaskId), 0);
+    const after = index > 0 ? target[index - 1] : null;
+    const before = target[index] ?? null;
+    const currentIndex = (getColumn(task.status)?.tasks ?? []).findIndex((t) => t.id === task.id);
+    if (task.status === newStatus && currentIndex === index) {
       setDraggedTaskId(null);
       return;
     }
 
     // 낙관적 업데이트 (즉시 UI 업데이트)
-    const previousTasks = [...tasks];
-    setTasks((prev) =>
-      prev.map((t) =>
-        t.id === draggedTaskId ? { ...t, status: newStatus } : t
-      )
+    const previousColumns = columns;
+    const moved = { ...task, status: newStatus };
+    setColumns((prev) =>
+      prev.map((c) => {
+        if (c.status === newStatus) {
+          return {
+            ...c,
+            count: c.status === task.status ? c.count : c.count + 1,
+            tasks: [...target.slice(0, index), moved, ...target.slice(index)],
+          };
+        }
+        if (c.status === task.status) {
+          return {
+            ...c,
+            count: c.count - 1,
+            tasks: c.tasks.filter((t) => t.id !== task.id),
+          };
+        }
+        return c;
+      })
     );
 
     try {
-      // 서버에 상태 변경 요청
-      await taskApi.updateStatus(projectId, draggedTaskId, { status: newStatus });
+      // 서버에는 이동한 카드 한 장의 위치만 요청
+      const updated = await taskApi.move(projectId, task.id, {
+        status: newStatus,
+        after_id: after?.id ?? null,
+        before_id: before?.id ?? null,
+      });
+      setColumns((prev) =>
+        prev.map((c) => ({
+          ...c,
+          tasks: c.tasks.map((t) => (t.id === updated.id ? updated : t)),
+        }))
+      );
     } catch (err) {
-      // 실패 시 롤백
-      console.error('Failed to update task status:', err);
-      setTasks(previousTasks);
-      alert('태스크 상태 변경에 실패했습니다.');
+      // 실패 시 롤백 (다른 사용자가 이웃 카드를 옮긴 경우 등)
+      console.error('Failed to move task:', err);
+      setColumns(previousColumns);
+      alert('태스크 이동에 실패했습니다.');
     } finally {
       setDraggedTaskId(null);
     }
   };
 
-  const getTasksByStatus = (status: TaskStatus) => {
-    return tasks.filter((task) => task.status === status);
+  const getColumn = (status: TaskStatus) => {
+    return columns.find((c) => c.status === status);
   };
 
   if (isLoading) {
@@ -104,7 +175,10 @@ export default function KanbanBoard({
           key={column.status}
           status={column.status}
           title={column.title}
-          tasks={getTasksByStatus(column.status)}
+          tasks={getColumn(column.status)?.tasks ?? []}
+          totalCount={getColumn(column.status)?.count ?? 0}
+          hasMore={Boolean(getColumn(column.status)?.next_cursor)}
+          onLoadMore={handleLoadMore}
           onDragOver={handleDragOver}
           onDrop={handleDrop}
           onDragStart={handleDragStart}
@@ -7,8 +7,11 @@ interface KanbanColumnProps {
   status: TaskStatus;
   title: string;
   tasks: Task[];
+  totalCount: number;
+  hasMore: boolean;
+  onLoadMore: (status: TaskStatus) => void;
   onDragOver: (e: React.DragEvent) => void;
-  onDrop: (e: React.DragEvent, newStatus: TaskStatus) => void;
+  onDrop: (e: React.DragEvent, newStatus: TaskStatus, beforeTaskId?: number | null) => void;
   onDragStart: (e: React.DragEvent, taskId: number) => void;
   onTaskClick: (taskId: number) => void;
   onCreateTask: (status: TaskStatus) => void;
@@ -18,6 +21,9 @@ export default function KanbanColumn({
   status,
   title,
   tasks,
+  totalCount,
+  hasMore,
+  onLoadMore,
   onDragOver,
   onDrop,
   onDragStart,
@@ -31,7 +37,7 @@ export default function KanbanColumn({
         <h2 className="text-lg font-bold text-gray-700">
           {title}
           <span className="ml-2 text-sm font-normal text-gray-500">
-            ({tasks.length})
+            ({totalCount})
           </span>
         </h2>
       </div>
@@ -43,13 +49,25 @@ export default function KanbanColumn({
         className="flex-1 space-y-3 min-h-[200px]"
       >
         {tasks.map((task) => (
-          <TaskCard
+          // 카드 위에 놓으면 그 카드 앞으로 이동
+          <div
             key={task.id}
-            task={task}
-            onDragStart={onDragStart}
-            onClick={onTaskClick}
-          />
+            onDrop={(e) => {
+              e.stopPropagation();
+              onDrop(e, status, task.id);
+            }}
+          >
+            <TaskCard task={task} onDragStart={onDragStart} onClick={onTaskClick} />
+          </div>
         ))}
+        {hasMore && (
+          <button
+            onClick={() => onLoadMore(status)}
+            className="w-full rounded-lg p-2 text-sm text-gray-500 hover:bg-gray-200 hover:text-gray-700 transition-colors"
+          >
+            더 보기 ({totalCount - tasks.length})
+          </button>
+        )}
       </div>
 
       {/* 새 태스크 추가 버튼 */}
@@ -38,7 +38,7 @@ export class ApiError extends Error {
 
 // ─── 핵심 fetch 래퍼 ───────────────────────────────────
 
-async function request<T>(path: string, options: RequestInit = {}): Promise<T> {
+async function send(path: string, options: RequestInit = {}): Promise<Response> {
   const url = `${API_BASE_URL}${path}`;
   const token = getToken();
 
@@ -53,16 +53,22 @@ async function request<T>(path: string, options: RequestInit = {}): Promise<T> {
 
   const response = await fetch(url, { ...options, headers });
 
-  // 204 No Content
-  if (response.status === 204) {
-    return undefined as T;
-  }
-
   if (!response.ok) {
     const body = await response.json().catch(() => ({}));
     throw new ApiError(response.status, body.detail ?? `API error: ${response.status}`, body);
   }
 
+  return response;
+}
+
+async function request<T>(path: string, options: RequestInit = {}): Promise<T> {
+  const response = await send(path, options);
+
+  // 204 No Content
+  if (response.status === 204) {
+    return undefined as T;
+  }
+
   return response.json() as Promise<T>;
 }
 
@@ -81,6 +87,15 @@ export const api = {
     return request<T>(path + buildQuery(params), { method: "GET" });
   },
 
+  // 본문과 함께 응답 헤더(X-Next-Cursor 등)가 필요한 GET
+  async getWithHeaders<T>(
+    path: string,
+    params?: Record<string, unknown>,
+  ): Promise<{ data: T; headers: Headers }> {
+    const response = await send(path + buildQuery(params), { method: "GET" });
+    return { data: (await response.json()) as T, headers: response.headers };
+  },
+
   post<T>(path: string, body?: unknown): Promise<T> {
     return request<T>(path, {
       method: "POST",
@@ -112,16 +127,28 @@ export const api = {
 import type {
   Comment,
   CommentCreate,
+  Dashboard,
   LoginResponse,
+  MyTaskPage,
+  MyTaskParams,
   Project,
   ProjectCreate,
+  ProjectDeletion,
   ProjectDetail,
+  ProjectListItem,
   ProjectMember,
   ProjectMemberAdd,
   ProjectUpdate,
   Task,
+  TaskBoard,
+  TaskBoardParams,
+  TaskChanges,
   TaskCreate,
   TaskListParams,
+  TaskMove,
+  TaskPage,
+  TaskSearchParams,
+  TaskSearchResult,
   TaskStatusUpdate,
   TaskUpdate,
   User,
@@ -145,7 +172,7 @@ export const projectApi = {
   create(data: ProjectCreate): Promise<Project> {
     return api.post("/api/v1/projects/", data);
   },
-  list(): Promise<Project[]> {
+  list(): Promise<ProjectListItem[]> {
     return api.get("/api/v1/projects/");
   },
   get(projectId: number): Promise<ProjectDetail> {
@@ -154,9 +181,12 @@ export const projectApi = {
   update(projectId: number, data: ProjectUpdate): Promise<Project> {
     return api.put(`/api/v1/projects/${projectId}`, data);
   },
-  delete(projectId: number): Promise<void> {
+  delete(projectId: number): Promise<ProjectDeletion> {
     return api.delete(`/api/v1/projects/${projectId}`);
   },
+  deletion(projectId: number): Promise<ProjectDeletion> {
+    return api.get(`/api/v1/projects/${projectId}/deletion`);
+  },
   addMember(projectId: number, data: ProjectMemberAdd): Promise<ProjectMember> {
     return api.post(`/api/v1/projects/${projectId}/members`, data);
   },
@@ -170,6 +200,30 @@ export const taskApi = {
   list(projectId: number, params?: TaskListParams): Promise<Task[]> {
     return api.get(`/api/v1/projects/${projectId}/tasks`, params as Record<string, unknown>);
   },
+  async listPage(projectId: number, params: TaskListParams): Promise<TaskPage> {
+    const { data, headers } = await api.getWithHeaders<Task[]>(
+      `/api/v1/projects/${projectId}/tasks`,
+      params as Record<string, unknown>,
+    );
+    return { tasks: data, next_cursor: headers.get("X-Next-Cursor") };
+  },
+  async search(
+    projectId: number,
+    params: TaskSearchParams,
+  ): Promise<{ results: TaskSearchResult[]; next_cursor: string | null }> {
+    const { data, headers } = await api.getWithHeaders<TaskSearchResult[]>(
+      `/api/v1/projects/${projectId}/tasks/search`,
+      params as unknown as Record<string, unknown>,
+    );
+    return { results: data, next_cursor: headers.get("X-Next-Cursor") };
+  },
+  // since 이후 생성/수정/삭제된 태스크 (같은 변경이 다시 올 수 있으므로 id로 덮어쓴다)
+  changes(projectId: number, params?: { since?: string; limit?: number }): Promise<TaskChanges> {
+    return api.get(`/api/v1/projects/${projectId}/tasks/changes`, params);
+  },
+  board(projectId: number, params?: TaskBoardParams): Promise<TaskBoard> {
+    return api.get(`/api/v1/projects/${projectId}/board`, params as Record<string, unknown>);
+  },
   get(projectId: number, taskId: number): Promise<Task> {
     return api.get(`/api/v1/projects/${projectId}/tasks/${taskId}`);
   },
@@ -179,6 +233,9 @@ export const taskApi = {
   updateStatus(projectId: number, taskId: number, data: TaskStatusUpdate): Promise<Task> {
     return api.patch(`/api/v1/projects/${projectId}/tasks/${taskId}/status`, data);
   },
+  move(projectId: number, taskId: number, data: TaskMove): Promise<Task> {
+    return api.post(`/api/v1/projects/${projectId}/tasks/${taskId}/move`, data);
+  },
   delete(projectId: number, taskId: number): Promise<void> {
     return api.delete(`/api/v1/projects/${projectId}/tasks/${taskId}`);
   },
@@ -193,3 +250,17 @@ export const commentApi = {
     return api.get(`/api/v1/projects/${projectId}/tasks/${taskId}/comments`);
   },
 };
+
+// Dashboard
+export const dashboardApi = {
+  get(params?: { assigned_limit?: number }): Promise<Dashboard> {
+    return api.get("/api/v1/dashboard", params);
+  },
+};
+
+// Me
+export const meApi = {
+  tasks(params?: MyTaskParams): Promise<MyTaskPage> {
+    return api.get("/api/v1/me/tasks", params as Record<string, unknown>);
+  },
+};
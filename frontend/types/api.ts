@@ -35,6 +35,22 @@ export interface Project {
   created_at: string;
 }
 
+export interface ProjectTaskCounts {
+  todo_count: number;
+  in_progress_count: number;
+  done_count: number;
+  low_count: number;
+  medium_count: number;
+  high_count: number;
+  critical_count: number;
+  total_count: number;
+}
+
+// 프로젝트 목록 항목 (태스크 수 집계 포함)
+export interface ProjectListItem extends Project {
+  task_stats: ProjectTaskCounts | null;
+}
+
 export interface ProjectMember {
   id: number;
   user_id: number;
@@ -61,6 +77,19 @@ export interface ProjectMemberAdd {
   role?: ProjectRole;
 }
 
+// 프로젝트 삭제 진행 상황 (삭제는 백그라운드에서 배치로 진행)
+export interface ProjectDeletion {
+  id: number;
+  project_id: number;
+  status: "in_progress" | "completed";
+  requested_at: string;
+  finished_at: string | null;
+  comments_deleted: number;
+  tasks_deleted: number;
+  members_deleted: number;
+  tasks_remaining: number;
+}
+
 // ─── Task ───────────────────────────────────────────────
 
 export interface Task {
@@ -71,6 +100,8 @@ export interface Task {
   priority: TaskPriority;
   project_id: number;
   assignee_id: number | null;
+  // 컬럼 내 순서 키 (문자열 비교 순서가 카드 순서)
+  position: string;
   created_at: string;
   updated_at: string;
 }
@@ -94,6 +125,13 @@ export interface TaskStatusUpdate {
   status: TaskStatus;
 }
 
+// after_id/before_id가 모두 없으면 컬럼 맨 앞으로 이동
+export interface TaskMove {
+  status?: TaskStatus;
+  after_id?: number | null;
+  before_id?: number | null;
+}
+
 // ─── Comment ────────────────────────────────────────────
 
 export interface Comment {
@@ -108,12 +146,112 @@ export interface CommentCreate {
   content: string;
 }
 
+// ─── Dashboard ──────────────────────────────────────────
+
+export interface DashboardProjectStats extends Project {
+  todo_count: number;
+  in_progress_count: number;
+  done_count: number;
+  total_count: number;
+  completion_ratio: number;
+  assigned_open_count: number;
+}
+
+export interface DashboardAssignedTask extends Task {
+  project_name: string;
+}
+
+export interface DashboardTotals {
+  project_count: number;
+  todo_count: number;
+  in_progress_count: number;
+  done_count: number;
+  total_count: number;
+  assigned_open_count: number;
+}
+
+export interface Dashboard {
+  totals: DashboardTotals;
+  projects: DashboardProjectStats[];
+  assigned_tasks: DashboardAssignedTask[];
+}
+
 // ─── Task 필터/정렬 쿼리 파라미터 ──────────────────────
 
 export interface TaskListParams {
   status?: TaskStatus;
   priority?: TaskPriority;
   assignee_id?: number;
-  sort_by?: "created_at" | "updated_at" | "title" | "priority" | "status";
+  sort_by?: "created_at" | "updated_at" | "title" | "priority" | "status" | "position";
   sort_order?: "asc" | "desc";
+  limit?: number;
+  cursor?: string;
+  // 쉼표로 구분한 필드만 응답 (id는 항상 포함). view보다 우선
+  fields?: string;
+  // card: 카드 표시 필드만 (TaskCard)
+  view?: "full" | "card";
+}
+
+// view=card 응답의 태스크
+export type TaskCard = Pick<Task, "id" | "title" | "status" | "priority" | "assignee_id" | "position">;
+
+export interface TaskPage {
+  tasks: Task[];
+  next_cursor: string | null;
+}
+
+// ─── 태스크 검색 ───────────────────────────────────────
+
+export interface TaskSearchResult extends Task {
+  rank: number;
+  // 일치한 단어를 <mark>...</mark>로 감싼 텍스트 (나머지는 HTML 이스케이프되지 않음)
+  title_highlight: string;
+  description_highlight: string;
+}
+
+export interface TaskSearchParams {
+  q: string;
+  include_comments?: boolean;
+  limit?: number;
+  cursor?: string;
+}
+
+// ─── 칸반 보드 ─────────────────────────────────────────
+
+export type TaskBoardParams = Omit<TaskListParams, "status" | "cursor">;
+
+export interface TaskTombstone {
+  id: number;
+  deleted_at: string;
+}
+
+export interface TaskChanges {
+  tasks: Task[];
+  deleted: TaskTombstone[];
+  // 다음 요청의 since
+  cursor: string;
+  has_more: boolean;
+}
+
+export interface TaskBoardColumn {
+  status: TaskStatus;
+  count: number;
+  tasks: Task[];
+  // 같은 정렬 조건 + status로 taskApi.listPage에 넘기는 커서
+  next_cursor: string | null;
+}
+
+export interface TaskBoard {
+  columns: TaskBoardColumn[];
+}
+
+// ─── Me ─────────────────────────────────────────────────
+
+export type MyTaskParams = Omit<TaskListParams, "assignee_id">;
+
+export interface MyTaskPage {
+  tasks: Task[];
+  // 페이지에 나온 태스크들의 project_id -> 프로젝트 이름
+  projects: Record<number, string>;
+  next_cursor: string | null;
 }